@@ -288,7 +288,8 @@ import datetime
 import hashlib
 import base64
 import pickle
-import copy
+import threading
+import collections.abc
 import webbrowser
 import wx
 import wx.grid
@@ -311,6 +312,7 @@ ocn = oceanlyz.oceanlyz()
 class Global_Variable():
     #properties
     def __init__(self):
+        self.project_file = None #Project file that data is read from when data is first used
         self.oceanlyz_gui_ver = '1.2'
         self.oceanlyz_ver = '2.0'
         self.data = []
@@ -326,8 +328,132 @@ class Global_Variable():
         self.oceanlyz_dir_abspath = []
         self.CommercialKeyValid = False
 
+    #Read data of an opened project file, data is only read when it is first used
+    def LoadProjectData(self):
+        if self.project_file is not None:
+            from oceanlyz.ProjectReadFun import ProjectReadFun
+            FilePath, self.project_file = self.project_file, None
+            ocn.data = ProjectReadFun(FilePath, 'data', [])
+            self._data = np.asarray(ocn.data)
+            self._data_original = self._data #Not modified in place
+            self._data_modified = self._data.copy() #Modified in place in Tab2
+
+    @property
+    def data(self):
+        self.LoadProjectData()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self.LoadProjectData()
+        self._data = value
+
+    @property
+    def data_original(self):
+        self.LoadProjectData()
+        return self._data_original
+
+    @data_original.setter
+    def data_original(self, value):
+        self.LoadProjectData()
+        self._data_original = value
+
+    @property
+    def data_modified(self):
+        self.LoadProjectData()
+        return self._data_modified
+
+    @data_modified.setter
+    def data_modified(self, value):
+        self.LoadProjectData()
+        self._data_modified = value
+
 GlobalVar = Global_Variable()
 
+#--------------------------------------------------------------------------
+#Results of a project file
+class Project_Arrays(collections.abc.Mapping):
+    #Results are read from project file (ProjectReadFun) when they are first used, so a project opens without reading large results
+    #properties
+    def __init__(self, FilePath, names, values=None):
+        self.FilePath = FilePath
+        self.names = names #Names of results in project file (without 'wave.')
+        self.values = {} if values is None else values #Results that are already read
+
+    def __getitem__(self, name):
+        if name not in self.values:
+            if name not in self.names:
+                raise KeyError(name)
+            from oceanlyz.ProjectReadFun import ProjectReadFun
+            self.values[name] = ProjectReadFun(self.FilePath, 'wave.'+name, [])
+        return self.values[name]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    #Copy shares results that are read, results are not modified
+    def copy(self):
+        return Project_Arrays(self.FilePath, self.names, self.values)
+
+#--------------------------------------------------------------------------
+#Virtual table for spreadsheets
+class Array_Grid_Table(wx.grid.GridTableBase):
+    #Values are read from numpy arrays only when cells are displayed, so spreadsheet shows all rows of any size of data
+    #properties
+    def __init__(self, n_col):
+        wx.grid.GridTableBase.__init__(self)
+        self.columns = [np.zeros(0)]*n_col
+        self.col_labels = ['']*n_col
+        self.n_row = 0
+
+    def GetNumberRows(self):
+        return self.n_row
+
+    def GetNumberCols(self):
+        return len(self.columns)
+
+    def IsEmptyCell(self, row, col):
+        return row>=len(self.columns[col])
+
+    def GetValue(self, row, col):
+        if row<len(self.columns[col]):
+            return str(self.columns[col][row])
+        else:
+            return ''
+
+    def SetValue(self, row, col, value):
+        pass #Spreadsheet is read-only
+
+    def GetColLabelValue(self, col):
+        return self.col_labels[col]
+
+    def SetColLabelValue(self, col, label):
+        self.col_labels[col] = label
+
+    def Clear(self):
+        self.SetColumns([np.zeros(0)]*len(self.columns))
+
+    def SetColumns(self, columns):
+        #Display arrays in spreadsheet, each array is one column (arrays are not copied)
+        n_row_old = self.n_row
+        self.columns = [np.asarray(column) for column in columns]
+        self.n_row = max([len(column) for column in self.columns])
+
+        #Update number of rows of spreadsheet
+        grid = self.GetView()
+        if grid is not None:
+            grid.BeginBatch()
+            if self.n_row<n_row_old:
+                grid.ProcessTableMessage(wx.grid.GridTableMessage(self, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, self.n_row, n_row_old-self.n_row))
+            elif self.n_row>n_row_old:
+                grid.ProcessTableMessage(wx.grid.GridTableMessage(self, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED, self.n_row-n_row_old))
+            grid.ProcessTableMessage(wx.grid.GridTableMessage(self, wx.grid.GRIDTABLE_REQUEST_VIEW_GET_VALUES))
+            grid.EndBatch()
+            grid.ForceRefresh()
+
 #--------------------------------------------------------------------------
 #Get application absolute path
 
@@ -385,6 +511,7 @@ class Save_Load_Config():
 
 #Reset GlobalVar
 def ResetGlobalVar():
+    GlobalVar.project_file = None
     GlobalVar.oceanlyz_gui_ver = '1.2'
     GlobalVar.oceanlyz_ver = '2.0'
     GlobalVar.data = []
@@ -580,11 +707,10 @@ class MyNotebook_Tab1(wx.Panel):
         Tab1_vbox_hbox2 = wx.BoxSizer(wx.HORIZONTAL)
         Tab1_vbox.Add(Tab1_vbox_hbox2, 1, wx.ALL | wx.EXPAND, 5)
 
-        #Set up spreadsheet
-        grid_height = 1000
+        #Set up spreadsheet, values are read from numpy arrays when they are displayed
         grid_width = 1
         self.SpreadSheet_grid_tab1 = wx.grid.Grid(self, wx.ID_ANY, size=(1, 1))
-        self.SpreadSheet_grid_tab1.CreateGrid(grid_height, grid_width)
+        self.SpreadSheet_grid_tab1.SetTable(Array_Grid_Table(grid_width), True)
         self.SpreadSheet_grid_tab1.EnableEditing(0)
         self.SpreadSheet_grid_tab1.SetColLabelValue(0, "Data")
         Tab1_vbox_hbox2.Add(self.SpreadSheet_grid_tab1, 1, wx.ALL | wx.EXPAND, 0)
@@ -671,10 +797,14 @@ class MyNotebook_Tab1(wx.Panel):
             #Set first row to read (number of headerlines to skip)
             num_headerlines_to_skip = int(self.FirstRowtoRead_combo_box_tab1.GetValue())-1
 
+            #Set first column to read
+            first_col = int(self.FirstColumntoRead_combo_box_tab1.GetValue())
+
             try:
 
-                #Load data
-                GlobalVar.data = np.genfromtxt(FilePath, delimiter=delimiter, skip_header=num_headerlines_to_skip)
+                #Load data as a single column (parsed in parallel)
+                from oceanlyz.DataReadFun import DataReadFun
+                GlobalVar.data = DataReadFun(FilePath, delimiter, num_headerlines_to_skip, first_col, 0, 'off')
 
                 #Display file path
                 self.FilePath_text_tab1.SetValue(FilePath)
@@ -688,33 +818,12 @@ class MyNotebook_Tab1(wx.Panel):
                 MsgDialog.ShowModal()
                 return
 
-        #Set column to read
-        if self.FirstColumntoRead_combo_box_tab1.GetValue()!='1':
-            first_col_index = int(self.FirstColumntoRead_combo_box_tab1.GetValue())-1
-            if GlobalVar.data.ndim>1 and first_col_index<GlobalVar.data.shape[1]:
-                GlobalVar.data=GlobalVar.data[:,first_col_index:]
-
-        #Reshape data to a single column
-        if GlobalVar.data.ndim>1:
-            #GlobalVar.data = np.reshape(GlobalVar.data, -1, order='F')
-            data_1column = [] #Single column array
-            for i in range(GlobalVar.data.shape[1]):
-                data_1column = np.hstack((data_1column, GlobalVar.data[:,i]))
-            
-            GlobalVar.data = data_1column.copy()
-
         #Retain original data
         GlobalVar.data_original = GlobalVar.data.copy()
         GlobalVar.data_modified = GlobalVar.data.copy()
 
         #Display data in spreadsheet
-        grid_height = 1000
-        grid_width = 1
-        for row in range(grid_height): #Columns
-            if row<GlobalVar.data.size and row<(grid_height-1):
-                self.SpreadSheet_grid_tab1.SetCellValue(row,0,str(GlobalVar.data[row]))
-            else:
-                self.SpreadSheet_grid_tab1.SetCellValue(row,0,'...')
+        self.SpreadSheet_grid_tab1.GetTable().SetColumns([GlobalVar.data])
     
         #Plot data
         self.axes_tab1.cla()
@@ -800,11 +909,10 @@ class MyNotebook_Tab2(wx.Panel):
         Tab2_vbox_hbox3 = wx.BoxSizer(wx.HORIZONTAL)
         Tab2_vbox.Add(Tab2_vbox_hbox3, 1, wx.ALL | wx.EXPAND, 5)
 
-        #Set up spreadsheet
-        grid_height = 1000
+        #Set up spreadsheet, values are read from numpy arrays when they are displayed
         grid_width = 1
         self.SpreadSheet_grid_tab2 = wx.grid.Grid(self, wx.ID_ANY, size=(1, 1))
-        self.SpreadSheet_grid_tab2.CreateGrid(grid_height, grid_width)
+        self.SpreadSheet_grid_tab2.SetTable(Array_Grid_Table(grid_width), True)
         self.SpreadSheet_grid_tab2.EnableEditing(0)
         self.SpreadSheet_grid_tab2.SetColLabelValue(0, "Data")
         Tab2_vbox_hbox3.Add(self.SpreadSheet_grid_tab2, 1, wx.ALL | wx.EXPAND, 0)
@@ -892,13 +1000,7 @@ class MyNotebook_Tab2(wx.Panel):
         del wait
 
         #Display data in spreadsheet
-        grid_height = 1000
-        grid_width = 1
-        for row in range(grid_height): #Columns
-            if row<GlobalVar.data_modified.size and row<(grid_height-1):
-                self.SpreadSheet_grid_tab2.SetCellValue(row,0,str(GlobalVar.data_modified[row]))
-            else:
-                self.SpreadSheet_grid_tab2.SetCellValue(row,0,'...')
+        self.SpreadSheet_grid_tab2.GetTable().SetColumns([GlobalVar.data_modified])
     
         #Plot data
         self.axes_tab2.cla()
@@ -928,13 +1030,7 @@ class MyNotebook_Tab2(wx.Panel):
         del wait
 
         #Display data in spreadsheet
-        grid_height = 1000
-        grid_width = 1
-        for row in range(grid_height): #Columns
-            if row<GlobalVar.data_modified.size and row<(grid_height-1):
-                self.SpreadSheet_grid_tab2.SetCellValue(row,0,str(GlobalVar.data_modified[row]))
-            else:
-                self.SpreadSheet_grid_tab2.SetCellValue(row,0,'...')
+        self.SpreadSheet_grid_tab2.GetTable().SetColumns([GlobalVar.data_modified])
     
         #Plot data
         self.axes_tab2.cla()
@@ -965,13 +1061,7 @@ class MyNotebook_Tab2(wx.Panel):
         del wait
 
         #Display data in spreadsheet
-        grid_height = 1000
-        grid_width = 1
-        for row in range(grid_height): #Columns
-            if row<GlobalVar.data_modified.size and row<(grid_height-1):
-                self.SpreadSheet_grid_tab2.SetCellValue(row,0,str(GlobalVar.data_modified[row]))
-            else:
-                self.SpreadSheet_grid_tab2.SetCellValue(row,0,'...')
+        self.SpreadSheet_grid_tab2.GetTable().SetColumns([GlobalVar.data_modified])
     
         #Plot data
         self.axes_tab2.cla()
@@ -1180,6 +1270,11 @@ class MyNotebook_Tab3(wx.Panel):
         self.Bind(wx.EVT_BUTTON, self.OnStartAnalysis, self.StartAnalysis_button_tab3)
         # end wxGlade
 
+        #Timer to check cancel button of progress dialog, it only runs during analysis
+        self.ProgDialog = None
+        self.AnalysisTimer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnAnalysisTimer, self.AnalysisTimer)
+
     def OnStartAnalysis(self, event):  # wxGlade: MyNotebook_Tab3.<event_handler>
         #print("Event handler 'OnStartAnalysis' not implemented!")
         #event.Skip()
@@ -1220,26 +1315,29 @@ class MyNotebook_Tab3(wx.Panel):
         try:
 
             #Set up OCEANLYZ Input parameters
-            ocn.data = GlobalVar.data
-            ocn.InputType = self.InputType.GetStringSelection()
-            ocn.OutputType = self.OutputType.GetStringSelection()
-            ocn.AnalysisMethod = self.AnalysisMethod.GetStringSelection()
-            ocn.n_burst = int(float(self.n_burst.GetValue()))
-            ocn.burst_duration = int(float(self.burst_duration.GetValue()))
-            ocn.fs = int(float(self.fs.GetValue()))
-            ocn.fmin = float(self.fmin.GetValue())
-            ocn.fmax = float(self.fmax.GetValue())
-            ocn.fmaxpcorrCalcMethod = self.fmaxpcorrCalcMethod.GetStringSelection()
-            ocn.Kpafterfmaxpcorr = self.Kpafterfmaxpcorr.GetStringSelection()
-            ocn.fminpcorr = float(self.fminpcorr.GetValue())
-            ocn.fmaxpcorr = float(self.fmaxpcorr.GetValue())
-            ocn.heightfrombed = float(self.heightfrombed.GetValue())
-            ocn.dispout='no'
-            ocn.Rho = float(self.Rho.GetValue())
-            ocn.nfft = int(float(self.nfft.GetValue()))
-            ocn.SeparateSeaSwell = self.SeparateSeaSwell.GetStringSelection()
-            ocn.fmaxswell = float(self.fmaxswell.GetValue())
-            ocn.fpminswell = float(self.fpminswell.GetValue())
+            #Analysis runs on a copy of OCEANLYZ, results are swapped in when analysis is finished
+            ocn_run = oceanlyz.oceanlyz()
+            ocn_run.__dict__.update(ocn.__dict__)
+            ocn_run.data = GlobalVar.data
+            ocn_run.InputType = self.InputType.GetStringSelection()
+            ocn_run.OutputType = self.OutputType.GetStringSelection()
+            ocn_run.AnalysisMethod = self.AnalysisMethod.GetStringSelection()
+            ocn_run.n_burst = int(float(self.n_burst.GetValue()))
+            ocn_run.burst_duration = int(float(self.burst_duration.GetValue()))
+            ocn_run.fs = int(float(self.fs.GetValue()))
+            ocn_run.fmin = float(self.fmin.GetValue())
+            ocn_run.fmax = float(self.fmax.GetValue())
+            ocn_run.fmaxpcorrCalcMethod = self.fmaxpcorrCalcMethod.GetStringSelection()
+            ocn_run.Kpafterfmaxpcorr = self.Kpafterfmaxpcorr.GetStringSelection()
+            ocn_run.fminpcorr = float(self.fminpcorr.GetValue())
+            ocn_run.fmaxpcorr = float(self.fmaxpcorr.GetValue())
+            ocn_run.heightfrombed = float(self.heightfrombed.GetValue())
+            ocn_run.dispout='no'
+            ocn_run.Rho = float(self.Rho.GetValue())
+            ocn_run.nfft = int(float(self.nfft.GetValue()))
+            ocn_run.SeparateSeaSwell = self.SeparateSeaSwell.GetStringSelection()
+            ocn_run.fmaxswell = float(self.fmaxswell.GetValue())
+            ocn_run.fpminswell = float(self.fpminswell.GetValue())
 
             #Print inputs
             #print(ocn.InputType)
@@ -1261,49 +1359,82 @@ class MyNotebook_Tab3(wx.Panel):
             #print(ocn.fmaxswell)
             #print(ocn.fpminswell)
 
-            #Progress dialog
+            #Progress dialog, analysis can be cancelled after each burst
             #style = wx.PD_APP_MODAL | wx.PD_CAN_ABORT | wx.PD_CAN_SKIP | wx.PD_ELAPSED_TIME | wx.PD_ESTIMATED_TIME | wx.PD_REMAINING_TIME | wx.PD_AUTO_HIDE
-            #style = wx.PD_APP_MODAL | wx.PD_AUTO_HIDE
-            ProgDialog = wx.ProgressDialog("Information", "Analysis started. Please wait, this might take a while ...", maximum = 100, parent=self, style = wx.PD_APP_MODAL)
+            self.ProgDialog = wx.ProgressDialog("Information", "Analysis started. Please wait, this might take a while ...", maximum = 100, parent=self, style = wx.PD_APP_MODAL | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME | wx.PD_REMAINING_TIME)
+
+        except Exception as e:
             
-            #Update progress dialog
-            wx.MilliSleep(300)
-            ProgDialog.Update(35,'')
-            #ProgDialog.Pulse(newmsg='')
-            #wx.GetApp().Yield()        
-
-            #Run OCEANLYZ
-            #wait = wx.BusyInfo("Analysis started. Please wait, this might take a while ...")
-            ocn.runoceanlyz()
-            GlobalVar.wave = ocn.wave.copy()
-            ocn_keys = list(ocn.__dict__.keys())
-
-            #Update progress dialog
-            wx.MilliSleep(300)
-            ProgDialog.Update(100,'Analysis finished')
-            ProgDialog.Destroy()
-
-            #del wait
             #Message dialog
-            #MsgDialog=wx.MessageDialog(None, message='Analysis finished', caption='Information', style=wx.OK | wx.CENTRE)
-            #MsgDialog.ShowModal()
+            MsgDialog=wx.MessageDialog(None, message='There is an error in input data or parameters', caption='Error', style=wx.OK | wx.CENTRE)
+            MsgDialog.ShowModal()
+            return
+
+        #Run OCEANLYZ in a worker thread, so GUI is not frozen during analysis
+        #Progress of each burst is sent to GUI by wx.CallAfter
+        self.CancelAnalysis = threading.Event()
+        ocn_run.progress = self.OnAnalysisProgress
+
+        #Check cancel button of progress dialog
+        self.AnalysisTimer.Start(200)
 
+        AnalysisThread = threading.Thread(target=self.RunAnalysis, args=(ocn_run,), daemon=True)
+        AnalysisThread.start()
+
+    def RunAnalysis(self, ocn_run):
+        #Run OCEANLYZ in worker thread, GUI is only updated by wx.CallAfter
+
+        try:
+            ocn_run.runoceanlyz()
+            error = None
         except Exception as e:
-            
             #import traceback
             #traceback.print_exc()
-            #print(e)
-            
+            error = e
+
+        wx.CallAfter(self.OnAnalysisFinished, ocn_run, error)
+
+    def OnAnalysisProgress(self, n_completed, n_total):
+        #Called from worker thread after each burst, analysis is stopped if it returns False
+
+        wx.CallAfter(self.UpdateAnalysisProgress, n_completed, n_total)
+        return not self.CancelAnalysis.is_set()
+
+    def UpdateAnalysisProgress(self, n_completed, n_total):
+
+        #Update progress dialog, it is kept below 100 until analysis is finished
+        if (self.ProgDialog is not None) and (not self.CancelAnalysis.is_set()):
+            self.ProgDialog.Update(min(99, int(100*n_completed/n_total)), 'Burst {} out of {}'.format(n_completed, n_total))
+
+    def OnAnalysisTimer(self, event):
+
+        #Cancel analysis if cancel button of progress dialog is pressed
+        if (self.ProgDialog is not None) and (self.ProgDialog.WasCancelled()):
+            self.CancelAnalysis.set()
+            self.ProgDialog.Update(self.ProgDialog.GetValue(), 'Cancelling analysis after current burst ...')
+
+    def OnAnalysisFinished(self, ocn_run, error):
+        #Called in GUI thread when worker thread is finished
+
+        self.AnalysisTimer.Stop()
+        self.ProgDialog.Destroy()
+        self.ProgDialog = None
+
+        if error is not None:
+
             #Message dialog
-            MsgDialog=wx.MessageDialog(None, message='There is an error in input data or parameters', caption='Error', style=wx.OK | wx.CENTRE)
+            if self.CancelAnalysis.is_set():
+                MsgDialog=wx.MessageDialog(None, message='Analysis cancelled, previous results are kept', caption='Information', style=wx.OK | wx.CENTRE)
+            else:
+                MsgDialog=wx.MessageDialog(None, message='There is an error in input data or parameters', caption='Error', style=wx.OK | wx.CENTRE)
             MsgDialog.ShowModal()
-
-            #Update progress dialog
-            wx.MilliSleep(300)
-            ProgDialog.Update(100,'Analysis interrupted')
-            ProgDialog.Destroy()
             return
 
+        #Swap in properties and results of finished analysis
+        ocn_run.progress = None
+        ocn.__dict__.update(ocn_run.__dict__)
+        GlobalVar.wave = ocn.wave.copy()
+
         #Assign variable names for each module
         #module=1 -> Data: Waterlevel, Method: Spectral Analysis, Calculate: Wave Parameters
         if ocn.module==1:
@@ -1379,7 +1510,7 @@ class MyNotebook_Tab3(wx.Panel):
                 GlobalVar.wave_spectrum_header.append('Syy (m^2/Hz) - burst_'+str(i+1))
 
             GlobalVar.wave_spectrum = [] #Reset values
-            GlobalVar.wave_spectrum = np.concatenate((GlobalVar.wave_spectrum, GlobalVar.wave['f'][0,:]), axis=None)
+            GlobalVar.wave_spectrum = np.concatenate((GlobalVar.wave_spectrum, GlobalVar.wave['f']), axis=None)
             GlobalVar.wave_spectrum = np.vstack((GlobalVar.wave_spectrum, GlobalVar.wave['Syy']))
 
             #Transpose array to columnwise
@@ -1435,11 +1566,10 @@ class MyNotebook_Tab4(wx.Panel):
         Tab4_vbox_hbox2 = wx.BoxSizer(wx.HORIZONTAL)
         Tab4_vbox.Add(Tab4_vbox_hbox2, 1, wx.ALL | wx.EXPAND, 5)
 
-        #Set up spreadsheet
-        grid_height = 1000
+        #Set up spreadsheet, values are read from numpy arrays when they are displayed
         grid_width = 1
         self.SpreadSheet_grid_tab4 = wx.grid.Grid(self, wx.ID_ANY, size=(1, 1))
-        self.SpreadSheet_grid_tab4.CreateGrid(grid_height, grid_width)
+        self.SpreadSheet_grid_tab4.SetTable(Array_Grid_Table(grid_width), True)
         self.SpreadSheet_grid_tab4.EnableEditing(0)
         self.SpreadSheet_grid_tab4.SetColLabelValue(0, "Results")
         Tab4_vbox_hbox2.Add(self.SpreadSheet_grid_tab4, 1, wx.ALL | wx.EXPAND, 0)
@@ -1481,13 +1611,7 @@ class MyNotebook_Tab4(wx.Panel):
 
             #Display data in spreadsheet
             self.SpreadSheet_grid_tab4.SetColLabelValue(0, var_name)
-            grid_height = 1000
-            grid_width = 1
-            for row in range(grid_height): #Columns
-                if row<GlobalVar.wave[var_name].size and row<(grid_height-1):
-                    self.SpreadSheet_grid_tab4.SetCellValue(row,0,str(GlobalVar.wave[var_name][row]))
-                else:
-                    self.SpreadSheet_grid_tab4.SetCellValue(row,0,'...')
+            self.SpreadSheet_grid_tab4.GetTable().SetColumns([GlobalVar.wave[var_name]])
 
             #Plot data
             self.axes_tab4.cla()
@@ -1527,11 +1651,10 @@ class MyNotebook_Tab5(wx.Panel):
         Tab5_vbox_hbox2 = wx.BoxSizer(wx.HORIZONTAL)
         Tab5_vbox.Add(Tab5_vbox_hbox2, 1, wx.ALL | wx.EXPAND, 5)
 
-        #Set up spreadsheet
-        grid_height = 1000
+        #Set up spreadsheet, values are read from numpy arrays when they are displayed
         grid_width = 2
         self.SpreadSheet_grid_tab5 = wx.grid.Grid(self, wx.ID_ANY, size=(1, 1))
-        self.SpreadSheet_grid_tab5.CreateGrid(grid_height, grid_width)
+        self.SpreadSheet_grid_tab5.SetTable(Array_Grid_Table(grid_width), True)
         self.SpreadSheet_grid_tab5.EnableEditing(0)
         self.SpreadSheet_grid_tab5.SetColLabelValue(0, "f (Hz)")
         self.SpreadSheet_grid_tab5.SetColLabelValue(1, "Syy (m^2/Hz)")
@@ -1573,21 +1696,13 @@ class MyNotebook_Tab5(wx.Panel):
 
             #Display data in spreadsheet
             burst_num = int(self.BurstNumber_spin_ctrl_tab5.GetValue())-1
-            grid_height = 1000
-            grid_width = 2
-            for row in range(grid_height): #Columns
-                if row<(GlobalVar.wave['f'].T).shape[0] and row<(grid_height-1):
-                    self.SpreadSheet_grid_tab5.SetCellValue(row,0,str((GlobalVar.wave['f'].T)[row,burst_num]))
-                    self.SpreadSheet_grid_tab5.SetCellValue(row,1,str((GlobalVar.wave['Syy'].T)[row,burst_num]))
-                else:
-                    self.SpreadSheet_grid_tab5.SetCellValue(row,0,'...')
-                    self.SpreadSheet_grid_tab5.SetCellValue(row,1,'...')
+            self.SpreadSheet_grid_tab5.GetTable().SetColumns([GlobalVar.wave['f'], (GlobalVar.wave['Syy'].T)[:,burst_num]])
 
             #Plot data
             self.axes_tab5.cla()
             self.axes_tab5.set_xlabel('f (Hz)')
             self.axes_tab5.set_ylabel('Syy (m^2/Hz)')
-            self.axes_tab5.plot((GlobalVar.wave['f'].T)[:,burst_num],(GlobalVar.wave['Syy'].T)[:,burst_num])
+            self.axes_tab5.plot(GlobalVar.wave['f'],(GlobalVar.wave['Syy'].T)[:,burst_num])
             self.PlotCanvas_tab5.draw() #Redraw plot
 
         else:
@@ -1657,9 +1772,9 @@ class MyFrame(wx.Frame):
         # Menu Bar
         self.MainFrame_MenuBar = wx.MenuBar()
         self.fileMenu = wx.Menu()
-        self.fileMenu.Append(wx.ID_OPEN, "Open Results", "Open results from Python pickle file")
+        self.fileMenu.Append(wx.ID_OPEN, "Open Results", "Open results from OCEANLYZ project file")
         self.Bind(wx.EVT_MENU, self.OnOpenResults_Menu, id=wx.ID_OPEN)
-        self.fileMenu.Append(wx.ID_SAVE, "Save Results", "Save results to Python pickle file")
+        self.fileMenu.Append(wx.ID_SAVE, "Save Results", "Save results to OCEANLYZ project file")
         self.Bind(wx.EVT_MENU, self.OnSaveResults_Menu, id=wx.ID_SAVE)
         self.fileMenu.AppendSeparator()
         item = self.fileMenu.Append(wx.ID_ANY, "Export TimeSeries", "Export timeseries results to CSV file")
@@ -1690,9 +1805,9 @@ class MyFrame(wx.Frame):
 
         # Tool Bar
         self.MainFrame_ToolBar = wx.ToolBar(self, -1, style=wx.TB_DEFAULT_STYLE | wx.TB_FLAT | wx.TB_HORZ_TEXT)
-        tool = self.MainFrame_ToolBar.AddTool(wx.ID_ANY, "Open Results", wx.ArtProvider.GetBitmap(wx.ART_FILE_OPEN, wx.ART_TOOLBAR, (24, 24)), wx.NullBitmap, wx.ITEM_NORMAL, "Open results from Python pickle file", "")
+        tool = self.MainFrame_ToolBar.AddTool(wx.ID_ANY, "Open Results", wx.ArtProvider.GetBitmap(wx.ART_FILE_OPEN, wx.ART_TOOLBAR, (24, 24)), wx.NullBitmap, wx.ITEM_NORMAL, "Open results from OCEANLYZ project file", "")
         self.Bind(wx.EVT_TOOL, self.OnOpenResults_Menu, id=tool.GetId())
-        tool = self.MainFrame_ToolBar.AddTool(wx.ID_ANY, "Save Results", wx.ArtProvider.GetBitmap(wx.ART_FILE_SAVE, wx.ART_TOOLBAR, (24, 24)), wx.NullBitmap, wx.ITEM_NORMAL, "Save results to Python pickle file", "")
+        tool = self.MainFrame_ToolBar.AddTool(wx.ID_ANY, "Save Results", wx.ArtProvider.GetBitmap(wx.ART_FILE_SAVE, wx.ART_TOOLBAR, (24, 24)), wx.NullBitmap, wx.ITEM_NORMAL, "Save results to OCEANLYZ project file", "")
         self.Bind(wx.EVT_TOOL, self.OnSaveResults_Menu, id=tool.GetId())
         self.MainFrame_ToolBar.AddSeparator()
         tool = self.MainFrame_ToolBar.AddTool(wx.ID_ANY, "Export TimeSeries", wx.ArtProvider.GetBitmap(wx.ART_REPORT_VIEW, wx.ART_TOOLBAR, (24, 24)), wx.NullBitmap, wx.ITEM_NORMAL, "Export timeseries results to CSV file", "")
@@ -1736,7 +1851,7 @@ class MyFrame(wx.Frame):
             return
 
         #Open file
-        with wx.FileDialog(self, "Open results from Python pickle file", wildcard='Pickle files (*.pkl)|*.pkl',
+        with wx.FileDialog(self, "Open results from OCEANLYZ project file", wildcard='OCEANLYZ project files (*.ocnz)|*.ocnz|Pickle files (*.pkl)|*.pkl',
                         style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as fileDialog:
 
             if fileDialog.ShowModal() == wx.ID_CANCEL:
@@ -1750,8 +1865,28 @@ class MyFrame(wx.Frame):
 
             #Load results from file
             try:
-                with open(FilePath, 'rb') as file:
-                    ocn_imported = pickle.load(file)
+                if FileExtension=='.pkl':
+                    #Results saved as Python pickle file by earlier versions
+                    with open(FilePath, 'rb') as file:
+                        properties = pickle.load(file).__dict__
+
+                else:
+                    #Properties are read from text at start of project file, arrays are read from compressed chunks
+                    from oceanlyz.ProjectReadFun import ProjectReadFun
+
+                    properties = ProjectReadFun(FilePath, 'properties', [])
+                    array_names = ProjectReadFun(FilePath, 'arrays', [])
+
+                    #Results with one value for each burst are read now, large results (spectra, waterlevel, wave-by-wave) are read when they are first used
+                    properties['wave'] = Project_Arrays(FilePath, [name[5:] for name in array_names if name.startswith('wave.')])
+                    for name in properties['wave'].keys():
+                        if name not in ['Eta', 'Syy', 'Sxy', 'Burst_Data', 'H', 'T', 'Crest', 'Trough', 'Wave_Time']:
+                            properties['wave'][name]
+
+                    #Data is read when it is first used (GlobalVar.LoadProjectData)
+                    for name in array_names:
+                        if (name!='data') and (not name.startswith('wave.')):
+                            properties[name] = ProjectReadFun(FilePath, name, [])
 
             except:
                 #pass
@@ -1768,11 +1903,17 @@ class MyFrame(wx.Frame):
         #Reset OCEANLYZ
         ResetOCEANLYZ()
 
-        #Set data
-        ocn = copy.deepcopy(ocn_imported)
-        GlobalVar.data = ocn.data.copy()
-        GlobalVar.data_original = ocn.data.copy()
-        GlobalVar.data_modified = ocn.data.copy()
+        #Set properties and results to OCEANLYZ
+        for name, value in properties.items():
+            setattr(ocn, name, value)
+
+        #Set data, data of a project file is read when it is first used
+        if FileExtension=='.pkl':
+            GlobalVar.data = np.asarray(ocn.data)
+            GlobalVar.data_original = GlobalVar.data #Not modified in place
+            GlobalVar.data_modified = GlobalVar.data.copy() #Modified in place in Tab2
+        else:
+            GlobalVar.project_file = FilePath
         GlobalVar.wave = ocn.wave.copy()
 
         #Assign variable names for each module
@@ -1856,7 +1997,7 @@ class MyFrame(wx.Frame):
         #print("Event handler 'OnSaveResults_Menu' not implemented!")
         #event.Skip()
 
-        with wx.FileDialog(self, "Save results to Python pickle file", wildcard='Pickle files (*.pkl)|*.pkl',
+        with wx.FileDialog(self, "Save results to OCEANLYZ project file", wildcard='OCEANLYZ project files (*.ocnz)|*.ocnz',
                         style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as fileDialog:
 
             if fileDialog.ShowModal() == wx.ID_CANCEL:
@@ -1870,8 +2011,10 @@ class MyFrame(wx.Frame):
 
             #Save results to file
             try:
-                with open(FilePath, 'wb') as file:
-                    pickle.dump(ocn, file)
+                #Properties as text, data and results as compressed chunks
+                from oceanlyz.ProjectWriteFun import ProjectWriteFun
+                GlobalVar.LoadProjectData() #Data of an opened project file is read if it is not used yet
+                ProjectWriteFun(FilePath, ocn.__dict__, ocn.data, ocn.wave)
 
                 with open(FileRoot+'_config'+'.txt', 'w') as file:
                     file.write('#--------------------------------------\n')
@@ -1926,7 +2069,7 @@ class MyFrame(wx.Frame):
         #Check if there is timeseries results
         if ocn.module==1 or ocn.module==2 or ocn.module==5 or ocn.module==6 or ocn.module==7 or ocn.module==8:
 
-            with wx.FileDialog(self, "Export timeseries results to CSV file", wildcard='CSV files (*.csv)|*.csv',
+            with wx.FileDialog(self, "Export timeseries results to CSV or Parquet file", wildcard='CSV files (*.csv)|*.csv|Parquet files (*.parquet)|*.parquet',
                             style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as fileDialog:
 
                 if fileDialog.ShowModal() == wx.ID_CANCEL:
@@ -1940,8 +2083,24 @@ class MyFrame(wx.Frame):
 
                 #Save timeseries results to file
                 try:
-                    header=','.join(GlobalVar.wave_timeseries_header)
-                    np.savetxt(FilePath, GlobalVar.wave_timeseries, delimiter=',', header=header, comments='')
+                    if FileExtension=='.parquet':
+                        #Scalar results of each burst as columns of a Parquet table
+                        from oceanlyz.ParquetWriteFun import ParquetWriteFun
+
+                        if 'Burst_Start' in GlobalVar.wave:
+                            burst_time=GlobalVar.wave['Burst_Start']
+                        else:
+                            burst_time=np.arange(0,ocn.n_burst,1)*ocn.burst_duration #Time from start of data
+
+                        #ParquetWriteFun adds results to an existing file, replacing the file is already confirmed
+                        if os.path.isfile(FilePath):
+                            os.remove(FilePath)
+
+                        ParquetWriteFun(FilePath, GlobalVar.wave, burst_time, 0, 'off')
+
+                    else:
+                        header=','.join(GlobalVar.wave_timeseries_header)
+                        np.savetxt(FilePath, GlobalVar.wave_timeseries, delimiter=',', header=header, comments='')
 
                 except:
                     #pass
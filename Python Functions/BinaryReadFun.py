@@ -0,0 +1,112 @@
+def BinaryReadFun(FilePath,header,record,field,scale,offset):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    BinaryReadFun
+    =============
+
+    .. code:: python
+
+        data=BinaryReadFun(FilePath,header,record,field,scale,offset)
+
+    DESCRIPTION
+    -----------
+
+    | Load data from a binary logger file that has a header and fixed-size records
+    | File is mapped into memory (numpy.memmap) with a structured dtype, so records are not parsed
+    | Values of a field (e.g. pressure counts) are converted as data=counts*scale+offset (e.g. to N/m^2 for InputType='pressure')
+    | Bytes after the last complete record are ignored
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_python\\Sample_Data\\logger.bin'
+                                    Path of binary file
+    header=512
+                                    Size of file header in byte, records start after header
+    record={'names':['time','pressure'],'formats':['<u4','<i2'],'offsets':[0,4],'itemsize':8}
+                                    Structure of each record as a numpy dtype, or a dictionary of names, formats, offsets (byte), and itemsize (byte)
+                                        Byte order is set in formats, e.g. '<i2': little-endian int16, '>i4': big-endian int32
+    field='pressure'
+                                    Name of field to read
+                                        field=['p1','p2']: Several fields (channels) are read, data[i,:] is field i
+
+                                        Field with several values in each record (e.g. format '(4,)<i2') is read as several channels
+    scale=0.1
+                                    Scale that counts are multiplied by
+    offset=101325
+                                    Offset that is added to scaled counts
+
+    OUTPUT
+    ------
+
+    data
+                                    Scaled values of field in each record, with a shape of (n_record,) or (n_channel, n_record)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        record={'names':['time','pressure'],'formats':['<u4','<i2'],'offsets':[0,4],'itemsize':8}
+        data=BinaryReadFun('logger.bin',512,record,'pressure',0.1,101325)
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import os
+
+    #--------------------------------------------------------------------------
+    #Mapping records of file into memory
+
+    record=np.dtype(record)
+    n_record=(os.path.getsize(FilePath)-header)//record.itemsize #Number of complete records
+
+    records=np.memmap(FilePath,dtype=record,mode='r',offset=header,shape=(n_record,))
+
+    #--------------------------------------------------------------------------
+    #Converting counts of field(s)
+
+    if type(field) is str:
+        counts=records[field]
+        if counts.ndim>1:
+            counts=counts.T #Each value in record is a channel
+    else:
+        counts=np.stack([records[name] for name in field])
+
+    data=counts*np.float64(scale)+np.float64(offset)
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return data
+
+    #--------------------------------------------------------------------------
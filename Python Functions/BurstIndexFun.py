@@ -0,0 +1,127 @@
+def BurstIndexFun(time,fs,duration,maxgap,minduration):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    BurstIndexFun
+    =============
+
+    .. code:: python
+
+        start,stop,t0=BurstIndexFun(time,fs,duration,maxgap,minduration)
+
+    DESCRIPTION
+    -----------
+
+    | Detect bursts from time stamps of data
+    | Data are split where time step between two samples is larger than maxgap (gap in data)
+    | Each continuous part of data is split into bursts with a duration of "duration", the last burst of each part can be shorter
+    | Bursts shorter than minduration are ignored
+
+    INPUT
+    -----
+
+    time=importdata('time.mat')
+                                    Time stamp of each data point, in second or as numpy.datetime64
+    fs=10
+                                    Sampling frequency that data collected at in (Hz)
+    duration=1024
+                                    Maximum duration time of each burst in second
+    maxgap=0.15
+                                    Maximum time step between two samples in a burst in second, larger time step is considered a gap
+    minduration=512
+                                    Minimum duration time of each burst in second
+
+    OUTPUT
+    ------
+
+    start
+                                    Index of first data point of each burst
+    stop
+                                    Index after last data point of each burst, data of burst i is data[start[i]:stop[i]]
+    t0
+                                    Time stamp of first data point of each burst
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        start,stop,t0=BurstIndexFun(time,10,1024,0.15,512)
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+
+    #--------------------------------------------------------------------------
+    #Convert time to second from first time stamp
+
+    time=np.ravel(np.asarray(time))
+    len_=len(time)
+
+    if np.issubdtype(time.dtype,np.datetime64):
+        t=(time-time[0])/np.timedelta64(1,'s')
+    else:
+        t=time.astype(np.float64)-np.float64(time[0])
+
+    dt=np.diff(t) #Time step between two samples
+
+    if np.any(dt<=0):
+        raise ValueError('time should be strictly increasing.')
+
+    #--------------------------------------------------------------------------
+    #Detecting gaps, data between two gaps are continuous
+
+    part_start=np.concatenate(([0],np.nonzero(dt>maxgap)[0]+1)) #Index of first data point of each continuous part
+    part_number=np.searchsorted(part_start,np.arange(0,len_,1),side='right')-1 #Continuous part that each data point belongs to
+
+    #--------------------------------------------------------------------------
+    #Splitting each continuous part into bursts
+
+    elapsed=t-t[part_start][part_number] #Time from start of continuous part
+    burst_number=np.floor((elapsed+0.5/fs)/duration).astype(np.int64) #Burst that each data point belongs to in its continuous part
+
+    boundary=np.nonzero((np.diff(part_number)!=0) | (np.diff(burst_number)!=0))[0]+1
+    start=np.concatenate(([0],boundary))
+    stop=np.concatenate((boundary,[len_]))
+
+    #Removing short bursts
+    keep=(stop-start)>=minduration*fs
+    start=start[keep]
+    stop=stop[keep]
+
+    t0=time[start]
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return start, stop, t0
+
+    #--------------------------------------------------------------------------
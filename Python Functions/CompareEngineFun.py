@@ -0,0 +1,384 @@
+def CompareEngineFun(ocn_object,engines=None,datasets=None,atol=1e-8,rtol=1e-6,tolerance=None,dispout='on'):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    CompareEngineFun
+    ================
+
+    .. code:: python
+
+        report,passed=CompareEngineFun(ocn_object,engines,datasets,atol,rtol,tolerance,dispout)
+
+    DESCRIPTION
+    -----------
+
+    Compare results of calculation engines against the reference (burst by burst) OCEANLYZ calculation
+
+    INPUT
+    -----
+
+    ocn_object=oceanlyz.oceanlyz()
+                                    OCEANLYZ object with analysis properties already set
+                                        Its data, if any, is used as one of the datasets
+    engines=None
+                                    Python dictionary of engines to be compared with the reference engine
+                                        Each value is a function that gets a copy of ocn_object and returns its wave dictionary, or None if it is not available for properties of ocn_object
+
+                                        engines=None: all built-in engines are compared
+
+                                        Built-in engines:
+
+                                        'float32': reference calculation on data stored as float32, compared with tolerances of float32 precision
+
+                                        'multichannel': data calculated as two channels of a multi-channel data
+
+                                        'batch': data calculated as a multi-channel data with one channel, all bursts together (WaveSpectraBatchFun, PcorFFTBatchFun)
+
+                                        'sliding': sliding window calculation with hop_duration=burst_duration (WaveSpectraSlidingFun)
+
+                                        'zoomfft': spectrum only between fmin and fmax (WaveSpectraZoomFun), 'f' and 'Syy' are not compared
+
+                                        'decimation': data decimated before spectral calculation, 'f', 'Syy', 'Eta', and sea and swell separation results are not compared
+
+                                        'crossspectra': 'Syy' from diagonal of cross spectra (CrossSpectraFun) of waterlevel data
+    datasets=None
+                                    Python dictionary of datasets used for comparison
+                                        Each value is an array of data or a path to a data file (single column)
+
+                                        n_burst is calculated for each dataset as (number of data points)/(burst_duration*fs)
+
+                                        datasets=None: data in ocn_object (if any) and synthetic data are used
+
+                                        'synthetic': synthetic data based on properties of ocn_object
+    atol=1e-8
+                                    Absolute tolerance
+    rtol=1e-6
+                                    Relative tolerance
+    tolerance=None
+                                    Python dictionary of tolerance for output keys as (atol,rtol), used for all engines
+                                        Example: tolerance={'Tp':(1e-3,1e-3)}
+
+                                        Tolerance of None means output key is not compared
+
+                                        Built-in engines 'float32', 'zoomfft', and 'decimation' have their own tolerances for keys that are not in tolerance:
+
+                                        'float32': Eta (1e-5,1e-4), Syy (1e-7,1e-3), Hm0 and Hs (1e-6,1e-5), H, Crest, and Trough (1e-5,1e-4), T (1e-3,1e-4)
+
+                                        'zoomfft': Hm0 (0,1e-2), Tp and fp (0,5e-2)
+
+                                        'decimation': Hm0 and Hm0sea (0,5e-2), Tp, fp, and Tpsea (0,1e-1)
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    report
+                                    Python dictionary of comparison results as report[dataset][engine][key]
+                                        Each item contains 'max_abs_diff', 'max_rel_diff', 'atol', 'rtol', and 'passed'
+    passed
+                                    True if all compared output keys are within tolerance
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        ocn=oceanlyz.oceanlyz()
+        ocn.n_burst=2
+        ocn.burst_duration=1024
+        ocn.fs=2
+        report,passed=CompareEngineFun(ocn,None,None,1e-8,1e-6,{'Tp':(1e-3,1e-3)},'on')
+
+        #Pressure data decimated to an odd number of samples in each burst (decimation factor of 7 gives 1463 samples)
+        ocn=oceanlyz.oceanlyz()
+        ocn.InputType='pressure'
+        ocn.OutputType='wave+waterlevel'
+        ocn.n_burst=2
+        ocn.burst_duration=1024
+        ocn.fs=10
+        ocn.fmax=0.5
+        ocn.heightfrombed=0.05
+        report,passed=CompareEngineFun(ocn,None,None,1e-8,1e-6,None,'on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import copy
+    import io
+    import contextlib
+
+    #--------------------------------------------------------------------------
+    #Run OCEANLYZ without printing its messages
+
+    def run_engine(ocn):
+        with contextlib.redirect_stdout(io.StringIO()):
+            ocn.runoceanlyz()
+        return ocn.wave
+
+    #Reference engine
+    def reference_engine(ocn):
+        return run_engine(ocn)
+
+    #Calculation method (module) of OCEANLYZ properties
+    def module_engine(ocn):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ocn.oceanlyzmodule()
+
+    #Reference calculation on float32 data
+    def float32_engine(ocn):
+        ocn.data=np.asarray(ocn.data,dtype=np.float32)
+        return run_engine(ocn)
+
+    #Data is used as a multi-channel data with one channel, all bursts are calculated together (WaveSpectraBatchFun and PcorFFTBatchFun)
+    def batch_engine(ocn):
+        if module_engine(ocn) not in [1,3,6]:
+            return None
+        ocn.data=np.reshape(ocn.data,(1,-1))
+        wave=run_engine(ocn)
+        return {key: (value if key in ['Field_Names','f','Band_Width'] else value[0]) for key, value in wave.items()}
+
+    #Sliding window calculation (WaveSpectraSlidingFun) with windows that start every burst_duration seconds
+    def sliding_engine(ocn):
+        if ((module_engine(ocn)!=1) or (ocn.decimation=='yes') or (ocn.crossspectra=='yes') or (ocn.checkpoint!='')):
+            return None
+        if round(ocn.fs*ocn.burst_duration)%(ocn.nfft//2)!=0: #Windows should start at a Welch segment step
+            return None
+        ocn.hop_duration=ocn.burst_duration
+        return run_engine(ocn)
+
+    #Spectrum is only calculated between fmin and fmax (WaveSpectraZoomFun)
+    def zoomfft_engine(ocn):
+        if ((module_engine(ocn) not in [1,6]) or (ocn.crossspectra=='yes') or (ocn.hop_duration>0)):
+            return None
+        ocn.zoomfft='yes'
+        return run_engine(ocn)
+
+    #Data is decimated before spectral calculation
+    def decimation_engine(ocn):
+        if ((ocn.AnalysisMethod!='spectral') or (ocn.decimation=='yes')):
+            return None
+        ocn.decimation='yes'
+        if ocn.oceanlyzdecimationfactor()==1:
+            return None
+        return run_engine(ocn)
+
+    #Power spectrum from diagonal of cross spectra (CrossSpectraFun), Syy is replaced by real part of Sxy[0,0]
+    #Syy is zero outside of fmin and fmax, so Sxy is also compared in that range only
+    def crossspectra_engine(ocn):
+        if ((ocn.InputType!='waterlevel') or (ocn.AnalysisMethod!='spectral') or (ocn.tailcorrection!='off') or (ocn.zoomfft=='yes') or (ocn.hop_duration>0)):
+            return None
+        ocn.data=np.vstack([ocn.data,ocn.data])
+        ocn.crossspectra='yes'
+        wave=run_engine(ocn)
+        wave_channel={key: (value if key in ['Field_Names','f','Band_Width','Sxy'] else value[0]) for key, value in wave.items()}
+        wave_channel['Syy']=np.where(wave_channel['Syy']==0,0,np.real(wave['Sxy'][0,0]))
+        return wave_channel
+
+    #Multi-channel calculation, data is used as two channels and results of second channel are returned
+    def multichannel_engine(ocn):
+        ocn.data=np.vstack([ocn.data,ocn.data])
+        wave=run_engine(ocn)
+        wave_ragged=['H','T','Crest','Trough','Wave_Time']
+        wave_channel={key: (value if key in ['Field_Names','f','Band_Width']+wave_ragged else value[1]) for key, value in wave.items()}
+
+        #Wave-by-wave results of second channel
+        if 'Wave_Offset' in wave:
+            offset=wave['Wave_Offset'][1]
+            for key in wave_ragged:
+                wave_channel[key]=wave[key][offset[0]:offset[-1]]
+            wave_channel['Wave_Offset']=offset-offset[0]
+
+        return wave_channel
+
+    #Built-in engines
+    if engines is None:
+        engines={'float32':float32_engine, 'multichannel':multichannel_engine, 'batch':batch_engine, 'sliding':sliding_engine,
+            'zoomfft':zoomfft_engine, 'decimation':decimation_engine, 'crossspectra':crossspectra_engine}
+
+    #Tolerance of built-in engines that are not expected to give the same results as the reference engine, as (atol,rtol)
+    #None means output key is not compared
+    engine_tolerance={
+        'float32':{'Eta':(1e-5,1e-4), 'Syy':(1e-7,1e-3), 'Hm0':(1e-6,1e-5), 'Hs':(1e-6,1e-5), 'H':(1e-5,1e-4), 'T':(1e-3,1e-4), 'Crest':(1e-5,1e-4), 'Trough':(1e-5,1e-4)},
+        'zoomfft':{'f':None, 'Syy':None, 'Hm0':(0,1e-2), 'Tp':(0,5e-2), 'fp':(0,5e-2)},
+        'decimation':{'f':None, 'Syy':None, 'Eta':None, 'Hm0':(0,5e-2), 'Hm0sea':(0,5e-2), 'Tp':(0,1e-1), 'fp':(0,1e-1), 'Tpsea':(0,1e-1),
+            'Hm0swell':None, 'Tpswell':None, 'fseparation':None},
+    }
+
+    #--------------------------------------------------------------------------
+    #Generate synthetic data
+
+    def synthetic_data(ocn,seed=0):
+
+        #Random phase sum of JONSWAP spectrum components
+        rng=np.random.default_rng(seed)
+        n_burst=int(np.max([1,np.min([ocn.n_burst,3])]))
+        n_sample=int(round(ocn.fs*ocn.burst_duration))
+        dt=1/ocn.fs
+        t=np.arange(0,n_sample,1)*dt
+        h=2.0 #Mean water depth in (m)
+        Hm0=0.5 #Zero-moment wave height in (m)
+        fp=0.25 #Peak wave frequency in (Hz)
+        gamma=3.3
+
+        f=np.linspace(0.05,np.min([1.0,0.45*ocn.fs]),200)
+        deltaf=f[1]-f[0]
+        sigma=np.where(f<=fp,0.07,0.09)
+        Syy=f**(-5)*np.exp(-1.25*(fp/f)**4)*gamma**(np.exp(-(f-fp)**2/(2*sigma**2*fp**2)))
+        Syy=Syy*(Hm0/4)**2/np.sum(Syy*deltaf)
+        a=np.sqrt(2*Syy*deltaf) #Amplitude of each component
+
+        #Pressure response factor at sensor height
+        if ocn.InputType=='pressure':
+            w=2*np.pi*f
+            k0h=w**2/9.81*h
+            kh=np.where(k0h>=1,k0h,k0h**0.5)
+            for i in range(0,3,1):
+                kh=kh-((kh-k0h*(np.tanh(kh))**-1)/(1+k0h*((np.tanh(kh))**(-2)-1)))
+            Kp=np.cosh(kh/h*ocn.heightfrombed)/np.cosh(kh)
+        else:
+            Kp=np.ones(len(f))
+
+        data=np.zeros(n_burst*n_sample)
+        for i in range(0,n_burst,1):
+            phase=rng.uniform(0,2*np.pi,len(f))
+            Eta=np.sum((a*Kp)[:,None]*np.cos(2*np.pi*f[:,None]*t[None,:]+phase[:,None]),axis=0)
+            data[i*n_sample:(i+1)*n_sample]=Eta+(h-ocn.heightfrombed)
+
+        if ocn.InputType=='pressure':
+            data=data*ocn.Rho*9.81
+
+        return data
+
+    #--------------------------------------------------------------------------
+    #Set datasets
+
+    if datasets is None:
+        datasets={}
+        if np.size(ocn_object.data)>0:
+            datasets['data']=np.asarray(ocn_object.data)
+        datasets['synthetic']='synthetic'
+
+    if tolerance is None:
+        tolerance={}
+
+    #--------------------------------------------------------------------------
+    #Compare engines
+
+    report={}
+    passed=True
+
+    for dataset_name, dataset in datasets.items():
+
+        #Load dataset
+        if type(dataset) is str:
+            if dataset=='synthetic':
+                data=synthetic_data(ocn_object)
+            else:
+                data=np.genfromtxt(dataset)
+        else:
+            data=np.asarray(dataset)
+
+        ocn=copy.deepcopy(ocn_object)
+        ocn.data=data
+        ocn.n_burst=int(np.size(data)/round(ocn.fs*ocn.burst_duration))
+        ocn.dispout='no'
+        ocn.wave={}
+
+        #Reference results
+        wave_ref=reference_engine(copy.deepcopy(ocn))
+
+        report[dataset_name]={}
+        for engine_name, engine in engines.items():
+
+            wave=engine(copy.deepcopy(ocn))
+
+            #Engine is not available for these properties
+            if wave is None:
+                continue
+
+            report[dataset_name][engine_name]={}
+            for key in wave_ref.keys():
+                if ((key=='Field_Names') or (key=='Burst_Data')):
+                    continue
+
+                tolerance_key=tolerance.get(key,engine_tolerance.get(engine_name,{}).get(key,(atol,rtol)))
+                if tolerance_key is None:
+                    continue
+                atol_key,rtol_key=tolerance_key
+
+                if key not in wave.keys():
+                    report[dataset_name][engine_name][key]={'max_abs_diff':np.nan, 'max_rel_diff':np.nan, 'atol':atol_key, 'rtol':rtol_key, 'passed':False}
+                    passed=False
+                    continue
+
+                x_ref=np.asarray(wave_ref[key],dtype=np.float64)
+                x=np.asarray(wave[key],dtype=np.float64)
+                if x.shape!=x_ref.shape:
+                    try:
+                        x=np.broadcast_to(x,x_ref.shape)
+                    except ValueError:
+                        report[dataset_name][engine_name][key]={'max_abs_diff':np.nan, 'max_rel_diff':np.nan, 'atol':atol_key, 'rtol':rtol_key, 'passed':False}
+                        passed=False
+                        continue
+
+                abs_diff=np.abs(x-x_ref)
+                abs_diff[np.isnan(x) & np.isnan(x_ref)]=0
+                rel_diff=abs_diff/np.maximum(np.abs(x_ref),np.finfo(np.float64).tiny)
+                rel_diff[abs_diff==0]=0
+
+                key_passed=bool(np.allclose(x,x_ref,rtol=rtol_key,atol=atol_key,equal_nan=True))
+                if key_passed==False: passed=False
+
+                report[dataset_name][engine_name][key]={'max_abs_diff':float(np.max(abs_diff,initial=0)), 'max_rel_diff':float(np.max(rel_diff,initial=0)), 'atol':atol_key, 'rtol':rtol_key, 'passed':key_passed}
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+
+        print('--------------------------------------------------')
+        print('{0:12} {1:12} {2:12} {3:>14} {4:>14} {5:>8}'.format('Dataset','Engine','Key','Max Abs Diff','Max Rel Diff','Passed'))
+        print('--------------------------------------------------')
+        for dataset_name in report.keys():
+            for engine_name in report[dataset_name].keys():
+                for key, val in report[dataset_name][engine_name].items():
+                    print('{0:12} {1:12} {2:12} {3:14.6e} {4:14.6e} {5:>8}'.format(dataset_name,engine_name,key,val['max_abs_diff'],val['max_rel_diff'],str(val['passed'])))
+        print('--------------------------------------------------')
+        print('All engines passed: {}'.format(passed))
+        print('--------------------------------------------------')
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return report, passed
+
+    #--------------------------------------------------------------------------
@@ -0,0 +1,235 @@
+def CrossSpectraFun(input,fs,duration,nfft,heightfrombed,fmaxpcorr,InputType,pressureattenuation,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    CrossSpectraFun
+    ===============
+
+    .. code:: python
+
+        Sxy,f=CrossSpectraFun(input,fs,duration,nfft,heightfrombed,fmaxpcorr,InputType,pressureattenuation,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Calculate cross power spectral density matrix of all pairs of gauges (channels) for all bursts
+    | Fast Fourier Transform of each Welch segment is calculated once for each channel and used for all pairs
+    | Welch segments are the same as WaveSpectraFun (scipy.signal.welch default, linear detrend of each burst)
+    | For pressure channels, pressure response factor (Kp) from linear wave theory is applied on each segment as PcorFFTFun
+
+    INPUT
+    -----
+
+    input=importdata('h.mat')
+                                    Load water depth (h) data of all channels and rename it "input" in (m)
+                                        input[i,:] is data of channel i, each burst follows the previous burst
+                                        Data of pressure channels should be converted to water depth as water_pressure/(Rho*9.81)
+    fs=10
+                                    Sampling frequency that data collected at in (Hz)
+    duration=1024
+                                    Duration time that data collected in input in each burst in second
+    nfft=2^10
+                                    NFFT for Fast Fourier Transform
+    heightfrombed=[0.0,0.1]
+                                    Sensor height from bed of each channel (a single value is used for all channels)
+    fmaxpcorr=0.8
+                                    Maximum frequency for applying pressure attenuation factor
+    InputType='pressure'
+                                    Input type of each channel (a single value is used for all channels)
+                                        InputType='waterlevel': Channel is water level, Kp is not applied
+
+                                        InputType='pressure': Channel is water depth from pressure, Kp is applied
+    pressureattenuation='all'
+                                    Define if to apply pressure attenuation factor or not
+                                        pressureattenuation='off': No pressure attenuation applied
+
+                                        pressureattenuation='on': Pressure attenuation applied without correction after fmaxpcorr
+
+                                        pressureattenuation='all': Pressure attenuation applied with constant correction after fmaxpcorr
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    Sxy
+                                    Cross Power Spectral Density (m^2s) with shape (n_channel, n_channel, n_burst, nfft/2+1)
+                                        Sxy[i,j,k,:] is cross spectrum of channel i and channel j in burst k, the same as scipy.signal.csd(channel i, channel j)
+                                        Sxy[i,i,k,:] is power spectrum of channel i in burst k
+    f
+                                    Frequency (Hz)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        Sxy,f=CrossSpectraFun(water_pressure/(1024*9.81),10,1024,256,[0.05,0.1,0.05],0.8,'pressure','all','on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import scipy as sp
+    from scipy import signal
+
+    if dispout=='on':
+        import matplotlib.pyplot as plt
+
+    #--------------------------------------------------------------------------
+    #Convert inputs to numpy array
+
+    input=np.atleast_2d(np.asarray(input,dtype=np.float64))
+    n_channel=np.shape(input)[0]
+    heightfrombed=np.broadcast_to(np.asarray(heightfrombed,dtype=np.float64),(n_channel,))
+    pressurechannel=np.broadcast_to(np.asarray(InputType)=='pressure',(n_channel,))
+
+    #--------------------------------------------------------------------------
+    #Bursts and Welch segments
+
+    n_sample=int(round(fs*duration)) #Number of data points in each burst
+    n_burst=int(np.shape(input)[1]//n_sample) #Number of bursts
+    input=np.reshape(input[:,0:n_burst*n_sample],(n_channel,n_burst,n_sample))
+
+    if (fmaxpcorr>fs/2) : fmaxpcorr=int(fs/2)
+
+    #Welch segments are the same as scipy.signal.welch default
+    windowelem=int(np.min([256,n_sample])) #number of elements in each segment
+    overlapelem=windowelem//2 #number of overlap element
+    stepelem=windowelem-overlapelem #number of elements between start of two consecutive segments
+    n_segment=(n_sample-windowelem)//stepelem+1 #Number of segments in each burst
+
+    win=sp.signal.get_window('hann',windowelem)
+
+    f=np.fft.rfftfreq(nfft,1/fs) #frequency
+    w=2*np.pi*f #Angular frequency
+
+    #Scale for one-sided power spectral density
+    scale=np.ones(len(f))/(fs*np.sum(win**2))
+    if nfft%2==0:
+        scale[1:-1]=scale[1:-1]*2
+    else:
+        scale[1:]=scale[1:]*2
+
+    #--------------------------------------------------------------------------
+    #Pressure response factor for pressure channels
+
+    def pressure_response(h,hb):
+
+        #Estimation of wave number (k) from Goad (2010), h and hb have a shape of (n,1)
+        k0=w**2/9.81 #Deep water wave number
+        k0h=k0[None,:]*h
+        kh=np.where(k0h>=1,k0h,k0h**0.5)
+
+        with np.errstate(divide='ignore',invalid='ignore'):
+            for i in range(0,3,1):
+                kh=kh-((kh-k0h*(np.tanh(kh))**-1)/(1+k0h*((np.tanh(kh))**(-2)-1))) #Calculating wave number from Goda (2010)
+
+        k=kh/h #Calculating wave number from Goda (2010)
+        k[:,w==0]=0
+
+        #Calculation of pressure response factor
+        Kp=np.cosh(k*hb)/np.cosh(k*h)
+        kmaxL=np.pi/(h-hb) # Wave number associated with fmaxpcorrL
+        KpminL=np.cosh(kmaxL*hb)/np.cosh(kmaxL*h) # Minimum Limit for K_p calculated based on linear wave theory
+        Kp=np.where(Kp<KpminL,KpminL,Kp) # Check to avoid large amplification
+
+        if pressureattenuation=='off':
+            Kp[:,:]=1
+
+        elif pressureattenuation=='on':
+            Kp[:,f>fmaxpcorr]=1 # correction factor larger than fmaxpcorr should be 1 (no correction)
+
+            # linear decrease of correction for f larger than maximum frequency
+            loc1=int(np.max((np.nonzero(f<=fmaxpcorr-0.05))[0]))
+            loc2=int(np.max((np.nonzero(f<=fmaxpcorr+0.05))[0]))
+            i=np.arange(loc1,loc2+1,1)
+            Kp[:,loc1:loc2+1]=(Kp[:,loc2,None]-Kp[:,loc1,None])/(loc2-loc1)*(i-loc1)+Kp[:,loc1,None]
+
+        elif pressureattenuation=='all':
+            loc2=int(np.max((np.nonzero(f<=fmaxpcorr))[0]))
+            Kp[:,f>fmaxpcorr]=Kp[:,loc2,None] # correction factor larger than fmaxpcorr stays constant
+
+        return Kp
+
+    #--------------------------------------------------------------------------
+    #Calculating cross power spectral density
+
+    Sxy=np.zeros((n_burst,len(f),n_channel,n_channel),dtype=np.complex128)
+
+    #Bursts are calculated in groups to limit memory used by segment spectra
+    n_burst_group=int(np.max([1,2**24//(n_channel*n_segment*len(f))]))
+
+    for i1 in range(0,n_burst,n_burst_group):
+        i2=int(np.min([i1+n_burst_group,n_burst]))
+
+        #Linear detrend of each burst
+        input1=sp.signal.detrend(input[:,i1:i2,:],axis=2,type='linear')
+
+        #Segment spectra of all channels, shape of (n_channel, n_burst, n_segment, nfft/2+1)
+        segment=np.lib.stride_tricks.sliding_window_view(input1,windowelem,axis=2)[:,:,::stepelem,:][:,:,0:n_segment,:]
+        segment=segment-np.mean(segment,axis=3,keepdims=True)
+        X=np.fft.rfft(segment*win,n=nfft,axis=3)
+
+        #Applying pressure response factor on pressure channels
+        if np.any(pressurechannel):
+            h=np.mean(input[pressurechannel,i1:i2,:],axis=2)+heightfrombed[pressurechannel,None] #Mean water depth of each burst
+            h[h<=0]=0.001
+            hb=np.broadcast_to(heightfrombed[pressurechannel,None],np.shape(h))
+            Kp=pressure_response(np.reshape(h,(-1,1)),np.reshape(hb,(-1,1)))
+            Kp=np.reshape(Kp,(np.shape(h)[0],np.shape(h)[1],1,len(f)))
+            X[pressurechannel,:,:,:]=X[pressurechannel,:,:,:]/Kp
+
+        #Cross spectra of all pairs as a matrix product over segments for each burst and frequency
+        X=np.transpose(X,(1,3,0,2)) #(n_burst, nfft/2+1, n_channel, n_segment)
+        Sxy[i1:i2,:,:,:]=np.matmul(np.conj(X),np.swapaxes(X,2,3))/n_segment*scale[None,:,None,None]
+
+    Sxy=np.transpose(Sxy,(2,3,0,1)) #(n_channel, n_channel, n_burst, nfft/2+1)
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+
+        for j in range(0,n_channel,1):
+            Syy_mean=np.real(np.mean(Sxy[j,j,:,:],axis=0)) #Mean power spectrum of all bursts
+            plt.loglog(f[f!=0],Syy_mean[f!=0],label='Channel '+str(j+1))
+
+        plt.title('Power Spectral Density (Mean of Bursts)')
+        plt.xlabel('Frequency(Hz)')
+        plt.ylabel('Spectral Density(m^2s)')
+        plt.legend()
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return Sxy, f
+
+    #--------------------------------------------------------------------------
@@ -0,0 +1,180 @@
+def DataReadFun(FilePath,delimiter,skip_header,firstcolumn,n_worker,cache):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    DataReadFun
+    ===========
+
+    .. code:: python
+
+        data=DataReadFun(FilePath,delimiter,skip_header,firstcolumn,n_worker,cache)
+
+    DESCRIPTION
+    -----------
+
+    | Load data from a delimited text file (CSV/TXT) and reshape it to a single column
+    | Columns of a multi-column file are placed one after another
+    | Large files are split into chunks at line ends, and chunks are parsed in parallel processes
+    | Values that cannot be parsed (e.g. empty fields) are NaN, similar to numpy.genfromtxt
+    | Parsed data can be saved in a cache folder (cache), cache file name is from name and path of data file and a key from file size, modification time, delimiter, and skip_header
+    | Loading the same file again reads cache file instead of parsing text, a changed file has a new key and is parsed again
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_python\\Sample_Data\\waterpressure_5burst.csv'
+                                    Path of data file
+    delimiter=','
+                                    Delimiter between columns
+                                        delimiter=None: Any whitespace
+    skip_header=0
+                                    Number of lines to skip at start of file (header lines)
+    firstcolumn=1
+                                    First column to read (first column is 1), columns before it are ignored
+    n_worker=0
+                                    Number of processes that parse chunks of file
+                                        n_worker=0: Number of CPUs
+
+                                        n_worker=1: File is parsed in the current process
+    cache='off'
+                                    Folder to save parsed data, so the same file is not parsed again
+                                        cache='off': File is always parsed and parsed data is not saved
+
+                                        cache='C:\\oceanlyz_cache': Cache file in this folder is used if it exists, otherwise it is saved after parsing (folder is created if it does not exist)
+
+    OUTPUT
+    ------
+
+    data
+                                    Data as a single column, columns of file are placed one after another
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        data=DataReadFun('waterpressure_5burst.csv',None,0,1,0,'off')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import os
+    import io
+    import re
+    import glob
+    import hashlib
+    import warnings
+    import concurrent.futures
+
+    #--------------------------------------------------------------------------
+    #Cache file of this version of data file
+
+    if cache!='off':
+        file_stat=os.stat(FilePath)
+        path_key=hashlib.sha256(os.path.abspath(FilePath).encode('utf-8')).hexdigest()[0:16] #Data files with the same name in different folders
+        cache_key=hashlib.sha256(repr((file_stat.st_size,file_stat.st_mtime_ns,delimiter,skip_header)).encode('utf-8')).hexdigest()[0:16]
+        CachePrefix=os.path.join(cache,os.path.basename(FilePath)+'.'+path_key)
+        CachePath=CachePrefix+'.'+cache_key+'.npy'
+
+    #--------------------------------------------------------------------------
+    #Parsing data file
+
+    if ((cache!='off') and (os.path.isfile(CachePath))):
+        table=np.load(CachePath)
+
+    else:
+
+        with open(FilePath,'rb') as file:
+            content=file.read()
+
+        #Skipping header lines
+        start=0
+        for i in range(0,skip_header,1):
+            start=content.find(b'\n',start)+1
+            if start==0:
+                start=len(content)
+                break
+
+        #Splitting file into chunks of at least 16 MB at line ends
+        if n_worker==0:
+            n_worker=os.cpu_count() or 1
+        n_chunk=int(max(1,min(n_worker,(len(content)-start)//2**24)))
+
+        chunk_edge=[start]
+        for i in range(1,n_chunk,1):
+            chunk_stop=content.find(b'\n',start+(len(content)-start)*i//n_chunk)+1
+            if chunk_stop>chunk_edge[-1]:
+                chunk_edge.append(chunk_stop)
+        chunk_edge.append(len(content))
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error') #Chunk without data is parsed again by numpy.genfromtxt
+
+                if len(chunk_edge)>2:
+                    with concurrent.futures.ProcessPoolExecutor(max_workers=len(chunk_edge)-1) as executor:
+                        futures=[executor.submit(np.loadtxt,io.BytesIO(content[chunk_edge[i]:chunk_edge[i+1]]),delimiter=delimiter,ndmin=2) for i in range(0,len(chunk_edge)-1,1)]
+                        table=np.concatenate([future.result() for future in futures],axis=0)
+                else:
+                    table=np.loadtxt(io.BytesIO(content[start:]),delimiter=delimiter,ndmin=2)
+
+        except (ValueError,UserWarning):
+            #Missing or non-numeric values, parsed with numpy.genfromtxt
+            table=np.genfromtxt(io.BytesIO(content[start:]),delimiter=delimiter,ndmin=2)
+
+        #Saving cache file and removing cache files of previous versions of data file, cache folder may be read-only
+        if cache!='off':
+            try:
+                os.makedirs(cache,exist_ok=True)
+                for OldCachePath in glob.glob(glob.escape(CachePrefix)+'.*.npy'):
+                    if re.fullmatch('[0-9a-f]{16}',OldCachePath[len(CachePrefix)+1:-4]):
+                        os.remove(OldCachePath)
+
+                CachePath_tmp=CachePath+'.tmp.npy'
+                np.save(CachePath_tmp,table)
+                os.replace(CachePath_tmp,CachePath)
+            except OSError:
+                pass
+
+    #--------------------------------------------------------------------------
+    #Columns one after another
+
+    if ((firstcolumn>1) and (firstcolumn<=np.shape(table)[1])):
+        table=table[:,firstcolumn-1:]
+
+    data=np.reshape(table,-1,order='F')
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return data
+
+    #--------------------------------------------------------------------------
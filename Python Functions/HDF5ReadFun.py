@@ -0,0 +1,163 @@
+def HDF5ReadFun(FilePath,key,burst_range):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    HDF5ReadFun
+    ===========
+
+    .. code:: python
+
+        value=HDF5ReadFun(FilePath,key,burst_range)
+
+    DESCRIPTION
+    -----------
+
+    | Read one result for a range of bursts from a HDF5 file that is written by HDF5WriteFun
+    | Only the requested bursts of the requested result are read from the file
+    | Results have the same layout as OCEANLYZ results (wave dictionary)
+    | h5py package is required
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_results.h5'
+                                    Path of HDF5 file
+    key='Hm0'
+                                    Name of result, such as 'Hm0', 'Tp', 'Syy', 'Eta', 'f', 'H', or 'Wave_Offset'
+                                        key='Field_Names': Names of results in the file
+    burst_range=[0,100]
+                                    Index of first burst and index after last burst to read
+                                        burst_range=[]: All bursts
+
+    OUTPUT
+    ------
+
+    value
+                                    Result for bursts in burst_range
+                                        For wave-by-wave results (such as 'H'), waves of bursts in burst_range
+
+                                        For key='Wave_Offset', index of first wave of each burst in burst_range, starting from 0
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        Hm0=HDF5ReadFun('oceanlyz_results.h5','Hm0',[])
+        Syy=HDF5ReadFun('oceanlyz_results.h5','Syy',[1000,1100])
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import h5py
+
+    #--------------------------------------------------------------------------
+
+    wave_ragged=['H','T','Crest','Trough','Wave_Time'] #Wave-by-wave results
+
+    #Order of waves is changed from the order of rows of count to the order of columns of count
+    def ragged_transpose(value,count):
+        first=np.reshape(np.cumsum(count)-np.ravel(count),np.shape(count))
+        countT=np.ravel(count.T)
+        firstT=np.ravel(first.T)
+        return value[np.arange(0,np.sum(countT),1)+np.repeat(firstT-(np.cumsum(countT)-countT),countT)]
+
+    with h5py.File(FilePath,'r') as file:
+
+        n_channel=int(file.attrs['n_channel'])
+        n_burst_file=int(file.attrs['n_burst'])
+
+        if len(burst_range)==0:
+            burst_range=[0,n_burst_file]
+        i1,i2=int(burst_range[0]),int(burst_range[1])
+
+        #----------------------------------------------------------------------
+        #Names of results and values that are the same for all bursts
+
+        if key=='Field_Names':
+            return [file.attrs['Field_Names']]
+
+        if ((key=='f') or (key=='Band_Width')):
+            return file[key][()]
+
+        #----------------------------------------------------------------------
+        #Wave-by-wave results
+
+        if ((key in wave_ragged) or (key=='Wave_Offset')):
+
+            count=file['Wave_Count'][0:i2] #Number of waves in each burst (and each channel)
+            first=int(np.sum(count[0:i1])) #Index of first wave of burst i1
+            count=count[i1:i2]
+
+            #Channels are first axis of results
+            if n_channel>0:
+                count_channel=count.T
+            else:
+                count_channel=np.reshape(count,(1,-1))
+
+            if key=='Wave_Offset':
+                offset=np.concatenate(([0],np.cumsum(count_channel)))
+                n=np.shape(count_channel)[1]
+                value=offset[np.arange(0,np.shape(count_channel)[0],1)[:,None]*n+np.arange(0,n+1,1)[None,:]]
+                if n_channel==0:
+                    value=value[0]
+                return value
+
+            value=file[key][first:first+int(np.sum(count))]
+
+            #Waves are saved in the order of bursts, they are changed to the order of channels
+            if n_channel>0:
+                value=ragged_transpose(value,count)
+
+            return value
+
+        #----------------------------------------------------------------------
+        #Results of each burst
+
+        dataset=file[key]
+        value=dataset[i1:i2]
+
+        #Time stamps are saved as int64 nanoseconds from 1970-01-01
+        if dataset.attrs.get('datetime64',False):
+            value=value.astype('datetime64[ns]')
+
+    #Burst is the first axis in the file
+    if key=='Sxy':
+        value=np.moveaxis(value,0,2)
+    elif n_channel>0:
+        value=np.moveaxis(value,0,1)
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return value
+
+    #--------------------------------------------------------------------------
@@ -0,0 +1,226 @@
+def HDF5WriteFun(FilePath,wave,n_channel,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    HDF5WriteFun
+    ============
+
+    .. code:: python
+
+        burst_range=HDF5WriteFun(FilePath,wave,n_channel,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Add results of all bursts in wave dictionary to a HDF5 file, bursts are added after bursts that are already in the file
+    | Each result (such as Hm0, Tp, Syy, Eta) is saved in a chunked and compressed dataset, its first axis is burst
+    | Wave-by-wave results (wave_by_wave='yes') are saved as flat datasets with number of waves in each burst ('Wave_Count')
+    | Values that are the same for all bursts ('f' and 'Band_Width') are saved once
+    | Input data of bursts ('Burst_Data') are not saved
+    | Number of bursts in the file is updated after all results are written, results of a failed write are removed in the next write
+    | Use HDF5ReadFun to read one result for a range of bursts without loading other results
+    | h5py package is required
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_results.h5'
+                                    Path of HDF5 file, it is created if it does not exist
+    wave=ocn.wave
+                                    OCEANLYZ results as a Python dictionary
+    n_channel=0
+                                    Number of channels for multi-channel data (results have channel as their first axis)
+                                        n_channel=0: Data has one channel
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    burst_range
+                                    Index of first burst and index after last burst that are added to the file
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        burst_range=HDF5WriteFun('oceanlyz_results.h5',ocn.wave,0,'on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import h5py
+
+    #--------------------------------------------------------------------------
+    #Results that are not saved for each burst
+
+    wave_ragged=['H','T','Crest','Trough','Wave_Time'] #Wave-by-wave results
+    wave_fixed=['f','Band_Width'] #The same for all bursts
+    wave_skipped=['Field_Names','Wave_Offset','Burst_Data'] #Not saved as datasets
+
+    #Axis of bursts in each result
+    def burst_axis(key):
+        if key=='Sxy':
+            return 2 #Cross spectra have a shape of (n_channel, n_channel, n_burst, nfft/2+1)
+        elif n_channel>0:
+            return 1
+        else:
+            return 0
+
+    #Order of waves is changed from the order of rows of count to the order of columns of count
+    def ragged_transpose(value,count):
+        first=np.reshape(np.cumsum(count)-np.ravel(count),np.shape(count))
+        countT=np.ravel(count.T)
+        firstT=np.ravel(first.T)
+        return value[np.arange(0,np.sum(countT),1)+np.repeat(firstT-(np.cumsum(countT)-countT),countT)]
+
+    #Append value to a resizable, chunked, and compressed dataset along its first axis
+    #If n_row is not None, dataset should have n_row rows before appending
+    def append_dataset(file,key,value,n_row):
+
+        if key not in file:
+
+            #Each chunk is about 1 MB
+            row_size=int(np.prod(np.shape(value)[1:]))*value.dtype.itemsize
+            chunk_row=int(np.clip(2**20//max(row_size,1),1,2**16))
+
+            file.create_dataset(key,shape=(0,)+np.shape(value)[1:],maxshape=(None,)+np.shape(value)[1:],dtype=value.dtype,
+                chunks=(chunk_row,)+np.shape(value)[1:],compression='gzip',compression_opts=4,shuffle=True)
+
+        dataset=file[key]
+
+        if dataset.shape[1:]!=np.shape(value)[1:]:
+            raise ValueError('Shape of "{}" is {} for each burst, but it is {} in the file.'.format(key,np.shape(value)[1:],dataset.shape[1:]))
+        if ((n_row is not None) and (dataset.shape[0]!=n_row)):
+            raise ValueError('"{}" has {} burst(s) in the file, but file has {} burst(s).'.format(key,dataset.shape[0],n_row))
+
+        n_file=dataset.shape[0]
+        dataset.resize(n_file+np.shape(value)[0],axis=0)
+        dataset[n_file:]=value
+
+    #--------------------------------------------------------------------------
+    #Adding results to HDF5 file
+
+    with h5py.File(FilePath,'a') as file:
+
+        n_burst_file=int(file.attrs.get('n_burst',0)) #Number of bursts that are already in the file
+
+        #Results after the last burst in the file are from a failed write, they are removed
+        if 'n_channel' in file.attrs:
+            n_wave_file=int(np.sum(file['Wave_Count'][0:n_burst_file])) if 'Wave_Count' in file else 0 #Number of waves that are already in the file
+            for key in list(file.keys()):
+                if n_burst_file==0:
+                    del file[key]
+                elif key in wave_ragged:
+                    file[key].resize(n_wave_file,axis=0)
+                elif key not in wave_fixed:
+                    file[key].resize(n_burst_file,axis=0)
+
+        #Burst_Data is not saved, so it is removed from names of results
+        field_names=', '.join([name.strip() for name in str(wave['Field_Names'][0]).split(',') if name.strip() not in ['','Burst_Data']])
+
+        if n_burst_file==0:
+            file.attrs['n_channel']=n_channel
+            file.attrs['Field_Names']=field_names
+        elif int(file.attrs['n_channel'])!=n_channel:
+            raise ValueError('Number of channels is different from data in "{}".'.format(FilePath))
+        elif file.attrs['Field_Names']!=field_names:
+            raise ValueError('Results are different from results in "{}" ({}).'.format(FilePath,file.attrs['Field_Names']))
+
+        n_burst=None #Number of bursts in wave
+
+        for key, value in wave.items():
+
+            if ((key in wave_skipped) or (key in wave_ragged)):
+                continue
+
+            value=np.asarray(value)
+
+            #Values that are the same for all bursts are saved once
+            if key in wave_fixed:
+                if key not in file:
+                    file.create_dataset(key,data=value)
+                continue
+
+            #Burst is the first axis of datasets
+            value=np.moveaxis(value,burst_axis(key),0)
+            n_burst=np.shape(value)[0]
+
+            #Time stamps are saved as int64 nanoseconds from 1970-01-01
+            is_datetime=np.issubdtype(value.dtype,np.datetime64)
+            if is_datetime:
+                value=value.astype('datetime64[ns]').astype(np.int64)
+
+            append_dataset(file,key,value,n_burst_file)
+            file[key].attrs['datetime64']=is_datetime
+
+        #Wave-by-wave results, waves are saved in the order of bursts
+        if 'Wave_Offset' in wave:
+
+            offset=np.reshape(np.asarray(wave['Wave_Offset'],dtype=np.int64),(-1,np.shape(wave['Wave_Offset'])[-1]))
+            count=np.diff(offset,axis=1) #Number of waves in each burst, shape of (n_channel, n_burst)
+
+            for key in wave_ragged:
+                if key in wave:
+                    value=np.asarray(wave[key])[offset[0,0]:offset[-1,-1]]
+                    if n_channel>0:
+                        value=ragged_transpose(value,count)
+                    append_dataset(file,key,value,None)
+
+            if n_channel>0:
+                append_dataset(file,'Wave_Count',count.T,n_burst_file)
+            else:
+                append_dataset(file,'Wave_Count',count[0],n_burst_file)
+
+            n_burst=np.shape(count)[1]
+
+        if n_burst is None:
+            n_burst=0
+
+        #Bursts are only added to the file after all of their results are written
+        file.attrs['n_burst']=n_burst_file+n_burst
+
+    burst_range=[n_burst_file,n_burst_file+n_burst]
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+        print('Burst(s) {} to {} are added to {}'.format(burst_range[0]+1,burst_range[1],FilePath))
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return burst_range
+
+    #--------------------------------------------------------------------------
+
@@ -0,0 +1,231 @@
+def MatReadFun(FilePath,variable,burst_range,n_sample):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    MatReadFun
+    ==========
+
+    .. code:: python
+
+        value=MatReadFun(FilePath,variable,burst_range,n_sample)
+
+    DESCRIPTION
+    -----------
+
+    | Read a variable for a range of bursts from a MATLAB file (version 5 or 7.3)
+    | A data variable (e.g. water pressure) is read as a single column, only samples of bursts in burst_range
+    | A "wave" structure (from MATLAB version of OCEANLYZ or MatWriteFun) is read as a Python dictionary with the same layout as OCEANLYZ results
+    | Version 7.3 files are HDF5 files and only the requested bursts are read from the file
+    | Version 5 files are read by scipy.io.loadmat, only the requested variable is read and then bursts are selected
+    | h5py package is required for version 7.3
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_python\\Sample_Data\\waterpressure.mat'
+                                    Path of MATLAB file
+    variable='water_pressure'
+                                    Name of variable in MATLAB file
+                                        variable='wave': Results from MATLAB version of OCEANLYZ or MatWriteFun
+    burst_range=[0,100]
+                                    Index of first burst and index after last burst to read
+                                        burst_range=[]: All bursts
+    n_sample=10240
+                                    Number of rows in each burst, e.g. (burst_duration*fs) for data, or 1 if each row is a burst
+                                        Not used for a structure, each row of structure fields is a burst
+
+    OUTPUT
+    ------
+
+    value
+                                    Value of variable for bursts in burst_range
+                                        A row or column vector is read as a single column (1-D array)
+
+                                        For a structure, Python dictionary with results of bursts in burst_range, frequency 'f' is a 1-D array
+                                        Fields of a structure are read as (bursts, values), so results of a single burst (row vectors such as 'Syy') keep all values
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        data=MatReadFun('waterpressure.mat','water_pressure',[0,10],10240)
+        wave=MatReadFun('oceanlyz_results.mat','wave',[],1)
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+
+    #--------------------------------------------------------------------------
+    #Version of MATLAB file
+
+    with open(FilePath,'rb') as file:
+        version73=file.read(128).startswith(b'MATLAB 7.3')
+
+    wave_ragged=['H','T','Crest','Trough','Wave_Time'] #Wave-by-wave results
+
+    #--------------------------------------------------------------------------
+    #Reading rows of a MATLAB array
+
+    if version73==True:
+
+        import h5py
+
+        file=h5py.File(FilePath,'r')
+        source=file[variable]
+
+        def matlab_class(value):
+            return value.attrs.get('MATLAB_class',b'double').decode('ascii')
+
+        #MATLAB arrays are column-major, so dimensions are in reverse order in HDF5 file
+        def matlab_shape(value):
+            if value.attrs.get('MATLAB_empty',0)==1:
+                return (0,0)
+            return value.shape[::-1]
+
+        def read_char(value):
+            return value[()].astype(np.uint16).tobytes().decode('utf-16-le')
+
+        def read_rows(value,i1,i2,vector):
+            if value.attrs.get('MATLAB_empty',0)==1:
+                return np.zeros(0)
+            if ((vector==True) and (len(value.shape)==2) and (min(value.shape)==1)):
+                rows=np.ravel(value[0:1,i1:i2]) if value.shape[0]==1 else np.ravel(value[i1:i2,0:1])
+            else:
+                rows=value[...,i1:i2].T
+                if ((rows.ndim==2) and (rows.shape[1]==1)):
+                    rows=np.ravel(rows) #Column of one value for each row
+            if matlab_class(value)=='logical':
+                rows=rows.astype(bool)
+            return rows
+
+        #Order of fields is saved in 'MATLAB_fields'
+        def field_names(value):
+            if 'MATLAB_fields' in value.attrs:
+                return [b''.join(name).decode('ascii') for name in value.attrs['MATLAB_fields']]
+            return list(value.keys())
+
+    else:
+
+        import scipy as sp
+        from scipy import io
+
+        file=None
+        source=sp.io.loadmat(FilePath,variable_names=[variable],squeeze_me=False,struct_as_record=True)[variable]
+
+        #Fields of a 1x1 structure
+        if source.dtype.names is not None:
+            source={key: source[0,0][key] for key in source.dtype.names}
+
+        def matlab_class(value):
+            if type(value) is dict:
+                return 'struct'
+            elif value.dtype.kind=='U':
+                return 'char'
+            else:
+                return value.dtype.name
+
+        def matlab_shape(value):
+            return np.shape(value)
+
+        def read_char(value):
+            return ''.join(np.ravel(value))
+
+        def read_rows(value,i1,i2,vector):
+            if ((vector==True) and (np.ndim(value)==2) and (min(np.shape(value))==1)):
+                return np.ravel(value)[i1:i2]
+            rows=value[i1:i2]
+            if ((np.ndim(rows)==2) and (np.shape(rows)[1]==1)):
+                rows=np.ravel(rows) #Column of one value for each row
+            return rows
+
+        def field_names(value):
+            return list(value.keys())
+
+    #--------------------------------------------------------------------------
+    #Reading variable
+
+    try:
+
+        if matlab_class(source)!='struct':
+
+            #Data variable, rows of bursts in burst_range
+            n_row=int(np.max(matlab_shape(source))) if ((len(matlab_shape(source))==2) and (min(matlab_shape(source))==1)) else matlab_shape(source)[0]
+            if len(burst_range)==0:
+                burst_range=[0,n_row//n_sample]
+            value=read_rows(source,int(burst_range[0])*n_sample,int(burst_range[1])*n_sample,True)
+
+        else:
+
+            #Structure of results, each row is a burst (a single burst is a row vector, it is not read as a data vector)
+            keys=field_names(source)
+
+            n_burst=1
+            for key in keys:
+                if ((matlab_class(source[key])!='char') and (key not in wave_ragged) and (key!='Wave_Offset')):
+                    n_burst=matlab_shape(source[key])[0]
+                    break
+
+            if len(burst_range)==0:
+                burst_range=[0,n_burst]
+            i1,i2=int(burst_range[0]),int(burst_range[1])
+
+            #Index of first and last wave of bursts in burst_range
+            if 'Wave_Offset' in keys:
+                Wave_Offset=read_rows(source['Wave_Offset'],i1,i2+1,False)
+                wave_range=[int(Wave_Offset[0]),int(Wave_Offset[-1])]
+
+            value={}
+            for key in keys:
+
+                field=source[key]
+
+                if matlab_class(field)=='char':
+                    value[key]=[read_char(field)]
+                elif ((key=='f') or (key=='Band_Width')):
+                    value[key]=np.ravel(read_rows(field,0,1,False)) #Frequency is the same for all bursts
+                elif key in wave_ragged:
+                    value[key]=read_rows(field,wave_range[0],wave_range[1],False)
+                elif key=='Wave_Offset':
+                    value[key]=Wave_Offset-Wave_Offset[0]
+                else:
+                    value[key]=read_rows(field,i1,i2,False)
+
+    finally:
+        if file is not None:
+            file.close()
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return value
+
+    #--------------------------------------------------------------------------
@@ -0,0 +1,195 @@
+def MatWriteFun(FilePath,wave,version,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    MatWriteFun
+    ===========
+
+    .. code:: python
+
+        MatWriteFun(FilePath,wave,version,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Save OCEANLYZ results as a "wave" structure in a MATLAB file, with the same layout as results of MATLAB version of OCEANLYZ
+    | Results of each burst are rows, e.g. wave.Hm0 is a column vector and wave.Syy(i,:) is spectrum of burst i
+    | Frequency is repeated for each burst as wave.f(i,:), Field_Names is a character array
+    | Time stamps (numpy.datetime64) are saved as MATLAB serial date numbers (datenum)
+    | Multi-channel results are not saved, results of each channel should be saved separately
+    | Version 7.3 files are HDF5 files, large results are written in chunks of bursts, and MatReadFun reads a range of bursts without reading the rest
+    | Version 5 files are written by scipy.io.savemat in one step and compressed
+    | h5py package is required for version 7.3
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_results.mat'
+                                    Path of MATLAB file, existing file is replaced
+    wave=ocn.wave
+                                    OCEANLYZ results of single-channel data as a Python dictionary
+    version='7.3'
+                                    Version of MATLAB file
+                                        version='5': MATLAB version 5 file (load/save -v7 in MATLAB), variables smaller than 2 GB
+
+                                        version='7.3': MATLAB version 7.3 file (HDF5 based), for large results
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    MATLAB file that contains a structure named "wave"
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        MatWriteFun('oceanlyz_results.mat',ocn.wave,'7.3','on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import time
+
+    #--------------------------------------------------------------------------
+    #Results in the layout of MATLAB version of OCEANLYZ
+
+    #Multi-channel results have a channel axis that is not in the layout of MATLAB version of OCEANLYZ
+    wave_ragged=['H','T','Crest','Trough','Wave_Time'] #Wave-by-wave results
+    ndim_single={'Eta':2, 'Syy':2, 'Burst_Data':2} #Number of dimensions of single-channel results, others have 1 dimension
+    for key, value in wave.items():
+        if ((key=='Field_Names') or (key=='f') or (key=='Band_Width') or (key in wave_ragged)):
+            continue
+        if ((key=='Sxy') or (np.ndim(value)>ndim_single.get(key,1))):
+            raise ValueError('Multi-channel results can not be saved in a MATLAB file, results of each channel should be saved separately.')
+
+    #Number of bursts from spectrum for repeating frequency for each burst
+    if 'Syy' in wave:
+        n_burst=np.shape(wave['Syy'])[-2]
+    else:
+        n_burst=1
+
+    wave_matlab={}
+    for key, value in wave.items():
+
+        if key=='Field_Names':
+            wave_matlab[key]=str(value[0])
+            continue
+
+        value=np.asarray(value)
+
+        #Time stamps as MATLAB serial date number (days from year 0000)
+        if np.issubdtype(value.dtype,np.datetime64):
+            value=(value-np.datetime64('1970-01-01T00:00:00','ns'))/np.timedelta64(86400,'s')+719529
+
+        if ((key=='f') or (key=='Band_Width')) and (value.ndim==1):
+            value=np.broadcast_to(value,(n_burst,len(value))) #Frequency of each burst is a row
+        elif value.ndim==1:
+            value=value[:,None] #Column vector
+
+        wave_matlab[key]=value
+
+    #--------------------------------------------------------------------------
+    #Saving version 5 file
+
+    if version=='5':
+
+        import scipy as sp
+        from scipy import io
+
+        sp.io.savemat(FilePath,{'wave':wave_matlab},format='5',long_field_names=True,do_compression=True)
+
+    #--------------------------------------------------------------------------
+    #Saving version 7.3 (HDF5) file
+
+    elif version=='7.3':
+
+        import h5py
+
+        matlab_class={'float64':'double', 'float32':'single', 'int8':'int8', 'int16':'int16', 'int32':'int32', 'int64':'int64', 'uint8':'uint8', 'uint16':'uint16', 'uint32':'uint32', 'uint64':'uint64', 'bool':'logical'}
+
+        #MATLAB arrays are column-major, so dimensions are in reverse order in HDF5 file
+        def write_matlab(group,name,value):
+
+            if type(value) is str:
+                dataset=group.create_dataset(name,data=np.frombuffer(value.encode('utf-16-le'),dtype=np.uint16)[:,None])
+                dataset.attrs['MATLAB_class']=np.bytes_('char')
+                dataset.attrs['MATLAB_int_decode']=np.int32(2)
+                return
+
+            if value.size==0:
+                dataset=group.create_dataset(name,data=np.array(np.shape(value),dtype=np.uint64))
+                dataset.attrs['MATLAB_class']=np.bytes_(matlab_class[value.dtype.name])
+                dataset.attrs['MATLAB_empty']=np.uint8(1)
+                return
+
+            dtype=np.uint8 if value.dtype==bool else value.dtype
+            shape_hdf5=np.shape(value)[::-1]
+
+            #Chunks of about 1 MB with whole bursts (rows)
+            n_row_chunk=int(np.clip(2**20//(value[0].nbytes or 1),1,np.shape(value)[0]))
+            dataset=group.create_dataset(name,shape=shape_hdf5,dtype=dtype,chunks=shape_hdf5[:-1]+(n_row_chunk,))
+            dataset.attrs['MATLAB_class']=np.bytes_(matlab_class[value.dtype.name])
+            if value.dtype==bool:
+                dataset.attrs['MATLAB_int_decode']=np.int32(1)
+
+            #Writing blocks of about 64 MB, so large results are not copied at once
+            n_row_block=64*n_row_chunk
+            for i in range(0,np.shape(value)[0],n_row_block):
+                dataset[...,i:i+n_row_block]=np.asarray(value[i:i+n_row_block],dtype=dtype).T
+
+        with h5py.File(FilePath,'w',userblock_size=512) as file:
+
+            group=file.create_group('wave')
+            group.attrs['MATLAB_class']=np.bytes_('struct')
+            group.attrs['MATLAB_fields']=np.array([np.frombuffer(key.encode('ascii'),dtype='S1') for key in wave_matlab.keys()],dtype=h5py.vlen_dtype(np.dtype('S1')))
+
+            for key, value in wave_matlab.items():
+                write_matlab(group,key,value)
+
+        #MATLAB header in the first 128 bytes of user block
+        header='MATLAB 7.3 MAT-file, Platform: GLNXA64, Created on: '+time.strftime('%a %b %d %H:%M:%S %Y')+' HDF5 schema 1.00 .'
+        with open(FilePath,'r+b') as file:
+            file.write(header.encode('ascii').ljust(116,b' ')+bytes(8)+b'\x00\x02IM')
+
+    else:
+        raise ValueError('version should be \'5\' or \'7.3\'.')
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+        print('Results are saved in {}'.format(FilePath))
+
+    #--------------------------------------------------------------------------
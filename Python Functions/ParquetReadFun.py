@@ -0,0 +1,121 @@
+def ParquetReadFun(FilePath,columns,filters):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    ParquetReadFun
+    ==============
+
+    .. code:: python
+
+        table=ParquetReadFun(FilePath,columns,filters)
+
+    DESCRIPTION
+    -----------
+
+    | Read scalar results of bursts from a table that is written by ParquetWriteFun
+    | Only requested columns are read, and row groups that cannot match filters are skipped (predicate pushdown)
+    | Files in a folder can have different columns (e.g. from different analysis methods), missing values are NaN
+    | pyarrow package is required
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_statistics'
+                                    Path of folder (table) or Parquet file
+    columns=['Burst_Time','Hm0']
+                                    Names of columns to read
+                                        columns=[]: All columns
+    filters=[('Hm0','>',2)]
+                                    Conditions that rows should satisfy, as (column, operator, value)
+                                        Operator is '==', '!=', '<', '<=', '>', '>=', 'in', or 'not in'
+
+                                        filters=[(...),(...)]: Rows that satisfy all conditions
+
+                                        filters=[[(...),(...)],[(...)]]: Rows that satisfy all conditions of any of the lists
+
+                                        filters=[]: All rows
+
+    OUTPUT
+    ------
+
+    table
+                                    Python dictionary with a numpy array for each column
+                                        Time stamps are numpy.datetime64
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        import numpy as np
+        table=ParquetReadFun('oceanlyz_statistics',['Burst_Time','Hm0','Tp'],[('Burst_Time','>=',np.datetime64('2026-03-01')),('Hm0','>',2)])
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import os
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    #--------------------------------------------------------------------------
+    #Reading table
+
+    if len(columns)==0:
+        columns=None
+    #Time stamps in filters are converted to nanosecond (time unit of table)
+    def filter_value(value):
+        if isinstance(value,np.datetime64):
+            return value.astype('datetime64[ns]')
+        else:
+            return value
+
+    if len(filters)==0:
+        filters=None
+    elif isinstance(filters[0],tuple):
+        filters=[(name,op,filter_value(value)) for name,op,value in filters]
+    else:
+        filters=[[(name,op,filter_value(value)) for name,op,value in condition] for condition in filters]
+
+    #Columns of all files in a folder
+    if os.path.isdir(FilePath):
+        schema=pa.unify_schemas([pq.read_schema(PartPath) for PartPath in ds.dataset(FilePath,format='parquet').files])
+    else:
+        schema=None
+
+    table=pq.read_table(FilePath,columns=columns,filters=filters,schema=schema)
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return {name: table.column(name).to_numpy() for name in table.column_names}
+
+    #--------------------------------------------------------------------------
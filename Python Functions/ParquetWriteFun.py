@@ -0,0 +1,167 @@
+def ParquetWriteFun(FilePath,wave,burst_time,n_channel,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    ParquetWriteFun
+    ===============
+
+    .. code:: python
+
+        PartPath=ParquetWriteFun(FilePath,wave,burst_time,n_channel,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Save scalar results of each burst (such as Hm0, Tp, fp, Hs, Tz, fseparation) as a table in Apache Parquet format
+    | Each burst is a row with its time ('Burst_Time') and number ('Burst_Number'), and each result is a column with its own type
+    | If FilePath is a folder, results are added as a new file in the folder, so each run is appended to the table
+    | If FilePath is a file, results are added as new row groups after row groups that are already in the file (the file is written again)
+    | Row groups have min/max statistics, so ParquetReadFun reads only row groups that match its filters
+    | pyarrow package is required
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_statistics'
+                                    Path of folder (table) that results are added to, it is created if it does not exist
+                                        FilePath='C:\\oceanlyz_statistics.parquet': Results are added to this file, it is created if it does not exist
+    wave=ocn.wave
+                                    OCEANLYZ results as a Python dictionary, results with one value for each burst are saved
+    burst_time=ocn.wave['Burst_Start']
+                                    Time of first data point of each burst, in second or as numpy.datetime64
+    n_channel=0
+                                    Number of channels for multi-channel data (results have channel as their first axis)
+                                        n_channel=0: Data has one channel
+
+                                        n_channel>0: Each burst of each channel is a row with channel number in 'Channel'
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    PartPath
+                                    Path of file that is written
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        PartPath=ParquetWriteFun('oceanlyz_statistics',ocn.wave,ocn.wave['Burst_Start'],0,'on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import os
+    import time
+    import uuid
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    #--------------------------------------------------------------------------
+    #Time and number of each burst
+
+    burst_time=np.asarray(burst_time)
+    if np.issubdtype(burst_time.dtype,np.datetime64):
+        burst_time=burst_time.astype('datetime64[ns]')
+    n_burst=np.shape(burst_time)[-1] #Number of bursts
+    n_row_burst=max(n_channel,1) #Number of rows for each burst
+
+    #Each burst of each channel is a row, rows are in the order of bursts
+    columns={}
+    columns['Burst_Time']=np.ravel(np.broadcast_to(burst_time,(n_row_burst,n_burst)).T)
+    columns['Burst_Number']=np.repeat(np.arange(1,n_burst+1,1),n_row_burst)
+    if n_channel>0:
+        columns['Channel']=np.tile(np.arange(1,n_channel+1,1),n_burst)
+
+    #--------------------------------------------------------------------------
+    #Results with one value for each burst
+
+    for key, value in wave.items():
+
+        if ((key=='Field_Names') or (key=='Burst_Start') or (key=='Wave_Offset')):
+            continue
+
+        value=np.asarray(value)
+
+        if ((n_channel==0) and (np.shape(value)==(n_burst,))):
+            columns[key]=value
+        elif ((n_channel>0) and (np.shape(value)==(n_channel,n_burst))):
+            columns[key]=np.ravel(value.T)
+
+    table=pa.table(columns)
+    table=table.replace_schema_metadata({'Field_Names':str(wave['Field_Names'][0])})
+
+    #--------------------------------------------------------------------------
+    #Writing table
+
+    if FilePath.endswith('.parquet'):
+        PartPath=FilePath
+
+    else:
+        #Each run is a new file in the folder, file name is unique so several runs can write at the same time
+        os.makedirs(FilePath,exist_ok=True)
+        PartPath=os.path.join(FilePath,'part-{}-{}.parquet'.format(time.strftime('%Y%m%d%H%M%S'),uuid.uuid4().hex[0:8]))
+
+    #Write to a temporary file first (files starting with '.' are not read), so a table is never read while it is being written
+    TempPath=os.path.join(os.path.dirname(PartPath),'.'+os.path.basename(PartPath)+'.tmp')
+
+    if os.path.isfile(PartPath):
+
+        #Row groups that are already in the file are copied one by one, then results are added as new row groups
+        with pq.ParquetFile(PartPath) as file:
+
+            if not file.schema_arrow.equals(table.schema):
+                raise ValueError('Results are different from results in "{}" ({}).'.format(PartPath,', '.join(file.schema_arrow.names)))
+
+            with pq.ParquetWriter(TempPath,table.schema,compression='zstd') as writer:
+                for i in range(0,file.num_row_groups,1):
+                    writer.write_table(file.read_row_group(i))
+                writer.write_table(table,row_group_size=2**16)
+
+    else:
+        pq.write_table(table,TempPath,row_group_size=2**16,compression='zstd')
+
+    os.replace(TempPath,PartPath)
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+        print('{} row(s) are saved in {}'.format(table.num_rows,PartPath))
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return PartPath
+
+    #--------------------------------------------------------------------------
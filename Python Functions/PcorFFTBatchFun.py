@@ -0,0 +1,235 @@
+def PcorFFTBatchFun(input,fs,duration,nfft,h,heightfrombed,fminpcorr,fmaxpcorr,ftailcorrection,pressureattenuation,autofmaxpcorr,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    PcorFFTBatchFun
+    ===============
+
+    .. code:: python
+
+        Eta,ftailcorrection=PcorFFTBatchFun(input,fs,duration,nfft,h,heightfrombed,fminpcorr,fmaxpcorr,ftailcorrection,pressureattenuation,autofmaxpcorr,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Apply pressure correction factor to water depth data from several pressure gauges (channels) using FFT
+    | All channels are calculated together, results of each channel are the same as PcorFFTFun
+
+    INPUT
+    -----
+
+    input=importdata('h.mat')
+                                    Load water depth (h) data of all channels and rename it "input" in (m)
+                                        input[i,:] is data of channel i
+    fs=10
+                                    Sampling frequency that data collected at in (Hz)
+    duration=1024
+                                    Duration time that data collected in input in each burst in second
+    nfft=2^10
+                                    NFFT for Fast Fourier Transform
+    h=[1,1.2]
+                                    Mean water depth of each channel in (m)
+    heightfrombed=[0.0,0.1]
+                                    Sensor height from bed of each channel
+    fminpcorr=0.15
+                                    Minimum frequency that automated calculated fmaxpcorr can have if autofmaxpcorr='on' in (Hz)
+    fmaxpcorr=0.8
+                                    Maximum frequency for applying pressure attenuation factor
+    ftailcorrection=1
+                                    Frequency that diagnostic tail apply after that (typically set at 2.5fm, fm=1/Tm01)
+    pressureattenuation='all'
+                                    Define if to apply pressure attenuation factor or not
+                                        pressureattenuation='off': No pressure attenuation applied
+
+                                        pressureattenuation='on': Pressure attenuation applied without correction after fmaxpcorr
+
+                                        pressureattenuation='all': Pressure attenuation applied with constant correction after fmaxpcorr
+    autofmaxpcorr='on'
+                                    Define if to calculate fmaxpcorr and ftailcorrection based on water depth or not
+                                        autofmaxpcorr='off': Off
+
+                                        autofmaxpcorr='on': On
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    Eta
+                                    Corrected Water Surface Level Time Series (m), Eta[i,:] is for channel i
+    ftailcorrection
+                                    Frequency that diagnostic tail apply after that for each channel (Hz)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        Eta,ftailcorrection=PcorFFTBatchFun(water_pressure/(1000*9.81),10,1024,256,[1.07,1.12],[0.05,0.1],0.15,0.8,1,'all','on','on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import scipy as sp
+    from scipy import signal
+
+    if dispout=='on':
+        import matplotlib.pyplot as plt
+
+    #--------------------------------------------------------------------------
+    #Convert inputs to numpy array
+
+    input=np.atleast_2d(np.asarray(input,dtype=np.float64))
+    n_channel=np.shape(input)[0]
+    h=np.broadcast_to(np.asarray(h,dtype=np.float64),(n_channel,))
+    heightfrombed=np.broadcast_to(np.asarray(heightfrombed,dtype=np.float64),(n_channel,))
+
+    #--------------------------------------------------------------------------
+    #deterending
+
+    input1=sp.signal.detrend(input,axis=1,type='linear')
+
+    #--------------------------------------------------------------------------
+
+    sample=int(round(fs*duration)) #number of sample in input file
+    len_=sample
+
+    dt=1/fs #calculating delta t in second (dt=duration/sample)
+    t=np.linspace(dt,duration,sample) #time
+
+    #--------------------------------------------------------------------------
+
+    if (fmaxpcorr>fs/2) : fmaxpcorr=int(fs/2)
+
+    f=np.linspace(0,fs,len_) #frequency
+    w=2*np.pi*f #Angular frequency
+
+    #calculating Fast Fourier transform of all channels
+    FFTEta = np.fft.fft(input1,len_,axis=1)
+
+    Syy=np.zeros((n_channel,len_))
+    f1,Syy_half=sp.signal.welch(input1,fs=fs,nfft=len_,axis=1)
+    Syy[:,0:np.shape(Syy_half)[1]]=Syy_half.copy()
+
+    #Estimation of wave number (k) from Goad (2010) for all channels
+    k0=w**2/9.81 #Deep water wave number
+    k0h=k0[None,:]*h[:,None]
+    kh=np.where(k0h>=1,k0h,k0h**0.5)
+
+    with np.errstate(divide='ignore',invalid='ignore'):
+        for i in range(0,3,1):
+            kh=kh-((kh-k0h*(np.tanh(kh))**-1)/(1+k0h*((np.tanh(kh))**(-2)-1))) #Calculating wave number from Goda (2010)
+
+    k=kh/h[:,None] #Calculating wave number from Goda (2010)
+    k[:,w==0]=0
+
+    #Calculation of pressure response factor
+    Kp=np.cosh(k*heightfrombed[:,None])/np.cosh(k*h[:,None])
+    kmaxL=np.pi/(h-heightfrombed) # Wave number associated with fmaxpcorrL
+    KpminL=np.cosh(kmaxL*heightfrombed)/np.cosh(kmaxL*h) # Minimum Limit for K_p calculated based on linear wave theory
+    Kp=np.where(Kp<KpminL[:,None],KpminL[:,None],Kp) # Check to avoid large amplification, Kp should be larger than minimum K_p calculated based on linear wave theory
+
+    #fmaxpcorr and ftailcorrection of each channel
+    fmaxpcorr=np.full(n_channel,fmaxpcorr,dtype=np.float64)
+    ftailcorrection=np.full(n_channel,ftailcorrection,dtype=np.float64)
+
+    for j in range(0,n_channel,1):
+
+        #automatically estimating fmaxpcorr and ftailcorrection
+        if autofmaxpcorr=='on':
+
+            locfminpcorr=int(np.max((np.nonzero(f<=fminpcorr))[0])) #Locating the location of fminpcorr (fmaxpcorr should be larger than fminpcorr)
+            locSyymax=np.argmax(Syy[j,locfminpcorr:]) # Locating the peak frequency, fp, of original dataset
+
+            fmaxpcorrL=1/(2*np.pi)*np.sqrt(9.81*kmaxL[j]*np.tanh(kmaxL[j]*h[j])) # Maximum frequency that K_p can be applied, calculated from linear wave theory
+            locfmaxpcorrL=int(np.max((np.nonzero(f<=fmaxpcorrL))[0])) #Location the location of fmaxpcorr1
+            if (locfmaxpcorrL<locfminpcorr+(locSyymax)): locfmaxpcorrL=locfminpcorr+(locSyymax) #Check if locfmaxpcorrL locataed after fp
+
+            Syy1=Syy[j,:]/(Kp[j,:]**2)
+
+            locSyymin=np.argmin(Syy1[locfminpcorr+(locSyymax):locfmaxpcorrL+1]) #Locating the location of minimum value for Syy between fp and fmaxpcorr1
+
+            fmaxpcorr1=f[locfminpcorr+(locSyymax)+(locSyymin)] #Asigning the frequency of the location of minimum value for Syy between fp and fmaxpcorr1
+            ftailcorrection1=f[locfminpcorr+(locSyymax)+(locSyymin)]
+
+            if (fmaxpcorr1>fmaxpcorrL): fmaxpcorr1=fmaxpcorrL #Check fmaxpcorr1 be smaller than fmaxpcorrL
+            if ((fmaxpcorr1==f[locfminpcorr+(locSyymax)]) and (fmaxpcorrL>f[locfminpcorr+(locSyymax)])): fmaxpcorr1=fmaxpcorrL #if fmaxpcorrL>fp then fmaxpcorr1 should not be equal to fp
+            if (ftailcorrection1>fmaxpcorrL): ftailcorrection1=fmaxpcorrL
+
+            if (fmaxpcorr[j]>fmaxpcorr1): fmaxpcorr[j]=fmaxpcorr1
+            if (ftailcorrection[j]>ftailcorrection1): ftailcorrection[j]=ftailcorrection1
+
+        if pressureattenuation=='off':
+            Kp[j,0:]=1
+
+        elif pressureattenuation=='on':
+            Kp[j,f>fmaxpcorr[j]]=1 # correction factor larger than fmaxpcorr should be 1 (no correction)
+
+            # linear decrease of correction for f larger than maximum frequency
+            loc1=int(np.max((np.nonzero(f<=fmaxpcorr[j]-0.05))[0]))
+            loc2=int(np.max((np.nonzero(f<=fmaxpcorr[j]+0.05))[0]))
+            if (loc2>len(f)): loc2=len(f)
+            for i in range(loc1,loc2+1,1):
+                Kp[j,i]=(Kp[j,loc2]-Kp[j,loc1])/(loc2-loc1)*(i-loc1)+Kp[j,loc1]
+
+        elif pressureattenuation=='all':
+            loc2=int(np.max((np.nonzero(f<=fmaxpcorr[j]))[0]))
+            if (loc2>len(f)): loc2=len(f)
+            Kp[j,f>fmaxpcorr[j]]=Kp[j,loc2] # correction factor larger than fmaxpcorr stays constant
+
+    Kp1=Kp[:,0:len_-int(len_/2)] #For odd len_, middle value is also included
+    Kp1=np.flip(Kp1,axis=1)
+    Kp[:,int(len_/2):]=Kp1 #make Kp symetric around fr/2
+
+    #correcting pressure
+    FFTEtacor= FFTEta/Kp			    # applies corection factor
+    Eta = np.real(np.fft.ifft(FFTEtacor,len_,axis=1))	# corected water surface levels time series
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+
+        for j in range(0,n_channel,1):
+            plt.plot(t,Eta[j,:],label='Corrected Water Level, Channel '+str(j+1))
+
+        plt.xlim(t[0], t[-1])
+        plt.title('Water Level')
+        plt.xlabel('Time(s)')
+        plt.ylabel('\\eta(m)')
+        plt.legend()
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return Eta, ftailcorrection
+
+    #--------------------------------------------------------------------------
@@ -113,7 +113,7 @@ def PcorFFTFun(input,fs,duration,nfft,h,heightfrombed,fminpcorr,fmaxpcorr,ftailc
                     variable=np.array([variable])
             elif np.size(variable)>1:
                 if (type(variable).__module__)!='numpy':
-                    variable=np.array(variable) 
+                    variable=np.asarray(variable) #No copy for buffer-protocol and Arrow arrays
         return variable
     
     input=type2numpy(input)
@@ -125,7 +125,7 @@ def PcorFFTFun(input,fs,duration,nfft,h,heightfrombed,fminpcorr,fmaxpcorr,ftailc
 
     #--------------------------------------------------------------------------
 
-    sample=fs*duration #number of sample in input file
+    sample=int(round(fs*duration)) #number of sample in input file
     len_=sample
     # h=np.mean(input) #mean water depth in (m)
     # h[h<=0]=0.001
@@ -216,7 +216,7 @@ def PcorFFTFun(input,fs,duration,nfft,h,heightfrombed,fminpcorr,fmaxpcorr,ftailc
         Kp[f>fmaxpcorr]=Kp[loc2] # correction factor larger than fmaxpcorr stays constant
 
 
-    Kp1=Kp[0:int(len_/2)]
+    Kp1=Kp[0:len_-int(len_/2)] #For odd len_, middle value is also included
     Kp1=np.flipud(Kp1)
     Kp[int(len_/2):]=Kp1 #make Kp symetric around fr/2
 
@@ -93,14 +93,14 @@ def PcorZerocrossingFun(input,fs,duration,h,heightfrombed,dispout):
                     variable=np.array([variable])
             elif np.size(variable)>1:
                 if (type(variable).__module__)!='numpy':
-                    variable=np.array(variable) 
+                    variable=np.asarray(variable) #No copy for buffer-protocol and Arrow arrays
         return variable
     
     input=type2numpy(input)
 
     #--------------------------------------------------------------------------
 
-    sample=duration*fs #number of sample in input file
+    sample=int(round(duration*fs)) #number of sample in input file
     dt=1/fs #calculating delta t in second (dt=duration/sample)
     t=np.linspace(dt,duration,sample) #time
     len_=len(t)
@@ -0,0 +1,151 @@
+def ProjectReadFun(FilePath,key,row_range):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    ProjectReadFun
+    ==============
+
+    .. code:: python
+
+        value=ProjectReadFun(FilePath,key,row_range)
+
+    DESCRIPTION
+    -----------
+
+    | Read properties or one array from a project file that is written by ProjectWriteFun
+    | Properties are read from text at start of file without reading arrays
+    | File is memory-mapped and only chunks that contain requested rows are decompressed
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_project.ocnz'
+                                    Path of project file
+    key='wave.Hm0'
+                                    Name of array, 'data', an OCEANLYZ property saved as array (e.g. 'time'), or 'wave.' and name of result
+                                        key='properties': OCEANLYZ properties as a Python dictionary
+
+                                        key='arrays': Names of arrays in project file
+    row_range=[0,100]
+                                    Index of first row and index after last row to read (rows of results are bursts)
+                                        row_range=[]: All rows
+
+    OUTPUT
+    ------
+
+    value
+                                    Properties, names of arrays, or rows of array in row_range
+                                        'wave.Field_Names' is a list of one string as in OCEANLYZ results
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        properties=ProjectReadFun('oceanlyz_project.ocnz','properties',[])
+        Syy=ProjectReadFun('oceanlyz_project.ocnz','wave.Syy',[10,20])
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import json
+    import zlib
+    import mmap
+    import struct
+
+    #--------------------------------------------------------------------------
+    #Properties from text at start of file
+
+    if key=='properties':
+
+        properties={}
+        with open(FilePath,'rb') as file:
+            file.readline() #'#OCEANLYZ project'
+            file.readline() #'#------'
+            for line in file:
+                line=line.decode('utf-8')
+                if line.startswith('#'):
+                    break
+                name, value=line.split(' = ',1)
+                properties[name]=json.loads(value)
+
+        return properties
+
+    #--------------------------------------------------------------------------
+    #Arrays
+
+    with open(FilePath,'rb') as file, mmap.mmap(file.fileno(),0,access=mmap.ACCESS_READ) as buffer:
+
+        #Index of chunks at end of file
+        if buffer[-4:]!=b'OCNZ':
+            raise ValueError('{} is not an OCEANLYZ project file.'.format(FilePath))
+        index_offset=struct.unpack('<Q',buffer[-12:-4])[0]
+        index=json.loads(buffer[index_offset:-12].decode('utf-8'))
+
+        if key=='arrays':
+            return list(index.keys())
+
+        dtype=np.dtype(index[key]['dtype'])
+        shape=tuple(index[key]['shape'])
+        n_row_chunk=index[key]['n_row_chunk']
+        n_row=shape[0] if len(shape)>0 else 1
+
+        if len(row_range)==0:
+            row_range=[0,n_row]
+        i1,i2=int(row_range[0]),int(min(row_range[1],n_row))
+
+        #Decompressing chunks that contain rows i1 to i2
+        value=np.empty((max(0,i2-i1),)+shape[1:],dtype=dtype)
+        with memoryview(buffer) as view:
+            for j in range(i1//n_row_chunk,(i2+n_row_chunk-1)//n_row_chunk,1):
+
+                offset,length=index[key]['chunks'][j]
+                chunk=np.frombuffer(zlib.decompress(view[offset:offset+length]),dtype=np.uint8)
+                chunk=np.reshape(chunk,(dtype.itemsize,-1)).T.copy().view(dtype) #Reverse of byte shuffle
+                chunk=np.reshape(chunk,(-1,)+shape[1:])
+
+                j1=max(i1,j*n_row_chunk) #First row from this chunk
+                j2=min(i2,(j+1)*n_row_chunk) #Row after last row from this chunk
+                value[j1-i1:j2-i1]=chunk[j1-j*n_row_chunk:j2-j*n_row_chunk]
+
+    if len(shape)==0:
+        value=value[0]
+
+    #Field names as in OCEANLYZ results
+    if dtype.kind=='U':
+        value=[str(name) for name in np.ravel(value)]
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return value
+
+    #--------------------------------------------------------------------------
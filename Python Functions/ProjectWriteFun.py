@@ -0,0 +1,147 @@
+def ProjectWriteFun(FilePath,properties,data,wave):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    ProjectWriteFun
+    ===============
+
+    .. code:: python
+
+        ProjectWriteFun(FilePath,properties,data,wave)
+
+    DESCRIPTION
+    -----------
+
+    | Save OCEANLYZ properties, data, and results as a project file
+    | Properties are saved first as text lines ('name = value', value in JSON), so they can be read without reading arrays
+    | Arrays are split into chunks of rows (about 1 MB), bytes of values are shuffled and each chunk is compressed by zlib
+    | Index of chunks is saved at end of file, ProjectReadFun reads only chunks of requested rows
+    | 'Burst_Data' is not saved, it is a copy of data
+
+    INPUT
+    -----
+
+    FilePath='C:\\oceanlyz_project.ocnz'
+                                    Path of project file, existing file is replaced
+    properties=ocn.__dict__
+                                    OCEANLYZ properties as a Python dictionary ('data' and 'wave' are not used)
+                                        numpy arrays (e.g. 'time') are saved as arrays, functions (e.g. 'progress') are not saved
+    data=ocn.data
+                                    Input data
+    wave=ocn.wave
+                                    OCEANLYZ results as a Python dictionary
+
+    OUTPUT
+    ------
+
+    Project file
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        ProjectWriteFun('oceanlyz_project.ocnz',ocn.__dict__,ocn.data,ocn.wave)
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import os
+    import json
+    import zlib
+    import struct
+
+    #--------------------------------------------------------------------------
+    #Properties and arrays
+
+    properties_text={}
+    arrays={'data':np.asarray(data)}
+
+    for name, value in properties.items():
+        if ((name=='data') or (name=='wave')):
+            continue
+        elif type(value) is np.ndarray:
+            arrays[name]=value
+        elif callable(value):
+            continue #Functions such as progress are not saved
+        else:
+            properties_text[name]=json.dumps(value,default=lambda v: v.item() if isinstance(v,np.generic) else str(v))
+
+    for key, value in wave.items():
+        if key!='Burst_Data':
+            arrays['wave.'+key]=np.asarray(value)
+
+    #--------------------------------------------------------------------------
+    #Writing project file
+
+    FilePath_tmp=FilePath+'.tmp'
+    with open(FilePath_tmp,'wb') as file:
+
+        #Properties as text
+        file.write(b'#OCEANLYZ project\n')
+        file.write(b'#--------------------------------------\n')
+        for name, value in properties_text.items():
+            file.write('{} = {}\n'.format(name,value).encode('utf-8'))
+        file.write(b'#--------------------------------------\n')
+
+        #Arrays as compressed chunks of rows
+        index={}
+        for name, value in arrays.items():
+
+            value=np.ascontiguousarray(value)
+            shape=np.shape(value) if value.ndim>0 else (1,)
+            value=np.reshape(value,shape)
+
+            row_nbytes=max(1,value[0:1].nbytes) if shape[0]>0 else 1
+            n_row_chunk=int(max(1,2**20//row_nbytes)) #Number of rows in each chunk
+
+            chunks=[]
+            for i in range(0,shape[0],n_row_chunk):
+
+                #Bytes of values are shuffled (first bytes of all values, then second bytes, ...), so values compress better
+                chunk=np.frombuffer(value[i:i+n_row_chunk].tobytes(),dtype=np.uint8)
+                chunk=np.reshape(chunk,(-1,value.dtype.itemsize)).T.tobytes()
+
+                compressed=zlib.compress(chunk,6)
+                chunks.append([file.tell(),len(compressed)])
+                file.write(compressed)
+
+            index[name]={'dtype':value.dtype.str, 'shape':list(np.shape(arrays[name])), 'n_row_chunk':n_row_chunk, 'chunks':chunks}
+
+        #Index of chunks and its location at end of file
+        index_offset=file.tell()
+        file.write(json.dumps(index).encode('utf-8'))
+        file.write(struct.pack('<Q',index_offset)+b'OCNZ')
+
+    os.replace(FilePath_tmp,FilePath)
+
+    #--------------------------------------------------------------------------
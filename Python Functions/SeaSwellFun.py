@@ -139,7 +139,7 @@ def SeaSwellFun(input,fs,duration,nfft,h,fmin,fmax,ftailcorrection,tailpower,fmi
                     variable=np.array([variable])
             elif np.size(variable)>1:
                 if (type(variable).__module__)!='numpy':
-                    variable=np.array(variable) 
+                    variable=np.asarray(variable) #No copy for buffer-protocol and Arrow arrays
         return variable
     
     input=type2numpy(input)
@@ -0,0 +1,160 @@
+def SpectrumBandFun(f,Syy,fband,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    SpectrumBandFun
+    ===============
+
+    .. code:: python
+
+        fcenter,Sband,fwidth=SpectrumBandFun(f,Syy,fband,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Average power spectral density of all bursts in frequency bands (such as octave or one-third octave bands)
+    | Averaging is done by a sparse matrix that is calculated once and applied to all bursts together
+    | Each frequency is assigned to the band that contains it, and zero-moment (m0) is preserved: sum(Sband*fwidth)=sum(Syy*deltaf)
+    | Bands without any frequency are removed
+
+    INPUT
+    -----
+
+    f
+                                    Frequency (Hz), the same for all bursts
+    Syy
+                                    Power spectral density (m^2s), Syy[...,i] is spectrum at f[i], e.g. with shape (n_burst, len(f))
+                                    Complex cross power spectral density is also accepted and is averaged the same way
+    fband='third-octave'
+                                    Frequency bands
+                                        fband='octave': Base-10 octave bands, center frequencies are 10^(3k/10) (Hz)
+
+                                        fband='third-octave': Base-10 one-third octave bands, center frequencies are 10^(k/10) (Hz)
+
+                                        fband=[0.05,0.1,0.2,0.4]: Edges of bands (Hz), e.g. np.geomspace(0.05,1,21) for 20 log-spaced bands
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    fcenter
+                                    Center frequency of each band (Hz), geometric mean of band edges
+    Sband
+                                    Band-averaged power spectral density (m^2s), with the same shape as Syy except its last axis has len(fcenter) values
+    fwidth
+                                    Width of each band (Hz)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        fcenter,Sband,fwidth=SpectrumBandFun(wave['f'],wave['Syy'],'third-octave','on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import scipy as sp
+    from scipy import sparse
+
+    if dispout=='on':
+        import matplotlib.pyplot as plt
+
+    #--------------------------------------------------------------------------
+    #Convert inputs to numpy array
+
+    f=np.ravel(np.asarray(f,dtype=np.float64))
+    Syy=np.asarray(Syy)
+    Syy=Syy.astype(np.complex128 if np.iscomplexobj(Syy) else np.float64) #Complex cross spectra are averaged as well
+
+    deltaf=f[1]-f[0]
+
+    #--------------------------------------------------------------------------
+    #Band edges
+
+    if ((type(fband) is str) and ((fband=='octave') or (fband=='third-octave'))):
+
+        #Base-10 bands cover all positive frequencies
+        if fband=='octave':
+            bandratio=3/10 #Octave band, ratio of two consecutive center frequencies is 10^(3/10)
+        else:
+            bandratio=1/10 #One-third octave band, ratio of two consecutive center frequencies is 10^(1/10)
+
+        fpositive=f[f>0]
+        kmin=int(np.floor(np.log10(fpositive[0])/bandratio-0.5))
+        kmax=int(np.ceil(np.log10(fpositive[-1])/bandratio+0.5))
+        fedge=10**((np.arange(kmin,kmax+1,1)+0.5)*bandratio)
+
+    else:
+        fedge=np.ravel(np.asarray(fband,dtype=np.float64))
+
+    #--------------------------------------------------------------------------
+    #Sparse averaging matrix, Sband=Syy*deltaf/fwidth summed over frequencies in each band
+
+    band=np.searchsorted(fedge,f,side='right')-1 #Band that each frequency belongs to
+    inband=((band>=0) & (band<len(fedge)-1))
+
+    #Removing bands without any frequency
+    bandused,band_number=np.unique(band[inband],return_inverse=True)
+    fwidth=fedge[bandused+1]-fedge[bandused]
+    fcenter=np.sqrt(fedge[bandused+1]*fedge[bandused])
+
+    averaging_matrix=sp.sparse.csr_matrix((deltaf/fwidth[band_number],(band_number,np.nonzero(inband)[0])),shape=(len(bandused),len(f)))
+
+    #--------------------------------------------------------------------------
+    #Averaging spectra of all bursts together
+
+    Syy2d=np.reshape(Syy,(-1,len(f)))
+    Sband=np.asarray((averaging_matrix@Syy2d.T).T)
+    Sband=np.reshape(Sband,np.shape(Syy)[:-1]+(len(bandused),))
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+
+        Syy_mean=np.mean(Syy2d,axis=0)
+        Sband_mean=np.mean(np.reshape(Sband,(-1,len(bandused))),axis=0)
+        plt.loglog(f[f!=0],Syy_mean[f!=0],label='Spectrum')
+        plt.loglog(fcenter,Sband_mean,'o-',label='Band-averaged spectrum')
+
+        plt.title('Power Spectral Density (Mean of Bursts)')
+        plt.xlabel('Frequency(Hz)')
+        plt.ylabel('Spectral Density(m^2s)')
+        plt.legend()
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return fcenter, Sband, fwidth
+
+    #--------------------------------------------------------------------------
@@ -0,0 +1,152 @@
+def WaveArrowFun(wave,burst_time,n_channel):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    WaveArrowFun
+    ============
+
+    .. code:: python
+
+        batch=WaveArrowFun(wave,burst_time,n_channel)
+
+    DESCRIPTION
+    -----------
+
+    | Export results of all bursts as an Apache Arrow record batch that shares memory with numpy arrays in wave (zero-copy)
+    | Each burst is a row with its time ('Burst_Time') and number ('Burst_Number')
+    | Results with one value for each burst are columns, spectra (e.g. Syy) and burst data are fixed-size list columns
+    | Wave-by-wave results (wave_by_wave='yes') are list columns, waves of each burst are in its row
+    | For multi-channel data, rows are in the order of channels ('Channel'), so results of all channels are one after another as in wave
+    | Frequency 'f' is kept in schema metadata
+    | Only new columns ('Burst_Number', 'Channel') and arrays that are not contiguous in memory are copied
+    | pyarrow package is required
+
+    INPUT
+    -----
+
+    wave=ocn.wave
+                                    OCEANLYZ results as a Python dictionary
+    burst_time=ocn.wave['Burst_Start']
+                                    Time of first data point of each burst, in second or as numpy.datetime64
+    n_channel=0
+                                    Number of channels for multi-channel data (results have channel as their first axis)
+                                        n_channel=0: Data has one channel
+
+                                        n_channel>0: Each burst of each channel is a row with channel number in 'Channel'
+
+    OUTPUT
+    ------
+
+    batch
+                                    pyarrow.RecordBatch with one row for each burst (of each channel)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        batch=WaveArrowFun(ocn.wave,ocn.wave['Burst_Start'],0)
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import pyarrow as pa
+
+    #--------------------------------------------------------------------------
+    #Arrow array that uses memory of numpy array
+
+    def numpy2arrow(value):
+
+        value=np.ascontiguousarray(value) #No copy if array is already contiguous
+        if np.issubdtype(value.dtype,np.datetime64) and (np.datetime_data(value.dtype)[0] not in ['s','ms','us','ns']):
+            value=value.astype('datetime64[ns]')
+
+        #Boolean values are saved as bits in Arrow and need to be copied
+        if value.dtype==bool:
+            return pa.array(np.ravel(value))
+
+        return pa.Array.from_buffers(pa.from_numpy_dtype(value.dtype),value.size,[None,pa.py_buffer(value)])
+
+    #--------------------------------------------------------------------------
+    #Time and number of each burst
+
+    burst_time=np.asarray(burst_time)
+    n_burst=np.shape(burst_time)[-1] #Number of bursts
+    n_row_channel=max(n_channel,1) #Number of channels in rows
+
+    #Each burst of each channel is a row, rows are in the order of channels
+    columns={}
+    columns['Burst_Time']=numpy2arrow(np.broadcast_to(burst_time,(n_row_channel,n_burst)))
+    columns['Burst_Number']=numpy2arrow(np.tile(np.arange(1,n_burst+1,1),n_row_channel))
+    if n_channel>0:
+        columns['Channel']=numpy2arrow(np.repeat(np.arange(1,n_channel+1,1),n_burst))
+
+    shape_row=(n_channel,n_burst) if n_channel>0 else (n_burst,) #Shape of results with one value for each row
+
+    #--------------------------------------------------------------------------
+    #Results
+
+    metadata={'Field_Names':str(wave['Field_Names'][0])}
+
+    for key, value in wave.items():
+
+        if ((key=='Field_Names') or (key=='Burst_Start') or (key=='Wave_Offset')):
+            continue
+
+        value=np.asarray(value)
+
+        if key=='f':
+            metadata['f']=','.join(['{:.17g}'.format(f) for f in np.ravel(value)[0:np.shape(value)[-1]]])
+
+        #Results with one value for each row
+        elif np.shape(value)==shape_row:
+            columns[key]=numpy2arrow(value)
+
+        #Spectra and burst data, values of each row are a fixed-size list
+        elif ((np.ndim(value)>len(shape_row)) and (np.shape(value)[0:len(shape_row)]==shape_row)):
+            columns[key]=pa.FixedSizeListArray.from_arrays(numpy2arrow(value),int(np.prod(np.shape(value)[len(shape_row):])))
+
+    #Wave-by-wave results, waves of each row are a list
+    if 'Wave_Offset' in wave:
+
+        #Last wave of each channel is the first wave of next channel
+        Wave_Offset=np.atleast_2d(wave['Wave_Offset'])
+        row_offset=pa.array(np.append(np.ravel(Wave_Offset[:,0:-1]),Wave_Offset[-1,-1]),type=pa.int64())
+
+        for key in ['H','T','Crest','Trough','Wave_Time']:
+            columns[key]=pa.LargeListArray.from_arrays(row_offset,numpy2arrow(wave[key]))
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return pa.RecordBatch.from_arrays(list(columns.values()),names=list(columns.keys())).replace_schema_metadata(metadata)
+
+    #--------------------------------------------------------------------------
@@ -0,0 +1,192 @@
+def WaveByWaveFun(input,offset,statistic):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    WaveByWaveFun
+    =============
+
+    .. code:: python
+
+        output=WaveByWaveFun(input,offset,statistic)
+
+    DESCRIPTION
+    -----------
+
+    | Access wave-by-wave results (such as wave heights 'H' and wave periods 'T') that are saved in a ragged layout
+    | Values of all bursts are saved in one flat array, values of burst i are input[offset[i]:offset[i+1]]
+    | Statistics of all bursts are calculated together by numpy.ufunc.reduceat without a loop over bursts
+    | Statistics of bursts without any wave are NaN (number and sum of waves are zero)
+
+    INPUT
+    -----
+
+    input=wave['H']
+                                    Wave-by-wave values of all bursts as a flat array
+    offset=wave['Wave_Offset']
+                                    Index of first wave of each burst, with n_burst+1 values (last value is index after last wave)
+                                        For multi-channel data, offset has a shape of (n_channel, n_burst+1)
+    statistic='max'
+                                    Output that is calculated
+                                        statistic='split': List of values of each burst (views of input, no copy)
+
+                                        statistic='burst': Burst number of each wave
+
+                                        statistic='count': Number of waves in each burst
+
+                                        statistic='sum': Sum of values in each burst
+
+                                        statistic='mean': Mean of values in each burst
+
+                                        statistic='rms': Root mean square of values in each burst
+
+                                        statistic='max': Maximum value in each burst (e.g. maximum wave height, Hmax)
+
+                                        statistic='min': Minimum value in each burst
+
+                                        statistic='onethird': Mean of highest one-third of values in each burst (e.g. significant wave height, H1/3), the same as Hs from WaveZerocrossingFun
+
+    OUTPUT
+    ------
+
+    output
+                                    Statistic of each burst with a shape of (n_burst) or (n_channel, n_burst)
+                                        For statistic='split', list of arrays (a list for each channel for multi-channel data)
+
+                                        For statistic='burst', array with the same length as input
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        Hmax=WaveByWaveFun(wave['H'],wave['Wave_Offset'],'max')
+        H13=WaveByWaveFun(wave['H'],wave['Wave_Offset'],'onethird')
+        H_burst=WaveByWaveFun(wave['H'],wave['Wave_Offset'],'split')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+
+    #--------------------------------------------------------------------------
+    #Convert inputs to numpy array
+
+    input=np.ravel(np.asarray(input))
+    offset=np.asarray(offset,dtype=np.int64)
+
+    n_burst=np.shape(offset)[-1]-1 #Number of bursts
+    offset2d=np.reshape(offset,(-1,n_burst+1)) #One row for each channel
+    output_shape=np.shape(offset)[:-1]+(n_burst,)
+
+    start=np.ravel(offset2d[:,:-1]) #Index of first wave of each burst
+    count=np.ravel(np.diff(offset2d,axis=1)) #Number of waves in each burst
+
+    if np.any(count<0):
+        raise ValueError('offset should be increasing.')
+
+    #--------------------------------------------------------------------------
+    #Values of each burst
+
+    if statistic=='split':
+
+        output=[np.split(input[offset_j[0]:offset_j[-1]],offset_j[1:-1]-offset_j[0]) for offset_j in offset2d]
+        if np.ndim(offset)==1:
+            output=output[0]
+
+        return output
+
+    if statistic=='burst':
+
+        output=np.repeat(np.tile(np.arange(0,n_burst,1),np.shape(offset2d)[0]),count)
+
+        return output
+
+    #--------------------------------------------------------------------------
+    #Values of all bursts one after another, values of burst i are value[first[i]:first[i]+count[i]]
+
+    first=np.cumsum(count)-count #Index of first wave of each burst in value
+    value=input[np.arange(0,np.sum(count),1)+np.repeat(start-first,count)]
+    empty=(count==0)
+
+    #Sorting values of each burst from largest to smallest
+    if statistic=='onethird':
+
+        burst_number=np.repeat(np.arange(0,len(count),1),count)
+        value=value[np.lexsort((-value,burst_number))]
+
+        #Keep highest one-third of values in each burst, number of kept values is the same as Hs in WaveZerocrossingFun
+        count=np.where(count>0,count//3+1,0)
+        empty=(count==0)
+        value=np.where(np.arange(0,len(value),1)-first[burst_number]<count[burst_number],value,0)
+
+    #Start and stop index of each burst one after another, reduceat of a pair of (start, stop) is over value[start:stop]
+    #A zero is added at the end, so index can be equal to number of waves
+    value=np.append(value,np.zeros(1,dtype=value.dtype))
+    index=np.ravel(np.column_stack((first,first+count)))
+
+    #--------------------------------------------------------------------------
+    #Calculating statistic of each burst
+
+    with np.errstate(divide='ignore',invalid='ignore'):
+
+        if statistic=='count':
+            output=count.astype(np.int64)
+
+        elif statistic=='sum':
+            output=np.add.reduceat(value,index,dtype=np.float64)[::2]
+            output[empty]=0
+
+        elif ((statistic=='mean') or (statistic=='onethird')):
+            output=np.add.reduceat(value,index,dtype=np.float64)[::2]/count
+            output[empty]=np.nan
+
+        elif statistic=='rms':
+            output=np.sqrt(np.add.reduceat(value.astype(np.float64)**2,index)[::2]/count)
+            output[empty]=np.nan
+
+        elif statistic=='max':
+            output=np.maximum.reduceat(value,index)[::2].astype(np.float64)
+            output[empty]=np.nan
+
+        elif statistic=='min':
+            output=np.minimum.reduceat(value,index)[::2].astype(np.float64)
+            output[empty]=np.nan
+
+        else:
+            raise ValueError('statistic should be \'split\', \'burst\', \'count\', \'sum\', \'mean\', \'rms\', \'max\', \'min\', or \'onethird\'.')
+
+    output=np.reshape(output,output_shape)
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return output
+
+    #--------------------------------------------------------------------------
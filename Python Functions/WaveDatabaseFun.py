@@ -0,0 +1,167 @@
+def WaveDatabaseFun(DatabasePath,wave,burst_time,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    WaveDatabaseFun
+    ===============
+
+    .. code:: python
+
+        burst_id=WaveDatabaseFun(DatabasePath,wave,burst_time,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Add wave-by-wave results of zero-crossing method to a SQLite database
+    | Database has a 'burst' table (burst_id, time, channel, n_wave, Hs, Hz, Tz, Ts) and a 'wave' table (burst_id, time, H, T, crest, trough)
+    | 'wave' table has indexes on time and H, and 'burst' table has an index on time, so waves can be selected without recalculating bursts
+    | All rows are added in one transaction with bulk inserts, and results of later runs are added after existing rows
+
+    INPUT
+    -----
+
+    DatabasePath='C:\\oceanlyz_waves.sqlite'
+                                    Path of SQLite database file, it is created if it does not exist
+    wave=ocn.wave
+                                    OCEANLYZ results with wave_by_wave='yes' or wave_by_wave='float32'
+                                        wave should contain 'Hs', 'Hz', 'Tz', 'Ts', 'H', 'T', 'Crest', 'Trough', 'Wave_Time', and 'Wave_Offset'
+    burst_time=ocn.wave['Burst_Start']
+                                    Time of first data point of each burst, in second or as numpy.datetime64
+                                        numpy.datetime64 is saved as seconds from 1970-01-01
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    burst_id
+                                    Identifier of each burst in database with a shape of (n_burst) or (n_channel, n_burst)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        burst_id=WaveDatabaseFun('oceanlyz_waves.sqlite',ocn.wave,ocn.wave['Burst_Start'],'on')
+
+        #Waves with H>2*Hs in March 2026
+        import sqlite3
+        import numpy as np
+        t1=(np.datetime64('2026-03-01')-np.datetime64('1970-01-01'))/np.timedelta64(1,'s')
+        t2=(np.datetime64('2026-04-01')-np.datetime64('1970-01-01'))/np.timedelta64(1,'s')
+        with sqlite3.connect('oceanlyz_waves.sqlite') as connection:
+            rows=connection.execute('SELECT wave.* FROM wave JOIN burst USING (burst_id) WHERE wave.time>=? AND wave.time<? AND wave.H>2*burst.Hs',(t1,t2)).fetchall()
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import sqlite3
+
+    #--------------------------------------------------------------------------
+    #Bursts and waves
+
+    offset=np.asarray(wave['Wave_Offset'],dtype=np.int64)
+    n_burst=np.shape(offset)[-1]-1 #Number of bursts
+    offset2d=np.reshape(offset,(-1,n_burst+1)) #One row for each channel
+    n_channel=np.shape(offset2d)[0] #Number of channels
+
+    start=np.ravel(offset2d[:,:-1]) #Index of first wave of each burst
+    count=np.ravel(np.diff(offset2d,axis=1)) #Number of waves in each burst
+
+    #Time of each burst in second
+    burst_time=np.asarray(burst_time)
+    if np.issubdtype(burst_time.dtype,np.datetime64):
+        burst_time=(burst_time-np.datetime64('1970-01-01T00:00:00'))/np.timedelta64(1,'s')
+    burst_time=np.ravel(np.broadcast_to(burst_time.astype(np.float64),(n_channel,n_burst)))
+
+    channel=np.repeat(np.arange(0,n_channel,1),n_burst)
+
+    #Index of waves of all bursts one after another, and burst that each wave belongs to
+    first=np.cumsum(count)-count
+    wave_index=np.arange(0,np.sum(count),1)+np.repeat(start-first,count)
+    wave_burst=np.repeat(np.arange(0,len(count),1),count)
+
+    #--------------------------------------------------------------------------
+    #Adding bursts and waves to database
+
+    batch=100000 #Number of rows in each bulk insert
+
+    connection=sqlite3.connect(DatabasePath)
+
+    try:
+
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+
+        #One transaction for all rows
+        with connection:
+
+            connection.execute('CREATE TABLE IF NOT EXISTS burst (burst_id INTEGER PRIMARY KEY, time REAL, channel INTEGER, n_wave INTEGER, Hs REAL, Hz REAL, Tz REAL, Ts REAL)')
+            connection.execute('CREATE TABLE IF NOT EXISTS wave (burst_id INTEGER, time REAL, H REAL, T REAL, crest REAL, trough REAL)')
+
+            #Identifier of bursts continues after bursts of previous runs
+            first_id=connection.execute('SELECT COALESCE(MAX(burst_id),0)+1 FROM burst').fetchone()[0]
+            burst_id=first_id+np.arange(0,len(count),1)
+
+            burst_rows=zip(burst_id.tolist(),burst_time.tolist(),channel.tolist(),count.tolist(),
+                np.ravel(wave['Hs']).tolist(),np.ravel(wave['Hz']).tolist(),np.ravel(wave['Tz']).tolist(),np.ravel(wave['Ts']).tolist())
+            connection.executemany('INSERT INTO burst VALUES (?,?,?,?,?,?,?,?)',burst_rows)
+
+            for i1 in range(0,len(wave_index),batch):
+                i2=int(np.min([i1+batch,len(wave_index)]))
+                index=wave_index[i1:i2]
+
+                wave_rows=zip(burst_id[wave_burst[i1:i2]].tolist(),(burst_time[wave_burst[i1:i2]]+wave['Wave_Time'][index]).tolist(),
+                    wave['H'][index].tolist(),wave['T'][index].tolist(),wave['Crest'][index].tolist(),wave['Trough'][index].tolist())
+                connection.executemany('INSERT INTO wave VALUES (?,?,?,?,?,?)',wave_rows)
+
+            #Indexes are created after the first bulk insert and then updated by next runs
+            connection.execute('CREATE INDEX IF NOT EXISTS wave_time ON wave (time)')
+            connection.execute('CREATE INDEX IF NOT EXISTS wave_H ON wave (H)')
+            connection.execute('CREATE INDEX IF NOT EXISTS burst_time ON burst (time)')
+
+    finally:
+        connection.close()
+
+    burst_id=np.reshape(burst_id,np.shape(offset)[:-1]+(n_burst,))
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+        print('{} burst(s) and {} wave(s) are added to {}'.format(len(count),len(wave_index),DatabasePath))
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return burst_id
+
+    #--------------------------------------------------------------------------
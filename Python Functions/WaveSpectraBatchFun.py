@@ -0,0 +1,229 @@
+def WaveSpectraBatchFun(input,fs,duration,nfft,h,heightfrombed,fmin,fmax,ftailcorrection,tailpower,mincutoff,maxcutoff,tailcorrection,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    WaveSpectraBatchFun
+    ===================
+
+    .. code:: python
+
+        Hm0,Tm01,Tm02,Tp,fp,f,Syy=WaveSpectraBatchFun(input,fs,duration,nfft,h,heightfrombed,fmin,fmax,ftailcorrection,tailpower,mincutoff,maxcutoff,tailcorrection,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Calculate wave properties from power spectral density of several gauges (channels)
+    | All channels are calculated together, results of each channel are the same as WaveSpectraFun
+
+    INPUT
+    -----
+
+    input=importdata('h.mat')
+                                    Load water depth (h)/surface elevation (Eta) data of all channels and rename it "input" in (m)
+                                        input[i,:] is data of channel i
+    fs=10
+                                    Sampling frequency that data collected at in (Hz)
+    duration=1024
+                                    Duration time that data collected in input in each burst in second
+    nfft=2^10
+                                    NFFT for Fast Fourier Transform
+    h=[1,1.2]
+                                    Mean water depth of each channel in (m)
+    heightfrombed=[0.0,0.1]
+                                    Sensor height from bed of each channel
+    fmin=0.04
+                                    Minimum frequency for cut off the lower part of spectra
+    fmax=1
+                                    Maximum frequency for cut off the upper part of spectra
+    ftailcorrection=1
+                                    Frequency that diagnostic tail apply after that (typically set at 2.5fm, fm=1/Tm01)
+    tailpower=-4
+                                    Power that diagnostic tail apply based on that (-3 for shallow water to -5 for deep water)
+    mincutoff='off'
+                                    Define if to cut off the spectra below fmin
+                                        mincutoff='off': Cutoff off
+
+                                        mincutoff='on': Cutoff on
+    maxcutoff='off'
+                                    Define if to cut off the spectra beyond fmax
+                                        maxcutoff='off': Cutoff off
+
+                                        maxcutoff='on': Cutoff on
+    tailcorrection='off'
+                                    Define if to apply diagnostic tail correction or not
+                                        tailcorrection='off': Not apply
+
+                                        tailcorrection='jonswap': JONSWAP Spectrum tail
+
+                                        tailcorrection='tma': TMA Spectrum tail
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    Hm0
+                                    Zero-Moment Wave Height (m) of each channel
+    Tm01
+                                    Wave Period from m01 (second), Mean Wave Period of each channel
+    Tm02
+                                    Wave Period from m02 (second), Mean Zero Crossing Period of each channel
+    Tp
+                                    Peak Wave Period (second) of each channel
+    fp
+                                    Peak Wave Frequency (Hz) of each channel
+    f
+                                    Frequency (Hz), the same for all channels
+    Syy
+                                    Wave Surface Elevation Power Spectrum (m^2s), Syy[i,:] is spectrum of channel i
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        Hm0,Tm01,Tm02,Tp,fp,f,Syy=WaveSpectraBatchFun(water_depth,10,1024,256,[1.07,1.12],[0.05,0.1],0.05,5,1,-5,'on','on','off','on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import scipy as sp
+    from scipy import signal
+
+    if dispout=='on':
+        import matplotlib.pyplot as plt
+
+    #--------------------------------------------------------------------------
+    #Convert inputs to numpy array
+
+    input=np.atleast_2d(np.asarray(input,dtype=np.float64))
+    n_channel=np.shape(input)[0]
+    h=np.broadcast_to(np.asarray(h,dtype=np.float64),(n_channel,))
+
+    #--------------------------------------------------------------------------
+    #deterending
+
+    input1=sp.signal.detrend(input,axis=1,type='linear')
+
+    #--------------------------------------------------------------------------
+
+    if (fmax>fs/2): fmax=int(fs/2)
+
+    #--------------------------------------------------------------------------
+
+    #calculating power density of all channels
+
+    f,Syy=sp.signal.welch(input1,fs=fs,nfft=nfft,axis=1) #Wave power spectrum and Frequency
+
+    w=2*np.pi*f #angular velocity
+    deltaf=f[1]-f[0]
+
+    #--------------------------------------------------------------------------
+    #Applying tail correction
+
+    #Index of ftailcorrection
+    if tailcorrection=='jonswap' or tailcorrection=='tma':
+        Indxftail=int(np.min((np.nonzero(f>=ftailcorrection))[0]))
+
+    #Applying diagnostic frequency tail based on JONSWAP after fmax
+    if tailcorrection=='jonswap':
+
+        Syy[:,f>ftailcorrection]=Syy[:,Indxftail,None]*(f[f>ftailcorrection]/ftailcorrection)**tailpower #Adding diagnostic tail
+        Syy[Syy<0]=0 #Syy can not be negative
+
+    #Applying diagnostic frequency tail based on TMA after fmax
+    elif tailcorrection=='tma':
+
+        omega=2*np.pi*f[None,:]*np.sqrt(h[:,None]/9.81)
+
+        #Transformation function from JONSWAP into TMA, approximated method
+        PHI=np.ones(np.shape(omega))
+        PHI[omega<=1]=omega[omega<=1]**2/2
+        PHI[((omega>1) & (omega<2))]=1-0.5*(2-omega[((omega>1) & (omega<2))])**2
+        PHI[omega>=2]=1
+
+        Syy[:,f>ftailcorrection]=Syy[:,Indxftail,None]*(PHI[:,f>ftailcorrection]/PHI[:,Indxftail,None])*(f[f>ftailcorrection]/ftailcorrection)**tailpower #Adding TMA Spectrum tail
+        Syy[Syy<0]=0 #Syy can not be negative
+
+    #--------------------------------------------------------------------------
+    #cut off spectra based on fmin and fmax
+
+    if mincutoff=='on':
+        Syy[:,f<fmin]=0
+
+    if maxcutoff=='on':
+        Syy[:,f>fmax]=0
+
+    #--------------------------------------------------------------------------
+
+    #Calculating spectral moments
+
+    m0=np.sum(Syy*f**0*deltaf,axis=1)
+    m1=np.sum(Syy*f**1*deltaf,axis=1)
+    m2=np.sum(Syy*f**2*deltaf,axis=1)
+
+    #calculating wave properties
+    Hm0=4*np.sqrt(m0) #Zero-Moment wave height
+    Tm01=m0/m1 #mean period
+    Tm02=(m0/m2)**0.5 #zero crossing period
+
+    #calculation peak period
+    loc4=np.argmax(Syy,axis=1)
+    Tp=1/f[loc4] #peak period
+
+    #calculating peak frequency from weighted integral (Young, 1995)
+    fp=(np.sum(Syy**5*f**1*deltaf,axis=1))/(np.sum(Syy**5*f**0*deltaf,axis=1)) #peak frequency
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+
+        val=[Hm0, Tm01, Tm02, Tp, fp]
+        name=['Hm0','Tm01','Tm02','Tp','fp']
+        for i in range(0,len(val)):
+            print('{0:10}= {1}'.format(name[i],val[i]))
+
+        #plotting
+        for j in range(0,n_channel,1):
+            plt.loglog(f[f!=0],Syy[j,f!=0],label='Channel '+str(j+1))
+
+        plt.title('Power Spectral Density')
+        plt.xlabel('Frequency(Hz)')
+        plt.ylabel('Spectral Density(m^2s)')
+        plt.legend()
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return Hm0,Tm01,Tm02,Tp,fp,f,Syy
+
+    #--------------------------------------------------------------------------
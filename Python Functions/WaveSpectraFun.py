@@ -132,7 +132,7 @@ def WaveSpectraFun(input,fs,duration,nfft,h,heightfrombed,fmin,fmax,ftailcorrect
                     variable=np.array([variable])
             elif np.size(variable)>1:
                 if (type(variable).__module__)!='numpy':
-                    variable=np.array(variable) 
+                    variable=np.asarray(variable) #No copy for buffer-protocol and Arrow arrays
         return variable
     
     input=type2numpy(input)
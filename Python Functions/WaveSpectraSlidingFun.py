@@ -0,0 +1,296 @@
+def WaveSpectraSlidingFun(input,fs,duration,hopduration,nfft,fmin,fmax,ftailcorrection,tailpower,mincutoff,maxcutoff,tailcorrection,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    WaveSpectraSlidingFun
+    =====================
+
+    .. code:: python
+
+        Hm0,Tm01,Tm02,Tp,fp,f,Syy,tstart=WaveSpectraSlidingFun(input,fs,duration,hopduration,nfft,fmin,fmax,ftailcorrection,tailpower,mincutoff,maxcutoff,tailcorrection,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Calculate wave properties from power spectral density in overlapping (sliding) windows
+    | Each window has the same length as a burst and starts hopduration seconds after the previous window
+    | Results of each window are the same as WaveSpectraFun for that window
+    | Fast Fourier Transforms of Welch segments are calculated once and reused by all windows that contain them
+
+    INPUT
+    -----
+
+    input=importdata('h.mat')
+                                    Load water depth (h) data and rename it "input" in (m)
+                                        Mean water depth of each window is calculated from input
+    fs=10
+                                    Sampling frequency that data collected at in (Hz)
+    duration=1024
+                                    Duration time of each window in (second)
+    hopduration=64
+                                    Time between start of two consecutive windows in (second)
+                                        hopduration is rounded to a multiple of Welch segment step (128 data points)
+    nfft=2^10
+                                    NFFT for Fast Fourier Transform
+    fmin=0.04
+                                    Minimum frequency for cut off the lower part of spectra
+    fmax=1
+                                    Maximum frequency for cut off the upper part of spectra
+    ftailcorrection=1
+                                    Frequency that diagnostic tail apply after that (typically set at 2.5fm, fm=1/Tm01)
+    tailpower=-4
+                                    Power that diagnostic tail apply based on that (-3 for shallow water to -5 for deep water)
+    mincutoff='off'
+                                    Define if to cut off the spectra below fmin
+                                        mincutoff='off': Cutoff off
+
+                                        mincutoff='on': Cutoff on
+    maxcutoff='off'
+                                    Define if to cut off the spectra beyond fmax
+                                        maxcutoff='off': Cutoff off
+
+                                        maxcutoff='on': Cutoff on
+    tailcorrection='off'
+                                    Define if to apply diagnostic tail correction or not
+                                        tailcorrection='off': Not apply
+
+                                        tailcorrection='jonswap': JONSWAP Spectrum tail
+
+                                        tailcorrection='tma': TMA Spectrum tail
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    Hm0
+                                    Zero-Moment Wave Height (m) of each window
+    Tm01
+                                    Wave Period from m01 (second), Mean Wave Period of each window
+    Tm02
+                                    Wave Period from m02 (second), Mean Zero Crossing Period of each window
+    Tp
+                                    Peak Wave Period (second) of each window
+    fp
+                                    Peak Wave Frequency (Hz) of each window
+    f
+                                    Frequency (Hz)
+    Syy
+                                    Wave Surface Elevation Power Spectrum (m^2s) of each window, Syy[i,:] is spectrum of window i
+    tstart
+                                    Start time of each window from start of input in (second)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        Hm0,Tm01,Tm02,Tp,fp,f,Syy,tstart=WaveSpectraSlidingFun(water_depth,10,1024,64,256,0.05,5,1,-5,'on','on','off','on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import scipy as sp
+    from scipy import signal
+    import warnings
+
+    if dispout=='on':
+        import matplotlib.pyplot as plt
+
+    #--------------------------------------------------------------------------
+    #Convert inputs to numpy array
+
+    input=np.asarray(input,dtype=np.float64).ravel()
+
+    #--------------------------------------------------------------------------
+    #Windows and Welch segments
+
+    if (fmax>fs/2): fmax=int(fs/2)
+
+    n_sample=int(round(fs*duration)) #Number of data points in each window
+
+    #Welch segments are the same as scipy.signal.welch default
+    windowelem=int(np.min([256,n_sample])) #number of elements in each segment
+    overlapelem=windowelem//2 #number of overlap element
+    stepelem=windowelem-overlapelem #number of elements between start of two consecutive segments
+
+    #Hop should be a multiple of segment step, so windows share their segments
+    hopelem=int(round(fs*hopduration))
+    n_step_hop=int(np.max([1,round(hopelem/stepelem)])) #number of segment steps in each hop
+    if n_step_hop*stepelem!=hopelem:
+        warnings.warn('hopduration is rounded to {} second, a multiple of Welch segment step.'.format(n_step_hop*stepelem/fs))
+    hopelem=n_step_hop*stepelem
+
+    if len(input)<n_sample:
+        raise ValueError('Number of data points ({}) is less than number of data points in each window ({}).'.format(len(input),n_sample))
+
+    n_window=(len(input)-n_sample)//hopelem+1 #Number of windows
+    n_segment=(n_sample-windowelem)//stepelem+1 #Number of segments in each window
+
+    tstart=np.arange(0,n_window,1)*hopelem/fs
+
+    #--------------------------------------------------------------------------
+    #Linear trend and mean water depth of each window
+
+    input_window=np.lib.stride_tricks.sliding_window_view(input,n_sample)[::hopelem] #View of windows without copy
+
+    t_window=np.arange(0,n_sample,1)-(n_sample-1)/2
+    slope=(input_window@t_window)/np.sum(t_window**2) #Slope of linear trend in each window
+
+    h=np.mean(input_window,axis=1) #Mean water depth of each window
+    if np.any(h<=0):
+        warnings.warn('Mean water depth is Zero or negative, Oceanlyz continues with mean water depth=0.001 m.')
+        h[h<=0]=0.001
+
+    #--------------------------------------------------------------------------
+    #Calculating power density
+
+    #Removing linear trend of a window from a segment leaves its segment mean and a ramp that is the same for all segments
+    #Segment spectrum after linear detrend is X-slope*R, where X is spectrum of segment and R is spectrum of ramp
+    win=sp.signal.get_window('hann',windowelem)
+    t_segment=np.arange(0,windowelem,1)-(windowelem-1)/2
+    R=np.fft.rfft(win*t_segment,n=nfft)
+
+    f=np.fft.rfftfreq(nfft,1/fs)
+    scale=np.ones(len(f))/(fs*np.sum(win**2))
+    if nfft%2==0:
+        scale[1:-1]=scale[1:-1]*2
+    else:
+        scale[1:]=scale[1:]*2
+
+    Syy=np.zeros((n_window,len(f)))
+
+    #Windows are calculated in groups, segments of a group are calculated once and summed by cumulative sum
+    n_window_group=64
+    for i1 in range(0,n_window,n_window_group):
+        i2=int(np.min([i1+n_window_group,n_window]))
+
+        #Segments used by windows i1 to i2-1
+        j1=i1*n_step_hop
+        j2=(i2-1)*n_step_hop+n_segment
+        segment=np.lib.stride_tricks.sliding_window_view(input,windowelem)[j1*stepelem:(j2-1)*stepelem+1:stepelem]
+        segment=segment-np.mean(segment,axis=1,keepdims=True)
+        X=np.fft.rfft(segment*win,n=nfft,axis=1)
+
+        #Cumulative sum of segment spectra
+        P_cumsum=np.zeros((j2-j1+1,len(f)))
+        X_cumsum=np.zeros((j2-j1+1,len(f)),dtype=complex)
+        np.cumsum(np.abs(X)**2,axis=0,out=P_cumsum[1:,:])
+        np.cumsum(X,axis=0,out=X_cumsum[1:,:])
+
+        #Sum of |X-slope*R|^2 over segments of each window
+        k1=(np.arange(i1,i2,1)-i1)*n_step_hop
+        k2=k1+n_segment
+        b=slope[i1:i2,None]
+        P_sum=P_cumsum[k2,:]-P_cumsum[k1,:]
+        X_sum=X_cumsum[k2,:]-X_cumsum[k1,:]
+        Syy[i1:i2,:]=(P_sum-2*b*np.real(X_sum*np.conj(R))+n_segment*b**2*np.abs(R)**2)/n_segment*scale
+
+    Syy[Syy<0]=0 #Syy can not be negative
+
+    w=2*np.pi*f #angular velocity
+    deltaf=f[1]-f[0]
+
+    #--------------------------------------------------------------------------
+    #Applying tail correction
+
+    #Index of ftailcorrection
+    if tailcorrection=='jonswap' or tailcorrection=='tma':
+        Indxftail=int(np.min((np.nonzero(f>=ftailcorrection))[0]))
+
+    #Applying diagnostic frequency tail based on JONSWAP after fmax
+    if tailcorrection=='jonswap':
+
+        Syy[:,f>ftailcorrection]=Syy[:,Indxftail,None]*(f[f>ftailcorrection]/ftailcorrection)**tailpower #Adding diagnostic tail
+        Syy[Syy<0]=0 #Syy can not be negative
+
+    #Applying diagnostic frequency tail based on TMA after fmax
+    elif tailcorrection=='tma':
+
+        omega=2*np.pi*f[None,:]*np.sqrt(h[:,None]/9.81)
+
+        #Transformation function from JONSWAP into TMA, approximated method
+        PHI=np.ones(np.shape(omega))
+        PHI[omega<=1]=omega[omega<=1]**2/2
+        PHI[((omega>1) & (omega<2))]=1-0.5*(2-omega[((omega>1) & (omega<2))])**2
+        PHI[omega>=2]=1
+
+        Syy[:,f>ftailcorrection]=Syy[:,Indxftail,None]*(PHI[:,f>ftailcorrection]/PHI[:,Indxftail,None])*(f[f>ftailcorrection]/ftailcorrection)**tailpower #Adding TMA Spectrum tail
+        Syy[Syy<0]=0 #Syy can not be negative
+
+    #--------------------------------------------------------------------------
+    #Cut off spectrum based on fmin and fmax
+
+    if mincutoff=='on':
+        Syy[:,f<fmin]=0
+
+    if maxcutoff=='on':
+        Syy[:,f>fmax]=0
+
+    #--------------------------------------------------------------------------
+    #Calculating wave properties
+
+    #Calculating spectral moments
+    m0=np.sum(Syy*f**0*deltaf,axis=1)
+    m1=np.sum(Syy*f**1*deltaf,axis=1)
+    m2=np.sum(Syy*f**2*deltaf,axis=1)
+
+    #Calculating wave properties
+    Hm0=4*np.sqrt(m0) #Zero-Moment wave height
+    Tm01=m0/m1 #mean period
+    Tm02=(m0/m2)**0.5 #zero crossing period
+
+    #Calculation peak period
+    loc4=np.argmax(Syy,axis=1)
+    Tp=1/f[loc4] #peak period
+
+    #Calculating peak frequency from weighted integral (Young, 1995)
+    fp=(np.sum(Syy**5*f**1*deltaf,axis=1))/(np.sum(Syy**5*f**0*deltaf,axis=1)) #peak frequency
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+
+        print('{0:10}= {1:d}'.format('n_window',n_window))
+        print('{0:10}= {1:0.10f}'.format('hop',hopelem/fs))
+
+        plt.plot(tstart,Hm0)
+        plt.title('Zero-Moment Wave Height')
+        plt.xlabel('Window Start Time(s)')
+        plt.ylabel('Hm0(m)')
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return Hm0,Tm01,Tm02,Tp,fp,f,Syy,tstart
+
+    #--------------------------------------------------------------------------
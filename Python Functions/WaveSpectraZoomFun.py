@@ -0,0 +1,247 @@
+def WaveSpectraZoomFun(input,fs,duration,nfft,h,heightfrombed,fmin,fmax,ftailcorrection,tailpower,mincutoff,maxcutoff,tailcorrection,dispout):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    WaveSpectraZoomFun
+    ==================
+
+    .. code:: python
+
+        Hm0,Tm01,Tm02,Tp,fp,f,Syy=WaveSpectraZoomFun(input,fs,duration,nfft,h,heightfrombed,fmin,fmax,ftailcorrection,tailpower,mincutoff,maxcutoff,tailcorrection,dispout)
+
+    DESCRIPTION
+    -----------
+
+    | Calculate wave properties from power spectral density that is only calculated between fmin and fmax
+    | Welch segments are the same as WaveSpectraFun (scipy.signal.welch default), spectrum of each segment is calculated by Zoom FFT (chirp z-transform)
+    | Spectrum has (nfft/2+1) frequencies between fmin and fmax, so frequency resolution is finer than WaveSpectraFun with the same nfft
+    | Zoom FFT plan is kept for each configuration and reused for next bursts
+
+    INPUT
+    -----
+
+    input=importdata('h.mat')
+                                    Load water depth (h)/surface elevation (Eta) data and rename it "input" in (m)
+    fs=10
+                                    Sampling frequency that data collected at in (Hz)
+    duration=1024
+                                    Duration time that data collected in input in each burst in second
+    nfft=2^10
+                                    NFFT, spectrum has (nfft/2+1) frequencies between fmin and fmax
+    h=1
+                                    Mean water depth in (m)
+    heightfrombed=0.0
+                                    Sensor height from bed
+    fmin=0.04
+                                    Minimum frequency of spectra
+    fmax=1
+                                    Maximum frequency of spectra
+    ftailcorrection=1
+                                    Frequency that diagnostic tail apply after that (typically set at 2.5fm, fm=1/Tm01)
+    tailpower=-4
+                                    Power that diagnostic tail apply based on that (-3 for shallow water to -5 for deep water)
+    mincutoff='off'
+                                    Not used, spectrum is only calculated for frequencies larger than fmin
+    maxcutoff='off'
+                                    Not used, spectrum is only calculated for frequencies smaller than fmax
+    tailcorrection='off'
+                                    Define if to apply diagnostic tail correction or not
+                                        tailcorrection='off': Not apply
+
+                                        tailcorrection='jonswap': JONSWAP Spectrum tail
+
+                                        tailcorrection='tma': TMA Spectrum tail
+    dispout='on'
+                                    Define to display outputs or not ('off': not display, 'on': display)
+
+    OUTPUT
+    ------
+
+    Hm0
+                                    Zero-Moment Wave Height (m)
+    Tm01
+                                    Wave Period from m01 (second), Mean Wave Period
+    Tm02
+                                    Wave Period from m02 (second), Mean Zero Crossing Period
+    Tp
+                                    Peak Wave Period (second)
+    fp
+                                    Peak Wave Frequency (Hz)
+    f
+                                    Frequency (Hz) between fmin and fmax
+    Syy
+                                    Wave Surface Elevation Power Spectrum (m^2s)
+
+    EXAMPLE
+    -------
+
+    .. code:: python
+
+        Hm0,Tm01,Tm02,Tp,fp,f,Syy=WaveSpectraZoomFun(water_pressure/(1000*9.81),10,1024,128,1.07,0.05,0.05,0.5,1,-5,'on','on','off','on')
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #==========================================================================
+
+    #CODE
+    #--------------------------------------------------------------------------
+    #Import required packages
+
+    import numpy as np
+    import scipy as sp
+    from scipy import signal
+    if dispout=='on':
+        import matplotlib.pyplot as plt
+
+    #--------------------------------------------------------------------------
+    #Convert inputs to numpy array
+
+    input=np.asarray(input,dtype=np.float64)
+
+    #--------------------------------------------------------------------------
+    #deterending
+
+    input1=sp.signal.detrend(input,type='linear')
+
+    #--------------------------------------------------------------------------
+
+    if (fmax>fs/2): fmax=int(fs/2)
+
+    #--------------------------------------------------------------------------
+    #Welch segments are the same as scipy.signal.welch default
+
+    windowelem=int(np.min([256,len(input1)])) #number of elements in each segment
+    overlapelem=windowelem//2 #number of overlap element
+    stepelem=windowelem-overlapelem #number of elements between start of two consecutive segments
+
+    win=sp.signal.get_window('hann',windowelem)
+
+    segment=np.lib.stride_tricks.sliding_window_view(input1,windowelem)[::stepelem]
+    segment=segment-np.mean(segment,axis=1,keepdims=True)
+
+    #--------------------------------------------------------------------------
+    #calculating power density between fmin and fmax
+
+    n_f=int(nfft/2+1) #Number of frequencies
+
+    #Zoom FFT plan for this configuration
+    plan_key=(windowelem,float(fmin),float(fmax),n_f,float(fs))
+    if plan_key not in WaveSpectraZoomFun.zoomfftplan:
+        if len(WaveSpectraZoomFun.zoomfftplan)>=16:
+            WaveSpectraZoomFun.zoomfftplan.clear()
+        WaveSpectraZoomFun.zoomfftplan[plan_key]=sp.signal.ZoomFFT(windowelem,[fmin,fmax],m=n_f,fs=fs,endpoint=True)
+
+    zoomfft=WaveSpectraZoomFun.zoomfftplan[plan_key]
+
+    f=np.linspace(fmin,fmax,n_f) #Frequency
+    X=zoomfft(segment*win,axis=1)
+
+    #Scale for one-sided power spectral density
+    scale=np.full(n_f,2/(fs*np.sum(win**2)))
+    scale[((f==0) | (f==fs/2))]=1/(fs*np.sum(win**2))
+
+    Syy=np.mean(np.abs(X)**2,axis=0)*scale #Wave power spectrum
+
+    w=2*np.pi*f #angular velocity
+    deltaf=f[1]-f[0]
+
+    #--------------------------------------------------------------------------
+    #Applying tail correction
+
+    #Tail correction is only applied if ftailcorrection is between fmin and fmax
+    if ftailcorrection>f[-1]:
+        tailcorrection='off'
+
+    #Index of ftailcorrection
+    if tailcorrection=='jonswap' or tailcorrection=='tma':
+        Indxftail=int(np.min((np.nonzero(f>=ftailcorrection))[0]))
+
+    #Applying diagnostic frequency tail based on JONSWAP after fmax
+    if tailcorrection=='jonswap':
+
+        Syy[f>ftailcorrection]=Syy[Indxftail]*(f[f>ftailcorrection]/ftailcorrection)**tailpower #Adding diagnostic tail
+        Syy[Syy<0]=0 #Syy can not be negative
+
+    #Applying diagnostic frequency tail based on TMA after fmax
+    elif tailcorrection=='tma':
+
+        omega=2*np.pi*f*np.sqrt(h/9.81)
+
+        #Transformation function from JONSWAP into TMA, approximated method
+        PHI=np.ones(len(omega))
+        PHI[omega<=1]=omega[omega<=1]**2/2
+        PHI[((omega>1) & (omega<2))]=1-0.5*(2-omega[((omega>1) & (omega<2))])**2
+        PHI[omega>=2]=1
+
+        Syy[f>ftailcorrection]=Syy[Indxftail]*(PHI[f>ftailcorrection]/PHI[Indxftail])*(f[f>ftailcorrection]/ftailcorrection)**tailpower #Adding TMA Spectrum tail
+        Syy[Syy<0]=0 #Syy can not be negative
+
+    #--------------------------------------------------------------------------
+
+    #Calculating spectral moments
+
+    m0=np.sum(Syy*f**0*deltaf)
+    m1=np.sum(Syy*f**1*deltaf)
+    m2=np.sum(Syy*f**2*deltaf)
+
+    #calculating wave properties
+    Hm0=4*np.sqrt(m0) #Zero-Moment wave height
+    Tm01=m0/m1 #mean period
+    Tm02=(m0/m2)**0.5 #zero crossing period
+
+    #calculation peak period
+    loc4=np.argmax(Syy)
+    Tp=1/f[loc4] #peak period
+
+    #calculating peak frequency from weighted integral (Young, 1995)
+    fp=(np.sum(Syy**5*f**1*deltaf))/(np.sum(Syy**5*f**0*deltaf)) #peak frequency
+
+    #--------------------------------------------------------------------------
+    #Displaying results
+
+    if dispout=='on':
+
+        val=[m0, m1, m2, Hm0, Tm01, Tm02, Tp, fp]
+        name=['m0','m1','m2','Hm0','Tm01','Tm02','Tp','fp']
+        for i in range(0,len(val)):
+            print('{0:10}= {1:0.10f}'.format(name[i],val[i]))
+
+        #plotting
+        plt.loglog(f[f!=0],Syy[f!=0])
+
+        plt.title('Power Spectral Density')
+        plt.xlabel('Frequency(Hz)')
+        plt.ylabel('Spectral Density(m^2s)')
+
+
+    #--------------------------------------------------------------------------
+    #Outputs
+    return Hm0,Tm01,Tm02,Tp,fp,f,Syy
+
+    #--------------------------------------------------------------------------
+
+#Zoom FFT plans for each configuration (segment length, fmin, fmax, number of frequencies, fs), reused between bursts
+WaveSpectraZoomFun.zoomfftplan={}
@@ -1,4 +1,4 @@
-def WaveZerocrossingFun(input,fs,duration,dispout):
+def WaveZerocrossingFun(input,fs,duration,dispout,detail='off'):
     """
     .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
     .. +                                                                        +
@@ -18,6 +18,7 @@ def WaveZerocrossingFun(input,fs,duration,dispout):
     .. code:: python
 
         Hs,Hz,Tz,Ts,H,T=WaveZerocrossingFun(input,fs,duration,dispout)
+        Hs,Hz,Tz,Ts,H,T,Etac,Etat,tmean=WaveZerocrossingFun(input,fs,duration,dispout,'on')
 
     DESCRIPTION
     -----------
@@ -35,6 +36,8 @@ def WaveZerocrossingFun(input,fs,duration,dispout):
                                     Duration time that data collected in input in each burst in second
     dispout='on'
                                     Define to display outputs or not ('off': not display, 'on': display)
+    detail='off'
+                                    Define to output crest, trough, and time of each wave or not ('off': not output, 'on': output)
 
     OUTPUT
     ------
@@ -51,6 +54,12 @@ def WaveZerocrossingFun(input,fs,duration,dispout):
                                     Wave Height Data Series (m)
     T
                                     Wave Period Data Series (second)
+    Etac
+                                    Water Level of Wave Crest Data Series (m), only if detail='on'
+    Etat
+                                    Water Level of Wave Trough Data Series (m), only if detail='on'
+    tmean
+                                    Time of each wave (mean time of its crest and trough) from the first data point in (second), only if detail='on'
 
     EXAMPLE
     -------
@@ -58,6 +67,7 @@ def WaveZerocrossingFun(input,fs,duration,dispout):
     .. code:: python
 
         Hs,Hz,Tz,Ts,H,T=WaveZerocrossingFun(water_pressure/(1000*9.81),10,1024,'on')
+        Hs,Hz,Tz,Ts,H,T,Etac,Etat,tmean=WaveZerocrossingFun(water_pressure/(1000*9.81),10,1024,'off','on')
 
     .. LICENSE & DISCLAIMER
     .. -------------------- 
@@ -99,14 +109,14 @@ def WaveZerocrossingFun(input,fs,duration,dispout):
                     variable=np.array([variable])
             elif np.size(variable)>1:
                 if (type(variable).__module__)!='numpy':
-                    variable=np.array(variable) 
+                    variable=np.asarray(variable) #No copy for buffer-protocol and Arrow arrays
         return variable
     
     input=type2numpy(input)
 
     #--------------------------------------------------------------------------
 
-    sample=duration*fs #number of sample in input file
+    sample=int(round(duration*fs)) #number of sample in input file
     dt=1/fs #calculating delta t in second (dt=duration/sample)
     t=np.linspace(dt,duration,sample) #time
     len_=len(t)
@@ -339,6 +349,10 @@ def WaveZerocrossingFun(input,fs,duration,dispout):
 
     #--------------------------------------------------------------------------
     #Outputs
+    if detail=='on':
+        tmean=xmean-dt #Time from the first data point, t[0] is dt
+        return Hs,Hz,Tz,Ts,H,T,Etac,Etat,tmean
+
     return Hs,Hz,Tz,Ts,H,T
 
     #--------------------------------------------------------------------------
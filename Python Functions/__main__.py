@@ -0,0 +1,5 @@
+#Run OCEANLYZ from command line as 'python -m oceanlyz'
+import sys
+from .oceanlyzcli import main
+
+sys.exit(main())
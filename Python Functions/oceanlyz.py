@@ -34,6 +34,9 @@ class oceanlyz:
         Water level (water surface elevation, Eta), water depth, or water pressure time series
             | Data should be a single column array (column vector) without any text
             | Each burst of data should follow the previous burst without any void
+            | For several gauges (channels), data is an array with shape (n_channel, n_total), each row is data of one channel
+            | For several channels, all results have channel as their first axis, e.g. wave['Hm0'][i,:] is Hm0 of channel i
+            | Data can be a numpy array, a buffer-protocol object (e.g. memoryview), or an Arrow array, float64 data without missing values is used without copy
 
     InputType='waterlevel'
         Define input data type
@@ -124,6 +127,7 @@ class oceanlyz:
     heightfrombed=0.0
         Pressure sensor height from a bed in (m)
             Leave heightfrombed=0.0 if data are not measured by a pressure sensor or if a sensor sits on the seabed
+            | For several channels, heightfrombed can be an array with one value for each channel
             | Only required if InputType='pressure'
 
     Optional Properties
@@ -139,6 +143,7 @@ class oceanlyz:
     Rho=1000
         Water density (kg/m^3)
             Only required if InputType='pressure'
+            | For several channels, Rho can be an array with one value for each channel
 
     nfft=512
         Define number of data points in discrete Fourier transform
@@ -182,6 +187,131 @@ class oceanlyz:
             | Recommendation: use tailpower=-3 for shallow water and tailpower=-5 for deep water
             | Only required if SeparateSeaSwell='yes' and tailcorrection='jonswap' or tailcorrection='tma'
 
+    time=[]
+        Time stamp of each data point, in second or as numpy.datetime64, with the same length as data
+            | time=[]: Data are split into n_burst bursts with a duration of burst_duration, each burst follows the previous burst without any void
+            | time is defined: Bursts are detected from time stamps, and n_burst is calculated from data
+            | Data are split where time step is larger than 1.5/fs (gap in data), and each continuous part is split into bursts with a maximum duration of burst_duration
+            | Bursts can have different durations, results of shorter bursts are padded with NaN in 'Eta' and 'Burst_Data'
+            | Results contain 'Burst_Start' as time stamp of first data point and 'Burst_Duration' as duration (second) of each burst
+            | Not available if hop_duration>0 or crossspectra='yes'
+
+    min_burst_fraction=0.5
+        Minimum duration of a burst as a fraction of burst_duration
+            | Bursts shorter than (min_burst_fraction*burst_duration) are ignored
+            | Only required if time is defined
+
+    decimation='no'
+        Define if to decimate (downsample) data before spectral analysis or not
+            | decimation='no': Data are analyzed at sampling frequency of fs
+            | decimation='yes': Data are low-pass filtered and downsampled by an integer factor before analysis
+            | Decimation factor is calculated from fmax, ftailcorrection, fmaxpcorr, and fmaxswell, so that all of them are below 80% of new Nyquist frequency
+            | Decimation factor is 1 (no decimation) if fmax>=fs/2 or maxcutoff='off'
+            | Example: for fs=32 and fmax=1, data are decimated by a factor of 12 and analyzed at 2.67 Hz
+            | Results of 'Eta' are at decimated sampling frequency (fs/decimation factor), 'Burst_Data' is not decimated
+            | Spectrum is calculated up to new Nyquist frequency with a finer frequency resolution, so results can differ slightly from results without decimation
+            | Only used if AnalysisMethod='spectral'
+
+    zoomfft='no'
+        Define if to calculate spectrum only between fmin and fmax by Zoom FFT or not
+            | zoomfft='no': Spectrum is calculated between 0 and fs/2 with a frequency resolution of fs/nfft
+            | zoomfft='yes': Spectrum is calculated between fmin and fmax with (nfft/2+1) frequencies (WaveSpectraZoomFun)
+            | Frequency resolution is (fmax-fmin)/(nfft/2), a smaller nfft can be used to save fewer frequencies for each burst
+            | Example: for fmin=0.05, fmax=0.5, and nfft=64, spectrum has 33 frequencies with a frequency resolution of 0.014 Hz
+            | Only available if OutputType='wave' or OutputType='wave+waterlevel', AnalysisMethod='spectral', SeparateSeaSwell='no', and hop_duration=0
+
+    spectrum_band='no'
+        Define if to save spectrum averaged in frequency bands or not
+            | spectrum_band='no': Spectrum is saved at all frequencies (nfft/2+1 frequencies)
+            | spectrum_band='octave': Spectrum is averaged in base-10 octave bands
+            | spectrum_band='third-octave': Spectrum is averaged in base-10 one-third octave bands
+            | spectrum_band=[0.05,0.1,0.2,0.4]: Spectrum is averaged in bands with these edges (Hz), e.g. np.geomspace(0.05,1,21) for 20 log-spaced bands
+            | 'f' is center frequency of each band, 'Syy' (and 'Sxy' if crossspectra='yes') is band-averaged spectrum, and 'Band_Width' is width of each band (Hz), zero-moment (m0) is preserved
+            | Wave properties are calculated from spectrum before averaging (SpectrumBandFun)
+            | Only used if OutputType='wave' or OutputType='wave+waterlevel' and AnalysisMethod='spectral'
+
+    f_2d='no'
+        Define if to save frequency 'f' as a 2-D array (one row for each burst) or not
+            | f_2d='no': 'f' is a 1-D array, the same frequency is used for all bursts and channels
+            | f_2d='yes': 'f' is a read-only 2-D view with the same shape as 'Syy' (as OCEANLYZ ver 2.0), it does not use extra memory
+
+    wave_by_wave='no'
+        Define if to save height, period, crest, and trough of each wave (wave-by-wave results) or not
+            | wave_by_wave='no': Only wave properties of each burst are saved
+            | wave_by_wave='yes': Height 'H', period 'T', crest 'Crest', trough 'Trough', and time from start of burst 'Wave_Time' of all waves are saved as flat arrays, and 'Wave_Offset' is index of first wave of each burst
+            | wave_by_wave='float32': The same as wave_by_wave='yes', wave-by-wave results are saved as float32 to use less memory
+            | Waves of burst i are wave['H'][wave['Wave_Offset'][i]:wave['Wave_Offset'][i+1]], WaveByWaveFun gives values and statistics of each burst
+            | For multi-channel data, 'Wave_Offset' has a shape of (n_channel, n_burst+1)
+            | Only used if AnalysisMethod='zerocross'
+
+    wave_database=''
+        Path of SQLite database file to add wave-by-wave results to
+            | wave_database='': Wave-by-wave results are not saved in a database
+            | wave_database='C:\\oceanlyz_waves.sqlite': Bursts and waves are added to this database after calculation (WaveDatabaseFun)
+            | Database has a 'burst' table and a 'wave' table (burst_id, time, H, T, crest, trough) with indexes on time and H
+            | Time is from 'time' property (seconds from 1970-01-01 for numpy.datetime64), or seconds from start of data if 'time' is not defined
+            | Only used if wave_by_wave='yes' or wave_by_wave='float32'
+
+    hop_duration=0
+        Time between start of two consecutive analysis windows in (second)
+            | hop_duration=0: Bursts do not overlap, each burst is analyzed separately
+            | hop_duration>0: Windows with duration of burst_duration start every hop_duration seconds (sliding window)
+            | hop_duration is rounded to a multiple of Welch segment step (128 data points)
+            | Example: burst_duration=1024 and hop_duration=64 give results every 64 seconds, each from 1024 seconds of data
+            | Only available if InputType='waterlevel', OutputType='wave', AnalysisMethod='spectral', and SeparateSeaSwell='no'
+            | Results contain 'Window_Start' as start time of each window, 'Burst_Data' is not saved
+
+    crossspectra='no'
+        Define if to calculate cross power spectral density of all pairs of channels or not
+            | crossspectra='no': Cross spectra are not calculated
+            | crossspectra='yes': Cross spectra are calculated and saved as 'Sxy' with shape (n_channel, n_channel, n_burst, nfft/2+1)
+            | Pressure response factor is applied up to fmaxpcorr (automatic fmaxpcorr is not used for cross spectra)
+            | Cross spectra have the same frequencies as 'Syy', data are decimated if decimation='yes', and zoomfft='yes' is not available
+            | Only required if data has several channels
+
+    checkpoint=''
+        Folder to save results of completed bursts during calculation (checkpoint)
+            | checkpoint='': Results are not saved during calculation
+            | checkpoint='C:\\oceanlyz_checkpoint': Results of completed bursts are saved in this folder
+            | Use it for long runs, so an interrupted run can be resumed
+            | Not available if hop_duration>0
+
+    checkpoint_interval=100
+        Number of completed bursts that are saved together in each checkpoint file
+            | Only required if checkpoint is defined
+
+    resume='no'
+        Define if to resume an interrupted run from its checkpoint files or not
+            | resume='no': Start from the first burst, existing checkpoint files in checkpoint folder are removed
+            | resume='yes': Skip bursts that are already saved in checkpoint folder
+            | Checkpoint files are only used if they are created with the same properties and data
+            | Only required if checkpoint is defined
+
+    hdf5_file=''
+        Path of HDF5 file to add results to
+            | hdf5_file='': Results are not saved in a file
+            | hdf5_file='C:\\oceanlyz_results.h5': Results of all bursts are added after bursts that are already in this file (HDF5WriteFun)
+            | Each result is saved in a chunked and compressed dataset, HDF5ReadFun reads one result for a range of bursts
+            | oceanlyzstream adds each burst to this file as soon as it is calculated
+            | Input data of bursts ('Burst_Data') are not saved
+            | h5py package is required
+
+    parquet_file=''
+        Path of Parquet table to add scalar results of each burst to
+            | parquet_file='': Results are not saved in a table
+            | parquet_file='C:\\oceanlyz_statistics': Results are added as a new file in this folder (ParquetWriteFun)
+            | parquet_file='C:\\oceanlyz_statistics.parquet': Results of each run are added to this file
+            | Each burst is a row, ParquetReadFun reads selected columns and rows that match filters (e.g. by time or Hm0)
+            | pyarrow package is required
+
+    progress=None
+        Function that is called after each burst is calculated as progress(n_completed, n_total), e.g. to update a progress bar
+            | progress=None: Not used
+            | Calculation is stopped if progress returns False, runoceanlyz raises RuntimeError and results of previous run are kept
+            | If hop_duration>0, progress is called once after all windows are calculated
+            | progress may be called from a worker thread, it should not update a GUI directly (use wx.CallAfter for wxPython)
+            | For multi-channel data that is calculated one channel at a time, n_total is n_channel*n_burst
+
     Methods
     -------
 
@@ -296,6 +426,9 @@ class oceanlyz:
         #                                 Water level (water surface elevation, Eta), water depth, or water pressure time series
         #                                     Data should be a single column array (column vector) without any text
         #                                     Each burst of data should follow the previous burst without any void
+        #                                     For several gauges (channels), data is an array with shape (n_channel, n_total), each row is data of one channel
+        #                                     For several channels, all results have channel as their first axis, e.g. wave['Hm0'][i,:] is Hm0 of channel i
+        #                                     Data can be a numpy array, a buffer-protocol object (e.g. memoryview), or an Arrow array, float64 data without missing values is used without copy
 
         #Output data
         self.wave={}
@@ -417,6 +550,7 @@ class oceanlyz:
         self.heightfrombed=0.0
         #                                 Pressure sensor height from a bed in (m)
         #                                     Leave heightfrombed=0.0 if data are not measured by a pressure sensor or if a sensor sits on the seabed
+        #                                     For several channels, heightfrombed can be an array with one value for each channel
         #                                      Only required if InputType='pressure'
 
         #--------------------
@@ -436,6 +570,7 @@ class oceanlyz:
         self.Rho=1000
         #                                 Water density (kg/m^3)
         #                                     Only required if InputType='pressure'
+        #                                     For several channels, Rho can be an array with one value for each channel
     
         self.nfft=512
         #                                 Define number of data points in discrete Fourier transform
@@ -491,6 +626,185 @@ class oceanlyz:
         #                                     Recommendation: use tailpower=-3 for shallow water and tailpower=-5 for deep water
         #                                     Only required if SeparateSeaSwell='yes' and tailcorrection='jonswap' or tailcorrection='tma'
 
+        #--------------------
+        #Time stamp setup for data with gaps or bursts with different durations
+        #--------------------
+
+        #Time stamp of data
+        self.time=[]
+        #                                 Time stamp of each data point, in second or as numpy.datetime64, with the same length as data
+        #                                     time=[]: Data are split into n_burst bursts with a duration of burst_duration, each burst follows the previous burst without any void
+        #                                     time is defined: Bursts are detected from time stamps, and n_burst is calculated from data
+        #                                     Data are split where time step is larger than 1.5/fs (gap in data), and each continuous part is split into bursts with a maximum duration of burst_duration
+        #                                     Bursts can have different durations, results of shorter bursts are padded with NaN in 'Eta' and 'Burst_Data'
+        #                                     Results contain 'Burst_Start' as time stamp of first data point and 'Burst_Duration' as duration (second) of each burst
+        #                                     Not available if hop_duration>0 or crossspectra='yes'
+
+        #Minimum duration of a burst
+        self.min_burst_fraction=0.5
+        #                                 Minimum duration of a burst as a fraction of burst_duration
+        #                                     Bursts shorter than (min_burst_fraction*burst_duration) are ignored
+        #                                     Only required if time is defined
+
+        #--------------------
+        #Decimation setup for data with high sampling frequency
+        #--------------------
+
+        #Decimate data before spectral analysis
+        self.decimation='no'
+        #                                 Define if to decimate (downsample) data before spectral analysis or not
+        #                                     decimation='no': Data are analyzed at sampling frequency of fs
+        #                                     decimation='yes': Data are low-pass filtered and downsampled by an integer factor before analysis
+        #                                     Decimation factor is calculated from fmax, ftailcorrection, fmaxpcorr, and fmaxswell, so that all of them are below 80% of new Nyquist frequency
+        #                                     Decimation factor is 1 (no decimation) if fmax>=fs/2 or maxcutoff='off'
+        #                                     Example: for fs=32 and fmax=1, data are decimated by a factor of 12 and analyzed at 2.67 Hz
+        #                                     Results of 'Eta' are at decimated sampling frequency (fs/decimation factor), 'Burst_Data' is not decimated
+        #                                     Spectrum is calculated up to new Nyquist frequency with a finer frequency resolution, so results can differ slightly from results without decimation
+        #                                     Only used if AnalysisMethod='spectral'
+
+        #--------------------
+        #Zoom FFT setup for band-limited spectrum
+        #--------------------
+
+        #Calculate spectrum between fmin and fmax
+        self.zoomfft='no'
+        #                                 Define if to calculate spectrum only between fmin and fmax by Zoom FFT or not
+        #                                     zoomfft='no': Spectrum is calculated between 0 and fs/2 with a frequency resolution of fs/nfft
+        #                                     zoomfft='yes': Spectrum is calculated between fmin and fmax with (nfft/2+1) frequencies (WaveSpectraZoomFun)
+        #                                     Frequency resolution is (fmax-fmin)/(nfft/2), a smaller nfft can be used to save fewer frequencies for each burst
+        #                                     Example: for fmin=0.05, fmax=0.5, and nfft=64, spectrum has 33 frequencies with a frequency resolution of 0.014 Hz
+        #                                     Only available if OutputType='wave' or OutputType='wave+waterlevel', AnalysisMethod='spectral', SeparateSeaSwell='no', and hop_duration=0
+
+        #--------------------
+        #Band-averaged spectrum setup
+        #--------------------
+
+        #Average spectrum in frequency bands
+        self.spectrum_band='no'
+        #                                 Define if to save spectrum averaged in frequency bands or not
+        #                                     spectrum_band='no': Spectrum is saved at all frequencies (nfft/2+1 frequencies)
+        #                                     spectrum_band='octave': Spectrum is averaged in base-10 octave bands
+        #                                     spectrum_band='third-octave': Spectrum is averaged in base-10 one-third octave bands
+        #                                     spectrum_band=[0.05,0.1,0.2,0.4]: Spectrum is averaged in bands with these edges (Hz), e.g. np.geomspace(0.05,1,21) for 20 log-spaced bands
+        #                                     'f' is center frequency of each band, 'Syy' (and 'Sxy' if crossspectra='yes') is band-averaged spectrum, and 'Band_Width' is width of each band (Hz), zero-moment (m0) is preserved
+        #                                     Wave properties are calculated from spectrum before averaging (SpectrumBandFun)
+        #                                     Only used if OutputType='wave' or OutputType='wave+waterlevel' and AnalysisMethod='spectral'
+
+        #--------------------
+        #Frequency setup
+        #--------------------
+
+        #Frequency as a 2-D array
+        self.f_2d='no'
+        #                                 Define if to save frequency 'f' as a 2-D array (one row for each burst) or not
+        #                                     f_2d='no': 'f' is a 1-D array, the same frequency is used for all bursts and channels
+        #                                     f_2d='yes': 'f' is a read-only 2-D view with the same shape as 'Syy' (as OCEANLYZ ver 2.0), it does not use extra memory
+
+        #--------------------
+        #Wave-by-wave setup
+        #--------------------
+
+        #Save height and period of each wave
+        self.wave_by_wave='no'
+        #                                 Define if to save height, period, crest, and trough of each wave (wave-by-wave results) or not
+        #                                     wave_by_wave='no': Only wave properties of each burst are saved
+        #                                     wave_by_wave='yes': Height 'H', period 'T', crest 'Crest', trough 'Trough', and time from start of burst 'Wave_Time' of all waves are saved as flat arrays, and 'Wave_Offset' is index of first wave of each burst
+        #                                     wave_by_wave='float32': The same as wave_by_wave='yes', wave-by-wave results are saved as float32 to use less memory
+        #                                     Waves of burst i are wave['H'][wave['Wave_Offset'][i]:wave['Wave_Offset'][i+1]], WaveByWaveFun gives values and statistics of each burst
+        #                                     For multi-channel data, 'Wave_Offset' has a shape of (n_channel, n_burst+1)
+        #                                     Only used if AnalysisMethod='zerocross'
+
+        #Wave-by-wave database
+        self.wave_database=''
+        #                                 Path of SQLite database file to add wave-by-wave results to
+        #                                     wave_database='': Wave-by-wave results are not saved in a database
+        #                                     wave_database='C:\\oceanlyz_waves.sqlite': Bursts and waves are added to this database after calculation (WaveDatabaseFun)
+        #                                     Database has a 'burst' table and a 'wave' table (burst_id, time, H, T, crest, trough) with indexes on time and H
+        #                                     Time is from 'time' property (seconds from 1970-01-01 for numpy.datetime64), or seconds from start of data if 'time' is not defined
+        #                                     Only used if wave_by_wave='yes' or wave_by_wave='float32'
+
+        #--------------------
+        #Sliding window setup
+        #--------------------
+
+        #Time between start of two consecutive windows
+        self.hop_duration=0
+        #                                 Time between start of two consecutive analysis windows in (second)
+        #                                     hop_duration=0: Bursts do not overlap, each burst is analyzed separately
+        #                                     hop_duration>0: Windows with duration of burst_duration start every hop_duration seconds (sliding window)
+        #                                     hop_duration is rounded to a multiple of Welch segment step (128 data points)
+        #                                     Example: burst_duration=1024 and hop_duration=64 give results every 64 seconds, each from 1024 seconds of data
+        #                                     Only available if InputType='waterlevel', OutputType='wave', AnalysisMethod='spectral', and SeparateSeaSwell='no'
+        #                                     Results contain 'Window_Start' as start time of each window, 'Burst_Data' is not saved
+
+        #--------------------
+        #Cross spectra setup for multi-channel data
+        #--------------------
+
+        #Calculate cross spectra
+        self.crossspectra='no'
+        #                                 Define if to calculate cross power spectral density of all pairs of channels or not
+        #                                     crossspectra='no': Cross spectra are not calculated
+        #                                     crossspectra='yes': Cross spectra are calculated and saved as 'Sxy' with shape (n_channel, n_channel, n_burst, nfft/2+1)
+        #                                     Pressure response factor is applied up to fmaxpcorr (automatic fmaxpcorr is not used for cross spectra)
+        #                                     Cross spectra have the same frequencies as 'Syy', data are decimated if decimation='yes', and zoomfft='yes' is not available
+        #                                     Only required if data has several channels
+
+        #--------------------
+        #Checkpoint setup for long runs
+        #--------------------
+
+        #Checkpoint folder
+        self.checkpoint=''
+        #                                 Folder to save results of completed bursts during calculation (checkpoint)
+        #                                     checkpoint='': Results are not saved during calculation
+        #                                     checkpoint='C:\\oceanlyz_checkpoint': Results of completed bursts are saved in this folder
+        #                                     Use it for long runs, so an interrupted run can be resumed
+        #                                     Not available if hop_duration>0
+
+        #Number of bursts in each checkpoint file
+        self.checkpoint_interval=100
+        #                                 Number of completed bursts that are saved together in each checkpoint file
+        #                                     Only required if checkpoint is defined
+
+        #Resume from checkpoint
+        self.resume='no'
+        #                                 Define if to resume an interrupted run from its checkpoint files or not
+        #                                     resume='no': Start from the first burst, existing checkpoint files in checkpoint folder are removed
+        #                                     resume='yes': Skip bursts that are already saved in checkpoint folder
+        #                                     Checkpoint files are only used if they are created with the same properties and data
+        #                                     Only required if checkpoint is defined
+
+        #--------------------
+        #Result file setup
+        #--------------------
+
+        #HDF5 result file
+        self.hdf5_file=''
+        #                                 Path of HDF5 file to add results to
+        #                                     hdf5_file='': Results are not saved in a file
+        #                                     hdf5_file='C:\\oceanlyz_results.h5': Results of all bursts are added after bursts that are already in this file (HDF5WriteFun)
+        #                                     Each result is saved in a chunked and compressed dataset, HDF5ReadFun reads one result for a range of bursts
+        #                                     oceanlyzstream adds each burst to this file as soon as it is calculated
+        #                                     Input data of bursts ('Burst_Data') are not saved
+        #                                     h5py package is required
+
+        #Parquet result table
+        self.parquet_file=''
+        #                                 Path of Parquet table to add scalar results of each burst to
+        #                                     parquet_file='': Results are not saved in a table
+        #                                     parquet_file='C:\\oceanlyz_statistics': Results are added as a new file in this folder (ParquetWriteFun)
+        #                                     parquet_file='C:\\oceanlyz_statistics.parquet': Results of each run are added to this file
+        #                                     Each burst is a row, ParquetReadFun reads selected columns and rows that match filters (e.g. by time or Hm0)
+        #                                     pyarrow package is required
+
+        #Progress function
+        self.progress=None
+        #                                 Function that is called after each burst is calculated as progress(n_completed, n_total)
+        #                                     progress=None: Not used
+        #                                     Calculation is stopped if progress returns False, runoceanlyz raises RuntimeError and results of previous run are kept
+        #                                     If hop_duration>0, progress is called once after all windows are calculated
+
         #--------------------
         #Default values
         #--------------------
@@ -535,6 +849,19 @@ class oceanlyz:
         print('n_burst             : ', self.n_burst)
         print('burst_duration      : ', self.burst_duration)
         print('fs                  : ', self.fs)
+        if len(self.time)>0:
+            print('time                : ', '{} time stamps'.format(len(self.time)))
+            print('min_burst_fraction  : ', self.min_burst_fraction)
+        if self.decimation=='yes':
+            print('decimation          : ', self.decimation)
+        if self.zoomfft=='yes':
+            print('zoomfft             : ', self.zoomfft)
+        if not ((type(self.spectrum_band) is str) and (self.spectrum_band=='no')):
+            print('spectrum_band       : ', self.spectrum_band)
+        if self.wave_by_wave!='no':
+            print('wave_by_wave        : ', self.wave_by_wave)
+        if self.wave_database!='':
+            print('wave_database       : ', self.wave_database)
         
         #--------------------
         print('-------------------------------')
@@ -570,6 +897,23 @@ class oceanlyz:
         print('ftailcorrection     : ', self.ftailcorrection)
         print('tailpower           : ', self.tailpower)
         
+        #--------------------
+        print('-------------------------------')
+        print('hop_duration        : ', self.hop_duration)
+        print('crossspectra        : ', self.crossspectra)
+
+        #--------------------
+        print('-------------------------------')
+        print('checkpoint          : ', self.checkpoint)
+        print('checkpoint_interval : ', self.checkpoint_interval)
+        print('resume              : ', self.resume)
+        if self.hdf5_file!='':
+            print('hdf5_file           : ', self.hdf5_file)
+        if self.parquet_file!='':
+            print('parquet_file        : ', self.parquet_file)
+        if self.progress is not None:
+            print('progress            : ', self.progress)
+
         #--------------------
         
         #--------------------------------------------------------------------------
@@ -813,7 +1157,51 @@ class oceanlyz:
 
         #currentpath=pwd
         #cd(InputFileFolder)
-        d=(self.data)
+        d=np.asarray(self.data) #No copy for numpy, buffer-protocol (e.g. memoryview), and Arrow arrays
+
+        #Bursts from time stamps
+        if len(self.time)>0:
+            if self.hop_duration>0:
+                raise ValueError('time is not available if hop_duration>0.')
+            if self.crossspectra=='yes':
+                raise ValueError('time is not available if crossspectra=\'yes\'.')
+            if len(self.time)!=np.shape(d)[-1]:
+                raise ValueError('time should have the same length as data.')
+
+        #Sliding window analysis is calculated at once, so completed bursts can not be saved
+        if ((self.hop_duration>0) and (self.checkpoint!='')):
+            raise ValueError('checkpoint is not available if hop_duration>0.')
+
+        #Spectrum between fmin and fmax
+        if self.zoomfft=='yes':
+            if ((self.module not in [1,6]) or (self.hop_duration>0) or (self.crossspectra=='yes')):
+                raise ValueError('zoomfft=\'yes\' is only available for OutputType=\'wave\' or OutputType=\'wave+waterlevel\', AnalysisMethod=\'spectral\', SeparateSeaSwell=\'no\', hop_duration=0, and crossspectra=\'no\'.')
+
+        #Wave-by-wave results
+        if self.wave_by_wave not in ['no','yes','float32']:
+            raise ValueError('wave_by_wave should be \'no\', \'yes\', or \'float32\'.')
+
+        #Multi-channel data, each row of data is one channel
+        n_channel=0
+        heightfrombed=self.heightfrombed
+        Rho=self.Rho
+        if np.ndim(d)==2:
+
+            #Modules without a batched calculation are calculated for each channel separately
+            if ((self.module not in [1,3,6]) or (self.hop_duration>0) or (self.checkpoint!='') or (len(self.time)>0) or (self.zoomfft=='yes')):
+                wave=self.oceanlyzecalcwavechannel()
+                if self.crossspectra=='yes':
+                    d=np.asarray(d,dtype=np.float64)
+                    d=self.oceanlyzinterpolate(d,~np.isfinite(d))
+                    if self.InputType=='pressure':
+                        d=d/(np.broadcast_to(np.asarray(self.Rho,dtype=np.float64),(np.shape(d)[0],))[:,None]*9.81)
+                    self.oceanlyzcrossspectra(wave,d)
+                return wave
+
+            d=np.asarray(d,dtype=np.float64)
+            n_channel=np.shape(d)[0]
+            heightfrombed=np.broadcast_to(np.asarray(self.heightfrombed,dtype=np.float64),(n_channel,))
+            Rho=np.broadcast_to(np.asarray(self.Rho,dtype=np.float64),(n_channel,))[:,None]
         
         #Check if inputs are column vectors
         #if isrow(d)==1:
@@ -827,8 +1215,7 @@ class oceanlyz:
             warnings.warn('Oceanlyz continues with modified data.')
             
             #Replacing NaN values
-            Indx=np.linspace(0,len(d)-1,len(d))
-            d=np.interp(Indx,Indx(np.isnan(d)==0),d(np.isnan(d)==0))
+            d=self.oceanlyzinterpolate(d,np.isnan(d))
 
         
         #Check data for Inf
@@ -839,8 +1226,7 @@ class oceanlyz:
             warnings.warn('Oceanlyz continues with modified data.')
             
             #Replacing Inf values
-            Indx=np.linspace(0,len(d)-1,len(d))
-            d=np.interp(Indx,Indx(np.isinf(d)==0),d(np.isinf(d)==0))
+            d=self.oceanlyzinterpolate(d,np.isinf(d))
 
         
         #Check data for zero values
@@ -851,17 +1237,50 @@ class oceanlyz:
         #--------------------------------------------------------------------------
         
         #Calculate number of sample in 1 burst
-        n_sample=self.fs*self.burst_duration #Number of sample in 1 burst
+        n_sample=int(round(self.fs*self.burst_duration)) #Number of sample in 1 burst
         
         #Make sure n_burst and n_sample are int
         #self.n_burst = int(self.n_burst)
         #n_sample = int(n_sample)
 
+        #Burst index, data of burst i are d[burst_start[i]:burst_stop[i]]
+        if len(self.time)>0:
+            from .BurstIndexFun import BurstIndexFun
+
+            burst_start,burst_stop,burst_t0=BurstIndexFun(self.time,self.fs,self.burst_duration,1.5/self.fs,self.min_burst_fraction*self.burst_duration)
+            if len(burst_start)==0:
+                raise ValueError('No burst longer than min_burst_fraction*burst_duration is found in data.')
+
+            self.n_burst=len(burst_start)
+            burst_duration=(burst_stop-burst_start)/self.fs #Duration of each burst
+            n_sample=int(np.max(burst_stop-burst_start)) #Number of sample in the longest burst
+
+        else:
+            burst_start=np.arange(0,self.n_burst,1)*n_sample
+            burst_stop=burst_start+n_sample
+            burst_duration=np.full(self.n_burst,self.burst_duration) #Duration of each burst
+
+        #Decimation factor, data are analyzed at sampling frequency of fs_analysis
+        decimation_factor=1
+        fs_analysis=self.fs
+        if ((self.decimation=='yes') and (self.AnalysisMethod=='spectral')):
+            import scipy as sp
+            from scipy import signal
+
+            decimation_factor=self.oceanlyzdecimationfactor()
+            fs_analysis=self.fs/decimation_factor
+
+        n_analysis=-((burst_start-burst_stop)//decimation_factor) #Number of sample in each burst after decimation
+        if decimation_factor>1:
+            analysis_duration=n_analysis/fs_analysis #Duration of each burst after decimation
+        else:
+            analysis_duration=burst_duration
+
         #CALLING-FUNCTION----------------------------------------------------------
         #Call calculation functions
 
         if self.InputType=='pressure':
-            d=d/(self.Rho*9.81)
+            d=d/(Rho*9.81)
 
         if ((self.InputType=='pressure') and (self.fmaxpcorrCalcMethod=='auto')):
             autofmaxpcorr='on'
@@ -893,13 +1312,123 @@ class oceanlyz:
         from .WaveZerocrossingFun import WaveZerocrossingFun
         #os.chdir(OceanlyzFolder) #Change current path to OCEANLYZ folder
 
+        #Spectrum is only calculated between fmin and fmax, WaveSpectraZoomFun has the same inputs and outputs as WaveSpectraFun
+        if self.zoomfft=='yes':
+            from .WaveSpectraZoomFun import WaveSpectraZoomFun as WaveSpectraFun
+
+        #Sliding window analysis, windows overlap and segment spectra are shared between windows
+        if self.hop_duration>0:
+
+            if self.module!=1:
+                raise ValueError('hop_duration>0 is only available for InputType=\'waterlevel\', OutputType=\'wave\', AnalysisMethod=\'spectral\', and SeparateSeaSwell=\'no\'.')
+
+            from .WaveSpectraSlidingFun import WaveSpectraSlidingFun
+
+            input_data=d[0:int(self.n_burst*n_sample)]
+            if decimation_factor>1:
+                input_data=sp.signal.resample_poly(input_data,1,decimation_factor)
+
+            Hm0,_,_,Tp,fp,f,Syy,Window_Start=WaveSpectraSlidingFun(input_data,fs_analysis,self.burst_duration,self.hop_duration,self.nfft,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
+
+            wave={'Hm0':Hm0, 'Tp':Tp, 'fp':fp, 'f':f, 'Syy':Syy, 'Window_Start':Window_Start}
+            wave['Field_Names'] = ['Hm0, Tp, fp, f, Syy, Window_Start, Field_Names']
+
+            if self.dispout=='no':
+                print('\n {} windows'.format(len(Hm0)))
+
+            self.oceanlyzprogress(len(Hm0),len(Hm0))
+
+            self.oceanlyzspectrumband(wave)
+
+            return wave
+
+        #Multi-channel data, all channels of each burst are calculated together
+        if n_channel>0:
+
+            from .PcorFFTBatchFun import PcorFFTBatchFun
+            from .WaveSpectraBatchFun import WaveSpectraBatchFun
+
+            #Initialize array, first axis is channel
+            ini_arr=np.zeros((n_channel,self.n_burst)) #Initialize array
+            ini_arr_f_Syy=np.zeros((n_channel,self.n_burst,int(self.nfft/2+1))) #Initialize array to store spectrum data
+            ini_arr_f=np.zeros(int(self.nfft/2+1)) #Initialize array to store frequency, the same for all channels and bursts
+            ini_arr_Eta=np.zeros((n_channel,self.n_burst,int(np.max(n_analysis)))) #Initialize array to store surface elevation data
+            ini_arr_burst_data=np.zeros((n_channel,self.n_burst,n_sample)) #Initialize array to store burst data
+
+            if self.module==1:
+                wave={'Hm0':ini_arr.copy(), 'Tp':ini_arr.copy(), 'fp':ini_arr.copy(), 'f':ini_arr_f.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
+                wave['Field_Names'] = ['Hm0, Tp, fp, f, Syy, Field_Names, Burst_Data']
+            elif self.module==3:
+                wave={'Eta':ini_arr_Eta.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
+                wave['Field_Names'] = ['Eta, Field_Names, Burst_Data']
+            elif self.module==6:
+                wave={'Eta':ini_arr_Eta.copy(), 'Hm0':ini_arr.copy(), 'Tp':ini_arr.copy(), 'fp':ini_arr.copy(), 'f':ini_arr_f.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
+                wave['Field_Names'] = ['Eta, Hm0, Tp, fp, f, Syy, Field_Names, Burst_Data']
+
+            for i in range(0,self.n_burst,1):
+
+                if self.dispout=='yes':
+                    print('--------------------------------------------------')
+                    print('Burst = '+str(i+1))
+
+                #Load burst data of all channels
+                j1=i*n_sample
+                j2=(i+1)*n_sample
+                input_data=d[:,j1:j2]
+
+                #Calculate mean water depth of each channel
+                if self.InputType=='waterlevel':
+                    h=np.mean(input_data,axis=1) #Calculating mean water depth from water depth data
+                elif self.InputType=='pressure':
+                    h=np.mean(input_data,axis=1)+heightfrombed #Calculating mean water depth from pressure data
+
+                if np.any(h<=0):
+                    warnings.warn('Mean water depth is Zero or negative, Oceanlyz continues with mean water depth=0.001 m.')
+                    h[h<=0]=0.001
+
+                #Decimate burst data of all channels before analysis
+                if decimation_factor>1:
+                    input_data=sp.signal.resample_poly(input_data,1,decimation_factor,axis=1)
+
+                #Call function
+                if self.module==1:
+                    wave['Hm0'][:,i],_,_,wave['Tp'][:,i],wave['fp'][:,i],wave['f'][:],wave['Syy'][:,i,:]=WaveSpectraBatchFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,heightfrombed,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
+
+                elif self.module==3:
+                    wave['Eta'][:,i,:],_=PcorFFTBatchFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off')
+
+                elif self.module==6:
+                    wave['Eta'][:,i,:],_=PcorFFTBatchFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off')
+                    wave['Hm0'][:,i],_,_,wave['Tp'][:,i],wave['fp'][:,i],wave['f'][:],wave['Syy'][:,i,:]=WaveSpectraBatchFun((wave['Eta'][:,i,:]),fs_analysis,analysis_duration[i],self.nfft,h,heightfrombed,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
+
+                if self.dispout=='no':
+                    print('\n burst {} out of {}'.format(i+1,self.n_burst))
+
+                wave['Burst_Data'][:,i,:]=d[:,j1:j2] #Save input burst data
+
+                self.oceanlyzprogress(i+1,self.n_burst)
+
+            if self.crossspectra=='yes':
+                self.oceanlyzcrossspectra(wave,d)
+
+            self.oceanlyzspectrumband(wave)
+
+            return wave
+
         #Initialize array
         ini_arr=np.zeros(self.n_burst) #Initialize array
         ini_arr_f_Syy=np.zeros((self.n_burst,int(self.nfft/2+1))) #Initialize array to store spectrum data
-        ini_arr_Eta=np.zeros((self.n_burst,n_sample)) #Initialize array to store surface elevation data
+        ini_arr_f=np.zeros(int(self.nfft/2+1)) #Initialize array to store frequency, the same for all bursts
+        ini_arr_Eta=np.zeros((self.n_burst,int(np.max(n_analysis)))) #Initialize array to store surface elevation data
         ini_arr_burst_data=np.zeros((self.n_burst,n_sample)) #Initialize array to store burst data
+
+        #Bursts shorter than the longest burst are padded with NaN
+        if len(self.time)>0:
+            ini_arr_Eta[:,:]=np.nan
+            ini_arr_burst_data[:,:]=np.nan
+
         if self.module==1:
-            wave={'Hm0':ini_arr.copy(), 'Tp':ini_arr.copy(), 'fp':ini_arr.copy(), 'f':ini_arr_f_Syy.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
+            wave={'Hm0':ini_arr.copy(), 'Tp':ini_arr.copy(), 'fp':ini_arr.copy(), 'f':ini_arr_f.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
 
         elif self.module==2:
             wave={'Hs':ini_arr.copy(), 'Hz':ini_arr.copy(), 'Tz':ini_arr.copy(), 'Ts':ini_arr.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
@@ -911,21 +1440,44 @@ class oceanlyz:
             wave={'Eta':ini_arr_Eta.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
 
         elif self.module==5:
-            wave={'Hm0':ini_arr.copy(), 'Hm0sea':ini_arr.copy(), 'Hm0swell':ini_arr.copy(), 'Tp':ini_arr.copy(), 'Tpsea':ini_arr.copy(), 'Tpswell':ini_arr.copy(), 'fp':ini_arr.copy(), 'fseparation':ini_arr.copy(), 'f':ini_arr_f_Syy.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
+            wave={'Hm0':ini_arr.copy(), 'Hm0sea':ini_arr.copy(), 'Hm0swell':ini_arr.copy(), 'Tp':ini_arr.copy(), 'Tpsea':ini_arr.copy(), 'Tpswell':ini_arr.copy(), 'fp':ini_arr.copy(), 'fseparation':ini_arr.copy(), 'f':ini_arr_f.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
 
         elif self.module==6:
-            wave={'Eta':ini_arr_Eta.copy(), 'Hm0':ini_arr.copy(), 'Tp':ini_arr.copy(), 'fp':ini_arr.copy(), 'f':ini_arr_f_Syy.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
+            wave={'Eta':ini_arr_Eta.copy(), 'Hm0':ini_arr.copy(), 'Tp':ini_arr.copy(), 'fp':ini_arr.copy(), 'f':ini_arr_f.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
 
         elif self.module==7:
             wave={'Eta':ini_arr_Eta.copy(), 'Hs':ini_arr.copy(), 'Hz':ini_arr.copy(), 'Tz':ini_arr.copy(), 'Ts':ini_arr.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
 
         elif self.module==8:
-            wave={'Eta':ini_arr_Eta.copy(), 'Hm0':ini_arr.copy(), 'Hm0sea':ini_arr.copy(), 'Hm0swell':ini_arr.copy(), 'Tp':ini_arr.copy(), 'Tpsea':ini_arr.copy(), 'Tpswell':ini_arr.copy(), 'fp':ini_arr.copy(), 'fseparation':ini_arr.copy(), 'f':ini_arr_f_Syy.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
-
+            wave={'Eta':ini_arr_Eta.copy(), 'Hm0':ini_arr.copy(), 'Hm0sea':ini_arr.copy(), 'Hm0swell':ini_arr.copy(), 'Tp':ini_arr.copy(), 'Tpsea':ini_arr.copy(), 'Tpswell':ini_arr.copy(), 'fp':ini_arr.copy(), 'fseparation':ini_arr.copy(), 'f':ini_arr_f.copy(), 'Syy':ini_arr_f_Syy.copy(), 'Burst_Data':ini_arr_burst_data.copy()} #Initialize dictionary
+
+        #Time stamp and duration of each burst
+        if len(self.time)>0:
+            wave['Burst_Start']=burst_t0
+            wave['Burst_Duration']=burst_duration
+
+        #Height, period, crest, trough, and time of waves in each burst, they are saved in a ragged layout after all bursts are calculated
+        wave_ragged=None
+        wave_detail='off'
+        if ((self.wave_by_wave!='no') and ((self.module==2) or (self.module==7))):
+            wave_ragged={key: [np.zeros(0)]*self.n_burst for key in ['H','T','Crest','Trough','Wave_Time']}
+            wave_detail='on'
+
+        #Load results of completed bursts from checkpoint files
+        completed_burst=np.zeros(self.n_burst,dtype=bool) #Bursts that are already calculated
+        if self.checkpoint!='':
+            checkpoint_hash=self.oceanlyzcheckpointhash()
+            completed_burst=self.oceanlyzcheckpointload(wave,checkpoint_hash,wave_ragged)
+            checkpoint_burst=[] #Bursts that are not saved in checkpoint files yet
 
         #Calculation functions
         for i in range(0,self.n_burst,1):
             
+            #Skip bursts that are loaded from checkpoint files
+            if completed_burst[i]==True:
+                wave['Burst_Data'][i,0:burst_stop[i]-burst_start[i]]=d[burst_start[i]:burst_stop[i]] #Save input burst data
+                continue
+
             if self.dispout=='yes':
                 Step='Burst = '+str(i+1)
                 print('--------------------------------------------------')
@@ -934,9 +1486,10 @@ class oceanlyz:
                 #    hold on
         
             #Load burst data
-            j1=i*n_sample
-            j2=(i+1)*n_sample
+            j1=burst_start[i]
+            j2=burst_stop[i]
             input_data=d[j1:j2]
+            n_data=j2-j1 #Number of sample in this burst
             
             #Calculate mean water depth
             if self.InputType=='waterlevel':
@@ -948,44 +1501,52 @@ class oceanlyz:
                 warnings.warn('Mean water depth is Zero or negative, Oceanlyz continues with mean water depth=0.001 m.')
                 h=0.001
 
+            #Decimate burst data before analysis
+            if decimation_factor>1:
+                input_data=sp.signal.resample_poly(input_data,1,decimation_factor)
+
             
             #Call function
             if self.module==1:
-                wave['Hm0'][i],_,_,wave['Tp'][i],wave['fp'][i],wave['f'][i,:],wave['Syy'][i,:]=WaveSpectraFun(input_data,self.fs,self.burst_duration,self.nfft,h,self.heightfrombed,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
+                wave['Hm0'][i],_,_,wave['Tp'][i],wave['fp'][i],wave['f'][:],wave['Syy'][i,:]=WaveSpectraFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,self.heightfrombed,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
                 wave['Field_Names'] = ['Hm0, Tp, fp, f, Syy, Field_Names, Burst_Data']
         
             elif self.module==2:
-                wave['Hs'][i],wave['Hz'][i],wave['Tz'][i],wave['Ts'][i],_,_=WaveZerocrossingFun(input_data,self.fs,self.burst_duration,'off')
+                wave['Hs'][i],wave['Hz'][i],wave['Tz'][i],wave['Ts'][i],*wave_burst=WaveZerocrossingFun(input_data,fs_analysis,analysis_duration[i],'off',wave_detail)
                 wave['Field_Names'] = ['Hs, Hz, Tz, Ts,  Field_Names, Burst_Data']
             
             elif self.module==3:
-                wave['Eta'][i,:],_=PcorFFTFun(input_data,self.fs,self.burst_duration,self.nfft,h,self.heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off')
+                wave['Eta'][i,0:n_analysis[i]],_=PcorFFTFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,self.heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off')
                 wave['Field_Names'] = ['Eta, Field_Names, Burst_Data']
         
             elif self.module==4:
-                wave['Eta'][i,:]=PcorZerocrossingFun(input_data,self.fs,self.burst_duration,h,self.heightfrombed,'off')
+                wave['Eta'][i,0:n_analysis[i]]=PcorZerocrossingFun(input_data,fs_analysis,analysis_duration[i],h,self.heightfrombed,'off')
                 wave['Field_Names'] = ['Eta, Field_Names, Burst_Data']
             
             elif self.module==5:
-                wave['Hm0'][i],wave['Hm0sea'][i],wave['Hm0swell'][i],wave['Tp'][i],wave['Tpsea'][i],wave['Tpswell'][i],wave['fp'][i],wave['fseparation'][i],wave['f'][i,:],wave['Syy'][i,:]=SeaSwellFun(input_data,self.fs,self.burst_duration,self.nfft,h,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.fpminswell,self.fmaxswell,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
+                wave['Hm0'][i],wave['Hm0sea'][i],wave['Hm0swell'][i],wave['Tp'][i],wave['Tpsea'][i],wave['Tpswell'][i],wave['fp'][i],wave['fseparation'][i],wave['f'][:],wave['Syy'][i,:]=SeaSwellFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.fpminswell,self.fmaxswell,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
                 wave['Field_Names'] = ['Hm0, Hm0sea, Hm0swell, Tp, Tpsea, Tpswell, fp, fseparation, f, Syy, Field_Names, Burst_Data']
         
             elif self.module==6:
-                wave['Eta'][i,:],ftailcorrection=PcorFFTFun(input_data,self.fs,self.burst_duration,self.nfft,h,self.heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off') 
-                wave['Hm0'][i],_,_,wave['Tp'][i],wave['fp'][i],wave['f'][i,:],wave['Syy'][i,:]=WaveSpectraFun((wave['Eta'][i,:]),self.fs,self.burst_duration,self.nfft,h,self.heightfrombed,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
+                wave['Eta'][i,0:n_analysis[i]],ftailcorrection=PcorFFTFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,self.heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off') 
+                wave['Hm0'][i],_,_,wave['Tp'][i],wave['fp'][i],wave['f'][:],wave['Syy'][i,:]=WaveSpectraFun((wave['Eta'][i,0:n_analysis[i]]),fs_analysis,analysis_duration[i],self.nfft,h,self.heightfrombed,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
                 wave['Field_Names'] = ['Eta, Hm0, Tp, fp, f, Syy, Field_Names, Burst_Data']
         
             elif self.module==7:
-                wave['Eta'][i,:]=PcorZerocrossingFun(input_data,self.fs,self.burst_duration,h,self.heightfrombed,'off')
-                wave['Hs'][i],wave['Hz'][i],wave['Tz'][i],wave['Ts'][i],_,_=WaveZerocrossingFun((wave['Eta'][i,:]),self.fs,self.burst_duration,'off')
+                wave['Eta'][i,0:n_analysis[i]]=PcorZerocrossingFun(input_data,fs_analysis,analysis_duration[i],h,self.heightfrombed,'off')
+                wave['Hs'][i],wave['Hz'][i],wave['Tz'][i],wave['Ts'][i],*wave_burst=WaveZerocrossingFun((wave['Eta'][i,0:n_analysis[i]]),fs_analysis,analysis_duration[i],'off',wave_detail)
                 wave['Field_Names'] = ['Eta, Hs, Hz, Tz, Ts, Field_Names, Burst_Data']
         
             elif self.module==8:
-                wave['Eta'][i,:],ftailcorrection=PcorFFTFun(input_data,self.fs,self.burst_duration,self.nfft,h,self.heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off')
-                wave['Hm0'][i],wave['Hm0sea'][i],wave['Hm0swell'][i],wave['Tp'][i],wave['Tpsea'][i],wave['Tpswell'][i],wave['fp'][i],wave['fseparation'][i],wave['f'][i,:],wave['Syy'][i,:]=SeaSwellFun((wave['Eta'][i,:]),self.fs,self.burst_duration,self.nfft,h,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.fpminswell,self.fmaxswell,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
+                wave['Eta'][i,0:n_analysis[i]],ftailcorrection=PcorFFTFun(input_data,fs_analysis,analysis_duration[i],self.nfft,h,self.heightfrombed,self.fminpcorr,self.fmaxpcorr,self.ftailcorrection,pressureattenuation,autofmaxpcorr,'off')
+                wave['Hm0'][i],wave['Hm0sea'][i],wave['Hm0swell'][i],wave['Tp'][i],wave['Tpsea'][i],wave['Tpswell'][i],wave['fp'][i],wave['fseparation'][i],wave['f'][:],wave['Syy'][i,:]=SeaSwellFun((wave['Eta'][i,0:n_analysis[i]]),fs_analysis,analysis_duration[i],self.nfft,h,self.fmin,self.fmax,self.ftailcorrection,self.tailpower,self.fpminswell,self.fmaxswell,self.mincutoff,self.maxcutoff,self.tailcorrection,dispout)
                 wave['Field_Names'] = ['Eta, Hm0, Hm0sea, Hm0swell, Tp, Tpsea, Tpswell, fp, fseparation, f, Syy, Field_Names, Burst_Data']
             
-            
+            #Keep height, period, crest, trough, and time of waves in this burst
+            if wave_ragged is not None:
+                for key, value in zip(wave_ragged.keys(),wave_burst):
+                    wave_ragged[key][i]=value
+
             #self.dispout=='yes':
             #    wb=waitbar(i/self.n_burst)
             #    waitbar(i/self.n_burst,wb,sprintf('Percentage = #0.2f',i/self.n_burst*100))
@@ -995,17 +1556,393 @@ class oceanlyz:
             if self.dispout=='no':
                 print('\n burst {} out of {}'.format(i+1,self.n_burst))
         
-            wave['Burst_Data'][i,:]=input_data.copy() #Save input burst data
+            wave['Burst_Data'][i,0:n_data]=d[j1:j2] #Save input burst data
+
+            #Save results of completed bursts to checkpoint file
+            if self.checkpoint!='':
+                checkpoint_burst.append(i)
+                if ((len(checkpoint_burst)>=self.checkpoint_interval) or (i==self.n_burst-1)):
+                    self.oceanlyzcheckpointsave(wave,checkpoint_burst,wave_ragged)
+                    checkpoint_burst=[]
+
+            self.oceanlyzprogress(i+1,self.n_burst)
+
+        #Add time stamp and duration of bursts to key names
+        if ((len(self.time)>0) and ('Burst_Start' not in wave['Field_Names'][0])):
+            wave['Field_Names']=[wave['Field_Names'][0].replace('Field_Names','Burst_Start, Burst_Duration, Field_Names')]
+
+        #Wave-by-wave results as flat arrays, waves of burst i are H[Wave_Offset[i]:Wave_Offset[i+1]]
+        if wave_ragged is not None:
+            if self.wave_by_wave=='float32':
+                wave_dtype=np.float32
+            else:
+                wave_dtype=np.float64
+
+            wave['Wave_Offset']=np.concatenate(([0],np.cumsum([len(H) for H in wave_ragged['H']]))).astype(np.int64)
+            for key in wave_ragged.keys():
+                wave[key]=np.concatenate(wave_ragged[key]).astype(wave_dtype)
+            if 'Wave_Offset' not in wave['Field_Names'][0]:
+                wave['Field_Names']=[wave['Field_Names'][0].replace('Field_Names','H, T, Crest, Trough, Wave_Time, Wave_Offset, Field_Names')]
+
+        self.oceanlyzspectrumband(wave)
 
         return wave
         
 
+    #==========================================================================
+    def oceanlyzecalcwavechannel(self):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Calculate wave properties of multi-channel data one channel at a time
+        #Used for modules that do not have a batched calculation
+        #
+        #OUTPUT
+        #------
+        #Wave properties as a Python dictionary, first axis of each value is channel
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+        import copy
+        import os
+
+        data=np.asarray(self.data,dtype=np.float64)
+        n_channel=np.shape(data)[0]
+        heightfrombed=np.broadcast_to(np.asarray(self.heightfrombed,dtype=np.float64),(n_channel,))
+        Rho=np.broadcast_to(np.asarray(self.Rho,dtype=np.float64),(n_channel,))
+
+        wave_channel=[]
+        for j in range(0,n_channel,1):
+
+            if self.dispout=='no':
+                print('\n channel {} out of {}'.format(j+1,n_channel))
+
+            ocn_channel=copy.copy(self)
+            ocn_channel.data=data[j,:]
+            ocn_channel.heightfrombed=float(heightfrombed[j])
+            ocn_channel.Rho=float(Rho[j])
+
+            #Each channel has its own checkpoint folder
+            if self.checkpoint!='':
+                ocn_channel.checkpoint=os.path.join(self.checkpoint,'channel_{:04d}'.format(j+1))
+
+            #Progress of all channels
+            if self.progress is not None:
+                ocn_channel.progress=lambda n_completed, n_total, j=j: self.progress(j*n_total+n_completed, n_channel*n_total)
+
+            wave_channel.append(ocn_channel.oceanlyzecalcwave())
+
+        #Number of bursts is calculated from time stamps if time is defined
+        self.n_burst=ocn_channel.n_burst
+
+        #Stack results of channels
+        wave={}
+        for key in wave_channel[0].keys():
+            if ((key=='Field_Names') or (key=='f') or (key=='Band_Width')):
+                wave[key]=wave_channel[0][key] #The same for all channels
+            elif key in ['H','T','Crest','Trough','Wave_Time']:
+                wave[key]=np.concatenate([wave_j[key] for wave_j in wave_channel]) #Waves of all channels one after another
+            elif key=='Wave_Offset':
+                channel_offset=np.cumsum([0]+[len(wave_j['H']) for wave_j in wave_channel[:-1]]) #Index of first wave of each channel
+                wave[key]=np.stack([wave_j[key]+channel_offset[j] for j, wave_j in enumerate(wave_channel)])
+            else:
+                wave[key]=np.stack([wave_j[key] for wave_j in wave_channel])
+
+        return wave
+
+    #==========================================================================
+    def oceanlyzprogress(self,n_completed,n_total):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Call progress function after a burst is calculated
+        #Calculation is stopped if progress function returns False
+        #
+        #--------------------------------------------------------------------------
+
+        if self.progress is not None:
+            if self.progress(n_completed,n_total)==False:
+                raise RuntimeError('Calculation is stopped by progress function after {} out of {} bursts.'.format(n_completed,n_total))
+
+    #==========================================================================
+    def oceanlyzcrossspectra(self,wave,d):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Calculate cross power spectral density of all pairs of channels and add it to wave as 'Sxy'
+        #d is data after NaN and Inf values are replaced, pressure data are converted to (m)
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+
+        from .CrossSpectraFun import CrossSpectraFun
+
+        n_sample=int(round(self.fs*self.burst_duration)) #Number of sample in 1 burst
+        data=d[:,0:int(self.n_burst*n_sample)]
+
+        #Data are decimated as in wave calculation, so Sxy has the same frequencies as Syy
+        fs_analysis=self.fs
+        analysis_duration=self.burst_duration
+        if ((self.decimation=='yes') and (self.AnalysisMethod=='spectral')):
+            decimation_factor=self.oceanlyzdecimationfactor()
+
+            if decimation_factor>1:
+                import scipy as sp
+                from scipy import signal
+
+                data=np.reshape(data,(np.shape(data)[0],self.n_burst,n_sample))
+                data=sp.signal.resample_poly(data,1,decimation_factor,axis=2)
+                fs_analysis=self.fs/decimation_factor
+                analysis_duration=np.shape(data)[2]/fs_analysis #Duration of each burst after decimation
+                data=np.reshape(data,(np.shape(data)[0],-1))
+
+        if self.Kpafterfmaxpcorr=='one':
+            pressureattenuation='on'
+        else:
+            pressureattenuation='all'
+
+        wave['Sxy'],f=CrossSpectraFun(data,fs_analysis,analysis_duration,self.nfft,self.heightfrombed,self.fmaxpcorr,self.InputType,pressureattenuation,'off')
+
+        #Cross spectra are averaged in the same frequency bands as Syy
+        if not ((type(self.spectrum_band) is str) and (self.spectrum_band=='no')):
+            from .SpectrumBandFun import SpectrumBandFun
+            _,wave['Sxy'],_=SpectrumBandFun(f,wave['Sxy'],self.spectrum_band,'off')
+
+        wave['Field_Names']=[wave['Field_Names'][0].replace(', Field_Names',', Sxy, Field_Names')]
+
+    #==========================================================================
+    def oceanlyzinterpolate(self,d,replace):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Replace values of data where replace is True by linear interpolation of other values
+        #Each channel (row) of multi-channel data is interpolated separately, input data is not modified
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+
+        if not np.any(replace):
+            return d
+
+        d=np.array(d,dtype=np.float64)
+        n_data=np.shape(d)[-1]
+        Indx=np.arange(0,n_data,1)
+        for d_channel, replace_channel in zip(np.reshape(d,(-1,n_data)),np.reshape(replace,(-1,n_data))):
+            d_channel[replace_channel]=np.interp(Indx[replace_channel],Indx[~replace_channel],d_channel[~replace_channel])
+
+        return d
+
+    #==========================================================================
+    def oceanlyzspectrumband(self,wave):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Average spectrum of all bursts in frequency bands if spectrum_band is defined
+        #'f' and 'Syy' are replaced by center frequency and band-averaged spectrum, and width of bands is added as 'Band_Width'
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        if ((type(self.spectrum_band) is str) and (self.spectrum_band=='no')):
+            return
+
+        if 'Syy' not in wave:
+            return
+
+        from .SpectrumBandFun import SpectrumBandFun
+
+        wave['f'],wave['Syy'],wave['Band_Width']=SpectrumBandFun(wave['f'],wave['Syy'],self.spectrum_band,'off')
+        wave['Field_Names']=[wave['Field_Names'][0].replace(', Syy,',', Syy, Band_Width,')]
+
+    #==========================================================================
+    def oceanlyzdecimationfactor(self):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Calculate decimation factor from the highest frequency used in analysis
+        #Highest frequency should be below 80% of Nyquist frequency after decimation, where the anti-aliasing filter is flat
+        #
+        #OUTPUT
+        #------
+        #Decimation factor as an integer (1 means no decimation)
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+
+        #Spectrum up to Nyquist frequency is used if it is not cut off at fmax
+        if ((self.maxcutoff=='off') or (self.fmax>=self.fs/2)):
+            return 1
+
+        #Highest frequency used in analysis
+        fhigh=self.fmax
+        if ((self.tailcorrection=='jonswap') or (self.tailcorrection=='tma')):
+            fhigh=np.max([fhigh,self.ftailcorrection])
+        if self.InputType=='pressure':
+            fhigh=np.max([fhigh,self.fmaxpcorr])
+        if self.SeparateSeaSwell=='yes':
+            fhigh=np.max([fhigh,self.fmaxswell])
+
+        decimation_factor=int(np.max([1,np.floor(0.8*self.fs/(2*fhigh))]))
+
+        return decimation_factor
+
+    #==========================================================================
+    def oceanlyzcheckpointhash(self):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Calculate a hash of properties and data to identify checkpoint files
+        #
+        #OUTPUT
+        #------
+        #Hash as a hexadecimal string
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+        import hashlib
+        import json
+
+        #Properties that do not change results
+        excluded_properties=['data','time','wave','dispout','checkpoint','checkpoint_interval','resume','wave_database','hdf5_file','parquet_file','progress']
+
+        properties={key: value for key, value in self.__dict__.items() if key not in excluded_properties}
+
+        checkpoint_hash=hashlib.sha256()
+        checkpoint_hash.update(json.dumps(properties,sort_keys=True,default=str).encode('utf-8'))
+        checkpoint_hash.update(np.ascontiguousarray(self.data,dtype=np.float64).data)
+        if len(self.time)>0:
+            checkpoint_hash.update(np.asarray(self.time).tobytes())
+
+        return checkpoint_hash.hexdigest()
+
+
+    #==========================================================================
+    def oceanlyzcheckpointload(self,wave,checkpoint_hash,wave_ragged=None):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Load results of completed bursts from checkpoint files into wave dictionary
+        #Wave-by-wave results are loaded into wave_ragged, a list of arrays for each key
+        #If resume='no', existing checkpoint files are removed
+        #
+        #OUTPUT
+        #------
+        #Boolean array that is True for bursts loaded from checkpoint files
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+        import os
+        import glob
+        import json
+
+        completed_burst=np.zeros(self.n_burst,dtype=bool)
+
+        os.makedirs(self.checkpoint,exist_ok=True)
+        ConfigPath=os.path.join(self.checkpoint,'checkpoint_config.json')
+        CheckpointPaths=sorted(glob.glob(os.path.join(self.checkpoint,'checkpoint_*_*.npz')))
+
+        if self.resume=='yes':
+
+            if os.path.isfile(ConfigPath):
+                with open(ConfigPath,'r') as file:
+                    checkpoint_config=json.load(file)
+
+                if checkpoint_config['checkpoint_hash']!=checkpoint_hash:
+                    raise ValueError('Checkpoint files in "{}" are created with different properties or data, use resume=\'no\' to start a new run'.format(self.checkpoint))
+
+                #Assemble results from checkpoint files
+                for CheckpointPath in CheckpointPaths:
+                    with np.load(CheckpointPath) as checkpoint_file:
+                        burst_index=checkpoint_file['burst_index']
+                        for key in wave.keys():
+                            if ((key in checkpoint_file.files) and (key!='Field_Names') and (key!='f')):
+                                wave[key][burst_index]=checkpoint_file[key]
+                        if 'f' in checkpoint_file.files:
+                            wave['f'][:]=checkpoint_file['f'] #Frequency is the same for all bursts
+                        wave['Field_Names']=list(checkpoint_file['Field_Names'])
+                        if ((wave_ragged is not None) and ('Wave_Count' in checkpoint_file.files)):
+                            wave_split=np.cumsum(checkpoint_file['Wave_Count'])[:-1]
+                            for key in wave_ragged.keys():
+                                for i, value in zip(burst_index,np.split(checkpoint_file[key],wave_split)):
+                                    wave_ragged[key][i]=value
+                    completed_burst[burst_index]=True
+
+                print('{} burst(s) out of {} are loaded from checkpoint files'.format(np.sum(completed_burst),self.n_burst))
+
+        else:
+
+            #Remove checkpoint files of previous run
+            for CheckpointPath in CheckpointPaths:
+                os.remove(CheckpointPath)
+
+        #Save hash of current run
+        with open(ConfigPath,'w') as file:
+            json.dump({'checkpoint_hash':checkpoint_hash, 'n_burst':self.n_burst, 'module':self.module},file)
+
+        return completed_burst
+
+
+    #==========================================================================
+    def oceanlyzcheckpointsave(self,wave,checkpoint_burst,wave_ragged=None):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Save results of completed bursts in a checkpoint file
+        #Wave-by-wave results in wave_ragged are saved as flat arrays with number of waves in each burst
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+        import os
+
+        burst_index=np.array(checkpoint_burst,dtype=np.int64)
+
+        checkpoint_data={key: value[burst_index] for key, value in wave.items() if ((key!='Field_Names') and (key!='Burst_Data') and (key!='f'))}
+        if 'f' in wave:
+            checkpoint_data['f']=wave['f'] #Frequency is the same for all bursts
+        if wave_ragged is not None:
+            checkpoint_data['Wave_Count']=np.array([len(wave_ragged['H'][i]) for i in burst_index],dtype=np.int64)
+            for key in wave_ragged.keys():
+                checkpoint_data[key]=np.concatenate([wave_ragged[key][i] for i in burst_index])
+        checkpoint_data['burst_index']=burst_index
+        checkpoint_data['Field_Names']=np.array(wave['Field_Names'])
+
+        #Write to a temporary file first, so an interrupted write does not leave a broken checkpoint file
+        CheckpointPath=os.path.join(self.checkpoint,'checkpoint_{:08d}_{:08d}.npz'.format(burst_index[0],burst_index[-1]))
+        with open(CheckpointPath+'.tmp','wb') as file:
+            np.savez(file,**checkpoint_data)
+        os.replace(CheckpointPath+'.tmp',CheckpointPath)
+        
+
     #==========================================================================
     def runoceanlyz(self):
         #--------------------------------------------------------------------------
         #Import required packages
         #https://stackoverflow.com/questions/38087060/using-import-inside-class/38087292
         
+        import numpy as np
         import datetime
         import warnings
         #import os
@@ -1045,6 +1982,43 @@ class oceanlyz:
 
         self.wave=self.oceanlyzecalcwave()
 
+        #Number of channels and time of each burst for result files
+        if np.ndim(self.data)==2:
+            n_channel=np.shape(self.data)[0]
+        else:
+            n_channel=0
+
+        if 'Burst_Start' in self.wave:
+            burst_time=self.wave['Burst_Start']
+        elif 'Window_Start' in self.wave:
+            burst_time=self.wave['Window_Start']
+        else:
+            burst_time=np.arange(0,self.n_burst,1)*self.burst_duration #Time from start of data
+
+        #Add results to HDF5 file
+        if self.hdf5_file!='':
+            from .HDF5WriteFun import HDF5WriteFun
+
+            HDF5WriteFun(self.hdf5_file,self.wave,n_channel,'on')
+
+        #Frequency as a 2-D view with the same shape as spectrum
+        if ((self.f_2d=='yes') and ('f' in self.wave)):
+            self.wave['f']=np.broadcast_to(self.wave['f'],np.shape(self.wave['Syy']))
+            if 'Band_Width' in self.wave:
+                self.wave['Band_Width']=np.broadcast_to(self.wave['Band_Width'],np.shape(self.wave['Syy']))
+
+        #Add wave-by-wave results to database
+        if ((self.wave_database!='') and ('Wave_Offset' in self.wave)):
+            from .WaveDatabaseFun import WaveDatabaseFun
+
+            WaveDatabaseFun(self.wave_database,self.wave,burst_time,'on')
+
+        #Add scalar results of each burst to Parquet table
+        if self.parquet_file!='':
+            from .ParquetWriteFun import ParquetWriteFun
+
+            ParquetWriteFun(self.parquet_file,self.wave,burst_time,n_channel,'on')
+
 
         #Output fields
         print('--------------------------------------------------')
@@ -0,0 +1,509 @@
+#--------------------------------------------------------------------------
+#CODE
+#--------------------------------------------------------------------------
+#Import required packages
+
+import os
+import sys
+import glob
+import json
+import time
+import re
+import hashlib
+import argparse
+
+#--------------------------------------------------------------------------
+#Read configuration file
+
+def readconfig(ConfigPath):
+    #
+    #DESCRIPTION
+    #-----------
+    #
+    #Read OCEANLYZ properties from a configuration file
+    #Each line is 'name = value', lines start with '#' are comments
+    #Configuration file saved by OCEANLYZ GUI (saved_file_name_config.txt) and OCEANLYZ project file (.ocnz) are also read,
+    #so an analysis that is set up in OCEANLYZ GUI is repeated for other data files
+    #For OCEANLYZ GUI files, n_burst (and time) of GUI analysis are not used, they belong to data of GUI analysis
+    #
+    #OUTPUT
+    #------
+    #Python dictionary of OCEANLYZ properties
+    #
+    #--------------------------------------------------------------------------
+
+    from .oceanlyz import oceanlyz
+
+    ocn_properties=oceanlyz().__dict__
+
+    #Properties that belong to data and results of GUI analysis
+    gui_data_properties=['data', 'wave', 'n_burst', 'time', 'module', 'dispout']
+
+    #--------------------------------------------------------------------------
+    #OCEANLYZ project file, properties that are different from default values
+
+    with open(ConfigPath, 'rb') as file:
+        first_line=file.readline()
+
+    if first_line.startswith(b'#OCEANLYZ project'):
+        from .ProjectReadFun import ProjectReadFun
+
+        properties=ProjectReadFun(ConfigPath, 'properties', [])
+        config={name: value for name, value in properties.items()
+                if ((name in ocn_properties) and (name not in gui_data_properties) and (value!=ocn_properties[name]))}
+
+        return config
+
+    #--------------------------------------------------------------------------
+    #Configuration file
+
+    gui_config=False
+
+    config={}
+    with open(ConfigPath, 'r') as file:
+        for line_number, line in enumerate(file, start=1):
+
+            #Configuration file saved by OCEANLYZ GUI
+            if line.startswith('# OCEANLYZ GUI'):
+                gui_config=True
+
+            line=line.split('#')[0].strip()
+            if line=='':
+                continue
+            if '=' not in line:
+                if gui_config==True:
+                    continue #Title line in OCEANLYZ GUI configuration file
+                raise ValueError('Line {} of configuration file is not in "name = value" format'.format(line_number))
+
+            name, value=line.split('=', 1)
+            name=name.strip()
+            value=value.strip().strip('\'"')
+
+            #Property name is in parentheses in OCEANLYZ GUI configuration file, e.g. 'Sampling frequency (fs) in Hz = 10'
+            if gui_config==True:
+                gui_names=re.findall(r'\((\w+)\)', name)
+                if len(gui_names)>0:
+                    name=gui_names[-1]
+                if name in gui_data_properties:
+                    continue
+
+            if ((name not in ocn_properties) or (name=='data') or (name=='wave')):
+                raise ValueError('Unknown OCEANLYZ property "{}" in line {} of configuration file'.format(name, line_number))
+
+            #Convert value to number if possible
+            try:
+                value=int(value)
+            except ValueError:
+                try:
+                    value=float(value)
+                except ValueError:
+                    pass
+
+            config[name]=value
+
+    return config
+
+#--------------------------------------------------------------------------
+#Load data file
+
+def loaddata(FilePath, delimiter=None, skip_header=0, n_worker=0, cache='off'):
+    #
+    #DESCRIPTION
+    #-----------
+    #
+    #Load data from CSV/TXT file and reshape it to a single column
+    #Columns of a multi-column file are placed one after another
+    #If cache is a folder, parsed data is saved in it (see DataReadFun), so a file that is processed again is not parsed again
+    #
+    #--------------------------------------------------------------------------
+
+    from .DataReadFun import DataReadFun
+
+    data=DataReadFun(FilePath, delimiter, skip_header, 1, n_worker, cache)
+
+    return data
+
+#--------------------------------------------------------------------------
+#Process one data file
+
+def processfile(FilePath, OutputPath, config, delimiter=None, skip_header=0, keep_burst_data=False, n_worker=0, cache='off'):
+    #
+    #DESCRIPTION
+    #-----------
+    #
+    #Run OCEANLYZ on one data file and save results as compressed NumPy file (.npz)
+    #
+    #OUTPUT
+    #------
+    #Python dictionary of file status for run summary
+    #
+    #--------------------------------------------------------------------------
+
+    import numpy as np
+    import io
+    import contextlib
+    import traceback
+
+    from .oceanlyz import oceanlyz
+
+    status={'file':FilePath, 'output':OutputPath, 'status':'failed', 'n_burst':0, 'module':0, 'elapsed':0.0, 'message':''}
+    status['file_size'], status['file_mtime']=filestamp(FilePath)
+
+    start_time=time.time()
+
+    try:
+
+        data=loaddata(FilePath, delimiter, skip_header, n_worker, cache)
+
+        ocn=oceanlyz()
+        for name, value in config.items():
+            setattr(ocn, name, value)
+        ocn.dispout='no'
+
+        #Calculate number of burst from number of data points
+        n_sample=int(ocn.fs*ocn.burst_duration)
+        if 'n_burst' not in config:
+            ocn.n_burst=int(data.size//n_sample)
+            if data.size%n_sample!=0:
+                status['message']='{} data points after the last complete burst are ignored'.format(data.size%n_sample)
+
+        if ((ocn.n_burst<1) or (data.size<ocn.n_burst*n_sample)):
+            raise ValueError('Number of data points ({}) is less than (n_burst * burst_duration * fs)'.format(data.size))
+
+        ocn.data=data
+
+        #Run OCEANLYZ
+        with contextlib.redirect_stdout(io.StringIO()):
+            ocn.runoceanlyz()
+
+        #Save results
+        wave={key: value for key, value in ocn.wave.items() if ((key!='Burst_Data') or (keep_burst_data==True))}
+        OutputPath_tmp=OutputPath+'.tmp.npz'
+        np.savez_compressed(OutputPath_tmp, **wave)
+        os.replace(OutputPath_tmp, OutputPath)
+
+        status['status']='ok'
+        status['n_burst']=int(ocn.n_burst)
+        status['module']=int(ocn.module)
+
+    except Exception as e:
+        status['message']=''.join(traceback.format_exception_only(type(e), e)).strip()
+
+    status['elapsed']=time.time()-start_time
+
+    return status
+
+#--------------------------------------------------------------------------
+#Process a data stream
+
+def runstream(source, config, max_bursts=0):
+    #
+    #DESCRIPTION
+    #-----------
+    #
+    #Run OCEANLYZ in real time on a data stream and print results of each burst as a JSON line
+    #
+    #OUTPUT
+    #------
+    #Exit code
+    #
+    #--------------------------------------------------------------------------
+
+    from .oceanlyz import oceanlyz
+    from .oceanlyzstream import oceanlyzstream
+
+    ocn=oceanlyz()
+    for name, value in config.items():
+        setattr(ocn, name, value)
+    ocn.dispout='no'
+
+    stream=oceanlyzstream(ocn)
+    stream.source='stdin' if source=='-' else source
+    stream.n_burst_max=max_bursts
+
+    try:
+        stream.runoceanlyzstream()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print('oceanlyz: error: {}'.format(e), file=sys.stderr)
+        return 1
+
+    print('{} burst(s) processed'.format(stream.n_burst_done), file=sys.stderr)
+
+    return 0
+
+#--------------------------------------------------------------------------
+#Helper functions
+
+def filestamp(FilePath):
+    #File size and modification time used to detect changed files
+    stat=os.stat(FilePath)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def confighash(config):
+    #Hash of configuration used to detect changed configuration
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def findfiles(inputs):
+    #Find data files from directories and glob patterns
+    FilePaths=[]
+    for item in inputs:
+        if os.path.isdir(item):
+            for extension in ['*.csv', '*.txt']:
+                FilePaths.extend(glob.glob(os.path.join(item, extension)))
+        else:
+            FilePaths.extend(glob.glob(item))
+
+    #Remove duplicates and keep order
+    FilePaths=[os.path.abspath(FilePath) for FilePath in FilePaths]
+    FilePaths=list(dict.fromkeys(sorted(FilePaths)))
+
+    return FilePaths
+
+
+def writesummary(SummaryPath, summary):
+    #Write run summary to JSON file
+    SummaryPath_tmp=SummaryPath+'.tmp'
+    with open(SummaryPath_tmp, 'w') as file:
+        json.dump(summary, file, indent=2)
+    os.replace(SummaryPath_tmp, SummaryPath)
+
+#--------------------------------------------------------------------------
+#Command line interface
+
+def main(argv=None):
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    oceanlyzcli
+    ===========
+
+    .. code:: bash
+
+        python -m oceanlyz INPUT [INPUT ...] -c CONFIG [-o OUTPUT_DIR] [-j JOBS] [--resume]
+        python -m oceanlyz --stream SOURCE -c CONFIG
+
+    DESCRIPTION
+    -----------
+
+    | Run OCEANLYZ on a batch of data files from command line
+    | Files are processed in parallel and results of each file are saved as a compressed NumPy file (.npz)
+    | A run summary is saved as 'oceanlyz_summary.json' in the output folder
+    | With --stream, data are read continuously and results of each burst are printed as a JSON line
+
+    INPUT
+    -----
+
+    INPUT
+                                    Data folder(s) or file pattern(s) such as 'data/*.csv'
+                                        For a folder, all CSV and TXT files in that folder are processed
+    -c CONFIG, --config CONFIG
+                                    Configuration file contains OCEANLYZ properties as 'name = value' in each line
+                                        Lines start with '#' are comments
+
+                                        If n_burst is not defined, it is calculated for each file as (number of data points)/(burst_duration*fs)
+
+                                        CONFIG can also be a configuration file (saved_file_name_config.txt) or a project file (.ocnz) saved by OCEANLYZ GUI,
+                                        then analysis of OCEANLYZ GUI is repeated for INPUT files (n_burst is calculated for each file)
+    -o OUTPUT_DIR, --output-dir OUTPUT_DIR
+                                    Folder to save results (default: oceanlyz_results)
+    -j JOBS, --jobs JOBS
+                                    Number of parallel processes (default: number of CPU cores)
+    --resume
+                                    Skip files that are already processed with the same configuration
+    --delimiter DELIMITER
+                                    Delimiter of data files (default: any whitespace)
+    --skip-header SKIP_HEADER
+                                    Number of header lines to skip (default: 0)
+    --keep-burst-data
+                                    Also save Burst_Data in results
+    --cache CACHE_DIR
+                                    Folder to save parsed data files, so files that are processed again are not parsed again (default: not saved)
+    --stream SOURCE
+                                    Calculate wave properties in real time from a data stream (see oceanlyzstream)
+                                        SOURCE='-' or 'stdin': standard input
+                                        SOURCE='socket:/path' or 'tcp:host:port': local socket
+                                        SOURCE='FILE.gz', 'FILE.bz2', 'FILE.xz', or 'FILE.zst': compressed file, read until end of file ('FILE.zst' needs zstandard package)
+                                        Otherwise SOURCE is a file that is being appended
+                                        INPUT is not used
+    --max-bursts MAX_BURSTS
+                                    Stop streaming after this number of bursts (default: 0, continue until source is closed)
+
+    OUTPUT
+    ------
+
+    Exit code
+                                    | 0: All files are processed successfully
+                                    | 1: One or more files failed
+                                    | 2: Error in command line arguments or configuration file
+
+    EXAMPLE
+    -------
+
+    .. code:: bash
+
+        #Content of config.txt
+        #InputType = pressure
+        #OutputType = wave+waterlevel
+        #burst_duration = 1024
+        #fs = 10
+        #heightfrombed = 0.05
+        #Rho = 1024
+
+        python -m oceanlyz Sample_Data/waterpressure_*.csv -c config.txt -o results -j 4
+
+        #Repeat analysis of OCEANLYZ GUI for new data files
+        python -m oceanlyz new_data/*.csv -c gui_results_config.txt -o results
+
+        #Real time analysis of data from a logger
+        logger_reader | python -m oceanlyz --stream - -c config.txt
+
+    .. LICENSE & DISCLAIMER
+    .. --------------------
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    import concurrent.futures
+
+    #--------------------------------------------------------------------------
+    #Read command line arguments
+
+    parser=argparse.ArgumentParser(prog='oceanlyz', description='Run OCEANLYZ on a batch of data files')
+    parser.add_argument('inputs', nargs='*', help='data folder(s) or file pattern(s)')
+    parser.add_argument('-c', '--config', required=True, help='configuration file with "name = value" lines')
+    parser.add_argument('-o', '--output-dir', default='oceanlyz_results', help='folder to save results')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='number of parallel processes')
+    parser.add_argument('--resume', action='store_true', help='skip files already processed with the same configuration')
+    parser.add_argument('--delimiter', default=None, help='delimiter of data files')
+    parser.add_argument('--skip-header', type=int, default=0, help='number of header lines to skip')
+    parser.add_argument('--keep-burst-data', action='store_true', help='also save Burst_Data in results')
+    parser.add_argument('--cache', default='off', metavar='CACHE_DIR', help='folder to save parsed data files in')
+    parser.add_argument('--stream', default=None, metavar='SOURCE', help='real time analysis of data from stdin (-), socket:/path, tcp:host:port, or a growing file')
+    parser.add_argument('--max-bursts', type=int, default=0, help='stop streaming after this number of bursts')
+
+    try:
+        args=parser.parse_args(argv)
+    except SystemExit as e:
+        return 0 if e.code==0 else 2
+
+    try:
+        config=readconfig(args.config)
+    except (OSError, ValueError) as e:
+        print('oceanlyz: error: {}'.format(e), file=sys.stderr)
+        return 2
+
+    #--------------------------------------------------------------------------
+    #Real time analysis of a data stream
+
+    if args.stream is not None:
+        return runstream(args.stream, config, args.max_bursts)
+
+    if len(args.inputs)==0:
+        print('oceanlyz: error: no INPUT is given', file=sys.stderr)
+        return 2
+
+    FilePaths=findfiles(args.inputs)
+    if len(FilePaths)==0:
+        print('oceanlyz: error: no data file found', file=sys.stderr)
+        return 2
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    SummaryPath=os.path.join(args.output_dir, 'oceanlyz_summary.json')
+
+    #--------------------------------------------------------------------------
+    #Set up run summary
+
+    config_hash=confighash(config)
+
+    previous_files={}
+    if ((args.resume==True) and (os.path.isfile(SummaryPath))):
+        with open(SummaryPath, 'r') as file:
+            previous_summary=json.load(file)
+        if previous_summary.get('config_hash')==config_hash:
+            previous_files={item['file']: item for item in previous_summary.get('files', [])}
+        else:
+            print('oceanlyz: configuration is changed, all files are processed again', file=sys.stderr)
+
+    summary={'config':config, 'config_hash':config_hash, 'started':time.strftime('%Y-%m-%d %H:%M:%S'), 'finished':'', 'n_files':len(FilePaths), 'n_ok':0, 'n_failed':0, 'n_skipped':0, 'files':[]}
+
+    #--------------------------------------------------------------------------
+    #Find files to be processed
+
+    jobs=[]
+    used_names={}
+    for FilePath in FilePaths:
+
+        #Output file name, files with the same name from different folders are numbered
+        FileRoot=os.path.splitext(os.path.basename(FilePath))[0]
+        used_names[FileRoot]=used_names.get(FileRoot, 0)+1
+        if used_names[FileRoot]>1:
+            FileRoot=FileRoot+'_'+str(used_names[FileRoot])
+        OutputPath=os.path.abspath(os.path.join(args.output_dir, FileRoot+'.npz'))
+
+        previous=previous_files.get(FilePath)
+        if ((previous is not None) and (previous['status'] in ['ok', 'skipped']) and (os.path.isfile(previous['output']))
+            and ([previous['file_size'], previous['file_mtime']]==list(filestamp(FilePath)))):
+            previous=dict(previous)
+            previous['status']='skipped'
+            summary['files'].append(previous)
+            summary['n_skipped']+=1
+        else:
+            jobs.append((FilePath, OutputPath))
+
+    print('{} file(s) found, {} file(s) to be processed, {} file(s) skipped'.format(len(FilePaths), len(jobs), summary['n_skipped']))
+    writesummary(SummaryPath, summary)
+
+    #--------------------------------------------------------------------------
+    #Process files in parallel
+
+    n_jobs=int(max(1, min(args.jobs, max(len(jobs), 1))))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_jobs) as executor:
+
+        #Each file is parsed in parallel chunks only if files are processed one at a time
+        n_worker=0 if n_jobs==1 else 1
+
+        futures=[executor.submit(processfile, FilePath, OutputPath, config, args.delimiter, args.skip_header, args.keep_burst_data, n_worker, args.cache) for FilePath, OutputPath in jobs]
+
+        for future in concurrent.futures.as_completed(futures):
+            status=future.result()
+            summary['files'].append(status)
+            if status['status']=='ok':
+                summary['n_ok']+=1
+            else:
+                summary['n_failed']+=1
+            print('{:8} {} ({:.1f} s) {}'.format(status['status'], status['file'], status['elapsed'], status['message']))
+
+            #Save summary after each file, so an interrupted run can be resumed
+            writesummary(SummaryPath, summary)
+
+    summary['finished']=time.strftime('%Y-%m-%d %H:%M:%S')
+    writesummary(SummaryPath, summary)
+
+    print('{} ok, {} failed, {} skipped, summary saved in {}'.format(summary['n_ok'], summary['n_failed'], summary['n_skipped'], SummaryPath))
+
+    return 0 if summary['n_failed']==0 else 1
+
+#--------------------------------------------------------------------------
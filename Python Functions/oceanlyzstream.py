@@ -0,0 +1,417 @@
+class oceanlyzstream:
+    """
+    .. ++++++++++++++++++++++++++++++++YA LATIF++++++++++++++++++++++++++++++++++
+    .. +                                                                        +
+    .. + Oceanlyz                                                               +
+    .. + Ocean Wave Analyzing Toolbox                                           +
+    .. + Ver 2.0                                                                +
+    .. +                                                                        +
+    .. + Developed by: Arash Karimpour                                          +
+    .. + Contact     : www.arashkarimpour.com                                   +
+    .. + Developed/Updated (yyyy-mm-dd): 2026-10-19                             +
+    .. +                                                                        +
+    .. ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    oceanlyz.oceanlyzstream (Python Version)
+    ========================================
+
+    .. code:: python
+
+        stream_object = oceanlyz.oceanlyzstream(oceanlyz_object)
+
+    DESCRIPTION
+    -----------
+
+    | Calculate wave properties in real time from data that arrive continuously
+    | Data are stored in a ring buffer and each burst is analyzed as soon as it is completed
+    | Analysis properties are taken from an OCEANLYZ object (n_burst is not used)
+
+    Properties
+    ----------
+
+    ocn=oceanlyz_object
+        OCEANLYZ object with analysis properties already set
+            | Each burst has (burst_duration*fs) data points
+            | Results of each burst are added to hdf5_file and wave_database of OCEANLYZ object if they are set, parquet_file is not available
+
+    source='stdin'
+        Source of data
+            | source='stdin': Read data from standard input
+            | source='C:\\data\\logger.csv': Read data from a file that is being appended (new lines are read as they are written)
+            | source='socket:/tmp/logger.sock': Read data from a local (Unix domain) socket, OCEANLYZ listens and accepts one connection
+            | source='tcp:127.0.0.1:5000': Read data from a local TCP socket, OCEANLYZ listens and accepts one connection
+            | source='C:\\data\\logger.csv.gz': Read data from a compressed file (.gz, .bz2, .xz, or .zst), file is decompressed while it is read and reading stops at end of file
+            | Compressed files are not decompressed to disk or memory, only the ring buffer of two bursts is kept (zstandard package is required for .zst, it is optional and installed by pip install zstandard)
+            | Data values are separated by comma, space, or new line
+
+    output=None
+        Function that is called with results of each burst as output(burst_number, wave)
+            | wave is a Python dictionary that contains results of one burst
+            | output=None: Scalar results of each burst are printed as a JSON line
+
+    poll_interval=0.5
+        Time to wait for new data when source is a file in (second)
+
+    n_burst_max=0
+        Stop after this number of bursts
+            | n_burst_max=0: Continue until source is closed
+
+    Methods
+    -------
+
+    stream_object.runoceanlyzstream()
+        Read data from source and calculate wave properties for each completed burst
+
+    Outputs
+    -------
+
+    stream_object.n_burst_done
+        Number of bursts that are analyzed
+
+    Examples
+    --------
+
+    .. code:: python
+
+        #Import libraries
+        import oceanlyz
+
+        #Create OCEANLYZ object
+        ocn=oceanlyz.oceanlyz()
+        ocn.InputType='pressure'
+        ocn.OutputType='wave+waterlevel'
+        ocn.burst_duration=1024
+        ocn.fs=10
+        ocn.heightfrombed=0.05
+
+        #Print Hm0 of each burst that is read from standard input
+        def print_Hm0(burst_number, wave):
+            print(burst_number, wave['Hm0'])
+
+        stream=oceanlyz.oceanlyzstream(ocn)
+        stream.output=print_Hm0
+        stream.runoceanlyzstream()
+
+    .. License & Disclaimer
+    .. --------------------
+    ..
+    .. Copyright (c) 2020 Arash Karimpour
+    ..
+    .. http://www.arashkarimpour.com
+    ..
+    .. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    .. IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    .. FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    .. AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    .. LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    .. OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    .. SOFTWARE.
+    """
+
+    #--------------------------------------------------------------------------
+    #properties
+
+    def __init__(self,ocn):
+
+        #OCEANLYZ object with analysis properties
+        self.ocn=ocn
+
+        #Source of data
+        self.source='stdin'
+        #                                 source='stdin': Read data from standard input
+        #                                 source='C:\\data\\logger.csv': Read data from a file that is being appended
+        #                                 source='socket:/tmp/logger.sock': Read data from a local (Unix domain) socket
+        #                                 source='tcp:127.0.0.1:5000': Read data from a local TCP socket
+        #                                 source='C:\\data\\logger.csv.gz': Read data from a compressed file (.gz, .bz2, .xz, or .zst) until end of file
+
+        #Function called with results of each burst as output(burst_number, wave)
+        self.output=None
+
+        #Time to wait for new data when source is a file in (second)
+        self.poll_interval=0.5
+
+        #Stop after this number of bursts (0: continue until source is closed)
+        self.n_burst_max=0
+
+        #Number of bursts that are analyzed
+        self.n_burst_done=0
+
+    #--------------------------------------------------------------------------
+    #methods
+
+    #==========================================================================
+    def oceanlyzstreamread(self):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Read text from source in blocks
+        #
+        #OUTPUT
+        #------
+        #Generator that yields blocks of text, each block ends at a separator (new line, comma, space, or tab)
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import sys
+        import time
+        import socket
+        import os
+
+        block_size=65536
+
+        if self.source=='stdin':
+
+            #Read blocks that are available on standard input
+            remainder=''
+            while True:
+                block=sys.stdin.buffer.read1(block_size)
+                if not block:
+                    break
+                text=remainder+block.decode('utf-8')
+                end=max(text.rfind(separator) for separator in '\n, \t')+1
+                remainder=text[end:]
+                if end>0:
+                    yield text[:end]
+            if remainder!='':
+                yield remainder
+
+        elif ((self.source.startswith('socket:')) or (self.source.startswith('tcp:'))):
+
+            #Listen on a local socket and accept one connection
+            if self.source.startswith('socket:'):
+                SocketPath=self.source[len('socket:'):]
+                if os.path.exists(SocketPath):
+                    os.remove(SocketPath)
+                server=socket.socket(socket.AF_UNIX,socket.SOCK_STREAM)
+                server.bind(SocketPath)
+            else:
+                host,port=self.source[len('tcp:'):].rsplit(':',1)
+                server=socket.socket(socket.AF_INET,socket.SOCK_STREAM)
+                server.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)
+                server.bind((host,int(port)))
+
+            server.listen(1)
+            try:
+                connection,_=server.accept()
+                with connection:
+                    remainder=''
+                    while True:
+                        block=connection.recv(block_size)
+                        if not block:
+                            break
+                        text=remainder+block.decode('utf-8')
+                        end=max(text.rfind(separator) for separator in '\n, \t')+1
+                        remainder=text[end:]
+                        if end>0:
+                            yield text[:end]
+                    if remainder!='':
+                        yield remainder
+            finally:
+                server.close()
+
+        elif self.source.endswith(('.gz','.bz2','.xz','.zst')):
+
+            #Decompress a compressed file while it is read, reading stops at end of file
+            if self.source.endswith('.gz'):
+                import gzip
+                file=gzip.open(self.source,'rb')
+            elif self.source.endswith('.bz2'):
+                import bz2
+                file=bz2.open(self.source,'rb')
+            elif self.source.endswith('.xz'):
+                import lzma
+                file=lzma.open(self.source,'rb')
+            else:
+                try:
+                    import zstandard
+                except ImportError:
+                    raise ImportError('zstandard package is required to read .zst files, install it by "pip install zstandard" or use .gz, .bz2, or .xz files.') from None
+                file=zstandard.ZstdDecompressor().stream_reader(open(self.source,'rb'),read_across_frames=True,closefd=True)
+
+            with file:
+                remainder=''
+                while True:
+                    block=file.read(block_size)
+                    if not block:
+                        break
+                    text=remainder+block.decode('utf-8')
+                    end=max(text.rfind(separator) for separator in '\n, \t')+1
+                    remainder=text[end:]
+                    if end>0:
+                        yield text[:end]
+                if remainder!='':
+                    yield remainder
+
+        else:
+
+            #Follow a file that is being appended
+            with open(self.source,'r') as file:
+                remainder=''
+                while True:
+                    block=file.read(block_size)
+                    if block=='':
+                        time.sleep(self.poll_interval)
+                        continue
+                    text=remainder+block
+                    end=max(text.rfind(separator) for separator in '\n, \t')+1
+                    remainder=text[end:]
+                    if end>0:
+                        yield text[:end]
+
+
+    #==========================================================================
+    def oceanlyzstreamburst(self,burst_data,burst_number):
+        #
+        #DESCRIPTION
+        #-----------
+        #
+        #Calculate wave properties of one burst with the OCEANLYZ object
+        #
+        #OUTPUT
+        #------
+        #Wave properties of one burst as a Python dictionary
+        #
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import io
+        import contextlib
+        import warnings
+
+        self.ocn.data=burst_data
+        self.ocn.n_burst=1
+
+        with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            wave=self.ocn.oceanlyzecalcwave()
+
+        #Add results of this burst to HDF5 file
+        if self.ocn.hdf5_file!='':
+            from .HDF5WriteFun import HDF5WriteFun
+            HDF5WriteFun(self.ocn.hdf5_file,wave,0,'off')
+
+        #Add wave-by-wave results of this burst to database, time is from start of stream
+        if ((self.ocn.wave_database!='') and ('Wave_Offset' in wave)):
+            from .WaveDatabaseFun import WaveDatabaseFun
+            WaveDatabaseFun(self.ocn.wave_database,wave,[(burst_number-1)*self.ocn.burst_duration],'off')
+
+        #Results of a single burst
+        wave_burst={}
+        for key, value in wave.items():
+            if ((key=='Field_Names') or (key=='f') or (key=='Band_Width') or (key in ['H','T','Crest','Trough','Wave_Time','Wave_Offset'])):
+                wave_burst[key]=value
+            elif value.ndim==1:
+                wave_burst[key]=float(value[0])
+            else:
+                wave_burst[key]=value[0,:]
+
+        return wave_burst
+
+
+    #==========================================================================
+    def oceanlyzstreamoutput(self,burst_number,wave):
+        #Print scalar results of a burst as a JSON line
+        import json
+        import sys
+
+        results={'burst':burst_number}
+        for key, value in wave.items():
+            if type(value) is float:
+                results[key]=value
+        print(json.dumps(results))
+        sys.stdout.flush()
+
+
+    #==========================================================================
+    def runoceanlyzstream(self):
+        #--------------------------------------------------------------------------
+        #Import required packages
+
+        import numpy as np
+        import io
+        import time
+        import contextlib
+        import concurrent.futures
+
+        #--------------------------------------------------------------------------
+        #Check outputs
+
+        #Parquet table is written for a whole run, a row group for each burst would rewrite the table after each burst
+        if self.ocn.parquet_file!='':
+            raise ValueError('parquet_file is not available for streaming, use hdf5_file or output instead.')
+
+        #--------------------------------------------------------------------------
+        #Set up calculation module
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.ocn.module=self.ocn.oceanlyzmodule()
+
+        output=self.output
+        if output is None:
+            output=self.oceanlyzstreamoutput
+
+        #--------------------------------------------------------------------------
+        #Preallocate ring buffer
+        #The ring buffer has two halves, each one is a burst
+        #While a completed burst in one half is analyzed, new data are written into the other half
+
+        n_sample=int(self.ocn.fs*self.ocn.burst_duration) #Number of sample in 1 burst
+        ring_buffer=np.zeros(2*n_sample)
+        write_index=0 #Location in the ring buffer that next sample is written to
+        pending=[None,None] #Analysis running on each half of the ring buffer
+
+        self.n_burst_done=0
+        burst_number=0
+
+        #--------------------------------------------------------------------------
+        #Read data and analyze completed bursts
+
+        def analyze(burst_number,burst_data,burst_closed_time):
+            wave=self.oceanlyzstreamburst(burst_data,burst_number)
+            wave['latency']=time.time()-burst_closed_time
+            output(burst_number,wave)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+
+            for text in self.oceanlyzstreamread():
+
+                values=np.array(text.replace(',',' ').split(),dtype=np.float64)
+
+                start=0
+                while start<len(values):
+
+                    half=write_index//n_sample
+
+                    #Wait if analysis of this half of the ring buffer is not finished yet
+                    if ((write_index%n_sample==0) and (pending[half] is not None)):
+                        pending[half].result()
+                        pending[half]=None
+
+                    #Copy data into current half of the ring buffer
+                    n_copy=min(len(values)-start,(half+1)*n_sample-write_index)
+                    ring_buffer[write_index:write_index+n_copy]=values[start:start+n_copy]
+                    write_index+=n_copy
+                    start+=n_copy
+
+                    #Analyze a completed burst
+                    if write_index%n_sample==0:
+                        burst_number+=1
+                        pending[half]=executor.submit(analyze,burst_number,ring_buffer[half*n_sample:(half+1)*n_sample],time.time())
+                        write_index=write_index%(2*n_sample)
+
+                        if ((self.n_burst_max>0) and (burst_number>=self.n_burst_max)):
+                            break
+
+                if ((self.n_burst_max>0) and (burst_number>=self.n_burst_max)):
+                    break
+
+            #Wait for remaining analysis
+            for future in pending:
+                if future is not None:
+                    future.result()
+
+        self.n_burst_done=burst_number
+
+        #--------------------------------------------------------------------------